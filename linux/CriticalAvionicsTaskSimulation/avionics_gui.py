@@ -1,61 +1,96 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog, simpledialog
 import os
+import sys
 import time
-from collections import defaultdict
+import argparse
+from functools import partial
 
-PROC_FILE_PATH = "/proc/avionics_status"
-SYS_PARAM_BASE_PATH = "/sys/module/avionics_sim/parameters"
+from exec_stats import compute_statistics, histogram_labels, index_statistics
+from execlog import ExecLogRecorder
+from export import COLUMNAR_SUFFIX, ExportJob, aggregate_path_for
+from gantt import GanttChart
+from history import MetricHistory, Sparkline
+from ingest import ExecLogLoader
+from params import apply_params, current_params
+from perf import PerfRecorder
+from scheduler_model import simulate
+from schedulability import analyze, task_specs
+from sweep import SweepHeatMap, SweepRunner, parse_scales
+from task_registry import TaskRegistry
+from telemetry import DEFAULT_TASK_SET, TELEMETRY_SOURCES, TelemetryError, create_source
+from telemetry_worker import AdaptivePoller, TelemetryWorker, reload_kernel_module
+from metrics_exporter import MetricsExporter
+from text_monitor import TextMonitor
 
-# Task parameter mappings
-TASK_PARAMS = {
-    "Flight Attitude Monitor": {
-        "period": f"{SYS_PARAM_BASE_PATH}/attitude_period_ms",
-        "deadline": f"{SYS_PARAM_BASE_PATH}/attitude_deadline_ms",
-        "workload": f"{SYS_PARAM_BASE_PATH}/attitude_workload_ms"
-    },
-    "Engine Control": {
-        "period": f"{SYS_PARAM_BASE_PATH}/engine_period_ms",
-        "deadline": f"{SYS_PARAM_BASE_PATH}/engine_deadline_ms",
-        "workload": f"{SYS_PARAM_BASE_PATH}/engine_workload_ms"
-    },
-    "Navigation System": {
-        "period": f"{SYS_PARAM_BASE_PATH}/nav_period_ms",
-        "deadline": f"{SYS_PARAM_BASE_PATH}/nav_deadline_ms",
-        "workload": f"{SYS_PARAM_BASE_PATH}/nav_workload_ms"
-    },
-    "Communication System": {
-        "period": f"{SYS_PARAM_BASE_PATH}/comm_period_ms",
-        "deadline": f"{SYS_PARAM_BASE_PATH}/comm_deadline_ms",
-        "workload": f"{SYS_PARAM_BASE_PATH}/comm_workload_ms"
-    },
-    "Cabin Systems": {
-        "period": f"{SYS_PARAM_BASE_PATH}/cabin_period_ms",
-        "deadline": f"{SYS_PARAM_BASE_PATH}/cabin_deadline_ms",
-        "workload": f"{SYS_PARAM_BASE_PATH}/cabin_workload_ms"
-    }
-}
+# Open Gantt charts re-render at most this often (ms)
+GANTT_REFRESH_MS = 100
 
-# Priority colors for visual distinction
-PRIORITY_COLORS = {
-    0: "#FF0000",  # Red - Highest priority (Critical)
-    1: "#FF8C00",  # Orange - High priority
-    2: "#FFD700",  # Gold - Medium priority
-    3: "#32CD32",  # Lime - Lower priority
-    4: "#87CEEB"   # Sky Blue - Lowest priority
-}
+# While a recording loads, the UI indexes parsed chunks every INGEST_POLL_MS,
+# redraws the chart every INGEST_RENDER_MS and recomputes the statistics
+# every INGEST_STATS_MS (both less often once they get slow).  The chart
+# starts on an INGEST_VIEW_MS window that follows the load, so drawing
+# does not slow down as the file is read; zoom out to see everything.
+INGEST_POLL_MS = 20
+INGEST_RENDER_MS = 200
+INGEST_STATS_MS = 1000
+INGEST_VIEW_MS = 60000
+
+# The telemetry worker polls adaptively between POLL_MIN_SEC (log scrolling
+# fast) and POLL_IDLE_SEC (scheduler stopped or window minimized).  The UI
+# drains its results every UI_DRAIN_MS (UI_IDLE_DRAIN_MS while idle) and
+# handles at most UI_DRAIN_LIMIT messages per tick.
+POLL_INTERVAL_SEC = 1.0
+POLL_MIN_SEC = 0.1
+POLL_IDLE_SEC = 5.0
+UI_DRAIN_MS = 50
+UI_IDLE_DRAIN_MS = 250
+UI_DRAIN_LIMIT = 20
+
+# Open sweep windows pick up finished combinations this often (ms)
+SWEEP_POLL_MS = 100
+
+# How often a running export is checked for completion
+EXPORT_POLL_MS = 100
+
+# Open performance panels redraw their table this often (ms)
+PERF_PANEL_MS = 500
+
+# The task grid keeps one pooled row per visible line; this is the row
+# height assumed until a real row has been measured (pixels)
+TASK_ROW_HEIGHT = 40
+
+# Size of the per-task trend sparklines (pixels)
+SPARKLINE_WIDTH = 130
+SPARKLINE_HEIGHT = 30
+
+# Share of the task set (by priority) counted as high priority in the report
+HIGH_PRIORITY_SHARE = 0.4
+
+# Miss navigation filter entry for every task
+ALL_TASKS = "All tasks"
 
 class TaskWidget:
     """Widget for displaying and controlling individual tasks"""
     
-    def __init__(self, parent, task_name, priority, row_start):
+    def __init__(self, parent, task, row_start, worker, preflight=None):
         self.parent = parent
-        self.task_name = task_name
-        self.priority = priority
+        self.worker = worker
+        self.source = worker.source
+        # Called with the pending updates; returning False cancels them
+        self.preflight = preflight
+        self.task = task
+        self.task_name = task.name
+        self.priority = task.priority
+        self.priority_color = task.priority_color
         self.row_start = row_start
         
         # Task data variables
         self.task_data = {}
+        # Last options pushed to each label and last values shown in the entries
+        self._rendered = {}
+        self._shown_params = {}
+        self._utilization_text = None
         self.control_vars = {
             'period': tk.StringVar(),
             'deadline': tk.StringVar(), 
@@ -65,12 +100,9 @@ class TaskWidget:
         self.create_widgets()
         
     def create_widgets(self):
-        # Priority indicator and task name
-        priority_color = PRIORITY_COLORS.get(self.priority, "#CCCCCC")
-        
         # Priority badge
         self.priority_label = tk.Label(self.parent, text=f"P{self.priority}", 
-                                      bg=priority_color, fg="white", 
+                                      bg=self.priority_color, fg="white", 
                                       font=("Arial", 10, "bold"),
                                       width=3, relief="raised")
         self.priority_label.grid(row=self.row_start, column=0, padx=5, pady=2, sticky="nsew")
@@ -136,50 +168,113 @@ class TaskWidget:
                                       width=6, font=("Arial", 8))
         self.workload_entry.grid(row=0, column=5, padx=1)
         
+        self.entries = {
+            'period': self.period_entry,
+            'deadline': self.deadline_entry,
+            'workload': self.workload_entry
+        }
+        
         # Update button
         self.update_button = tk.Button(self.control_frame, text="Set", 
                                       command=self.update_task_params,
                                       font=("Arial", 8))
         self.update_button.grid(row=0, column=6, padx=2)
         
+        # Trend sparklines: execution time (blue) and miss rate (red, 0-100%)
+        self.trend_canvas = tk.Canvas(self.parent, width=SPARKLINE_WIDTH, height=SPARKLINE_HEIGHT,
+                                      bg="white", highlightthickness=1, highlightbackground="#D3D3D3")
+        self.trend_canvas.grid(row=self.row_start, column=5, padx=5, pady=2)
+        self.exec_sparkline = Sparkline(self.trend_canvas, SPARKLINE_WIDTH, SPARKLINE_HEIGHT, "#3498DB")
+        self.miss_sparkline = Sparkline(self.trend_canvas, SPARKLINE_WIDTH, SPARKLINE_HEIGHT, "red")
+        self.utilization_item = self.trend_canvas.create_text(3, 2, anchor="nw", text="",
+                                                              font=("Arial", 7), fill="gray")
+        
+        self.row_widgets = (self.priority_label, self.name_label, self.status_frame,
+                            self.stats_frame, self.control_frame, self.trend_canvas)
+        
+    def bind_task(self, task):
+        """Point this row at another task (rows are recycled while scrolling)"""
+        if task == self.task:
+            return
+        self.task = task
+        self.task_name = task.name
+        self.priority = task.priority
+        self.priority_color = task.priority_color
+        self.priority_label.config(text=f"P{task.priority}", bg=task.priority_color)
+        self.name_label.config(text=task.name)
+        # Forget everything shown for the previous task, including unsaved edits
+        self.task_data = {}
+        self._shown_params = {}
+        for var in self.control_vars.values():
+            var.set('')
+        self.exec_sparkline.clear()
+        self.miss_sparkline.clear()
+        self.trend_canvas.itemconfig(self.utilization_item, text="")
+        self._utilization_text = None
+        
+    def show(self):
+        for widget in self.row_widgets:
+            widget.grid()
+            
+    def hide(self):
+        for widget in self.row_widgets:
+            widget.grid_remove()
+            
+    def height(self):
+        """Requested height of the row in pixels, padding included"""
+        return max(widget.winfo_reqheight() for widget in self.row_widgets) + 4
+        
+    def _render(self, key, widget, **options):
+        """Push only the options that differ from what was last rendered"""
+        rendered = self._rendered.setdefault(key, {})
+        changed = {name: value for name, value in options.items() if rendered.get(name) != value}
+        if changed:
+            widget.config(**changed)
+            rendered.update(changed)
+            
+    def _is_editing(self, param):
+        """True while the operator has focus in, or unsaved edits to, an entry"""
+        if self.control_vars[param].get() != self._shown_params.get(param, ''):
+            return True
+        try:
+            return self.parent.focus_get() is self.entries[param]
+        except (KeyError, tk.TclError):
+            return False
+            
     def update_display(self, task_data):
-        """Update the display with new task data"""
+        """Update the display with new task data; unchanged fields never reach Tk"""
+        if task_data == self.task_data:
+            return
         self.task_data = task_data
         
         # Update status
         status = task_data.get('Status', 'UNKNOWN')
-        self.status_label.config(text=status)
-        
-        if status == "EXECUTING":
-            self.status_label.config(bg="yellow", fg="black")
-        elif status == "READY":
-            self.status_label.config(bg="lightgreen", fg="black")
-        elif status == "DISABLED":
-            self.status_label.config(bg="lightgray", fg="black")
-        else:
-            self.status_label.config(bg="white", fg="black")
+        status_bg = {"EXECUTING": "yellow", "READY": "lightgreen",
+                     "DISABLED": "lightgray"}.get(status, "white")
+        self._render('status', self.status_label, text=status, bg=status_bg, fg="black")
         
         # Update deadline result
         deadline_result = task_data.get('LastDeadlineResult', 'N/A')
-        self.deadline_label.config(text=deadline_result)
-        
         if deadline_result == "MISSED":
-            self.deadline_label.config(fg="red", font=("Arial", 10, "bold"))
+            self._render('deadline', self.deadline_label, text=deadline_result,
+                         fg="red", font=("Arial", 10, "bold"))
         elif deadline_result == "MET":
-            self.deadline_label.config(fg="green", font=("Arial", 10))
+            self._render('deadline', self.deadline_label, text=deadline_result,
+                         fg="green", font=("Arial", 10))
         else:
-            self.deadline_label.config(fg="black", font=("Arial", 10))
+            self._render('deadline', self.deadline_label, text=deadline_result,
+                         fg="black", font=("Arial", 10))
         
         # Update execution time
         exec_time = task_data.get('LastExecTime', '0')
         deadline = task_data.get('Deadline', '0')
-        self.exec_time_label.config(text=f"{exec_time}ms")
+        self._render('exec_time', self.exec_time_label, text=f"{exec_time}ms")
         
         try:
             if int(exec_time) > int(deadline):
-                self.exec_time_label.config(fg="red", font=("Arial", 10, "bold"))
+                self._render('exec_time', self.exec_time_label, fg="red", font=("Arial", 10, "bold"))
             else:
-                self.exec_time_label.config(fg="black", font=("Arial", 10))
+                self._render('exec_time', self.exec_time_label, fg="black", font=("Arial", 10))
         except ValueError:
             pass
         
@@ -188,78 +283,204 @@ class TaskWidget:
         missed_count = task_data.get('MissedCount', '0') 
         total_count = task_data.get('TotalExecs', '0')
         
-        self.met_label.config(text=f"Met: {met_count}")
-        self.missed_label.config(text=f"Missed: {missed_count}")
-        self.total_label.config(text=f"Total: {total_count}")
-        
-        # Update control fields with current values
-        self.control_vars['period'].set(task_data.get('Period', ''))
-        self.control_vars['deadline'].set(task_data.get('Deadline', ''))
-        self.control_vars['workload'].set(task_data.get('Workload', ''))
+        self._render('met', self.met_label, text=f"Met: {met_count}")
+        self._render('missed', self.missed_label, text=f"Missed: {missed_count}")
+        self._render('total', self.total_label, text=f"Total: {total_count}")
+        
+        # Update control fields with current values, unless being edited
+        for param, field in (('period', 'Period'), ('deadline', 'Deadline'), ('workload', 'Workload')):
+            value = task_data.get(field, '')
+            var = self.control_vars[param]
+            if var.get() == value:
+                self._shown_params[param] = value
+            elif not self._is_editing(param):
+                var.set(value)
+                self._shown_params[param] = value
+        
+    def update_trend(self, history):
+        """Advance the sparklines from the task's metric history"""
+        if history is None:
+            return
+        self.exec_sparkline.update(history.exec_time)
+        self.miss_sparkline.update(history.miss_rate, maximum=1.0)
+        text = f"U {history.utilization.last() * 100:.0f}%"
+        if text != self._utilization_text:
+            self.trend_canvas.itemconfig(self.utilization_item, text=text)
+            self._utilization_text = text
         
     def update_task_params(self):
-        """Update task parameters via sysfs"""
-        if self.task_name not in TASK_PARAMS:
-            messagebox.showerror("Error", f"Unknown task: {self.task_name}")
+        """Validate and apply the edited parameters as one batch (see params.apply_params)"""
+        if not self.source.writable:
+            messagebox.showerror("Error", f"{self.source.describe()} is read-only")
             return
             
-        success_count = 0
-        errors = []
-        
-        params = TASK_PARAMS[self.task_name]
-        
-        # Update period
-        period_value = self.control_vars['period'].get().strip()
-        if period_value and period_value.isdigit():
-            if self._write_param(params['period'], period_value, "Period"):
-                success_count += 1
-            else:
-                errors.append("Period")
-        
-        # Update deadline
-        deadline_value = self.control_vars['deadline'].get().strip()
-        if deadline_value and deadline_value.isdigit():
-            if self._write_param(params['deadline'], deadline_value, "Deadline"):
-                success_count += 1
-            else:
-                errors.append("Deadline")
-        
-        # Update workload
-        workload_value = self.control_vars['workload'].get().strip()
-        if workload_value and workload_value.isdigit():
-            if self._write_param(params['workload'], workload_value, "Workload"):
-                success_count += 1
-            else:
-                errors.append("Workload")
-        
-        # Show result
-        if success_count > 0 and not errors:
-            messagebox.showinfo("Success", f"{self.task_name}: Updated {success_count} parameter(s)")
-        elif errors:
-            messagebox.showwarning("Partial Success", 
-                                  f"{self.task_name}: Failed to update: {', '.join(errors)}")
+        # Collect the edited values here; the batch is validated and written on the worker thread
+        updates = [(self.task_name, param, var.get().strip())
+                   for param, var in self.control_vars.items() if var.get().strip()]
+        if not updates:
+            return
+        if self.preflight and not self.preflight(updates):
+            return
+        current = {self.task_name: {param: int(self.task_data[param.capitalize()])
+                                    for param in self.control_vars
+                                    if str(self.task_data.get(param.capitalize(), '')).isdigit()}}
+        # The row may be showing another task by the time the batch finishes
+        self.worker.submit(apply_params, self.source, updates, current,
+                           callback=partial(self._report_update, self.task_name))
     
-    def _write_param(self, path, value, param_name):
-        """Write a parameter to sysfs"""
-        try:
-            with open(path, 'w') as f:
-                f.write(value)
-            return True
-        except (FileNotFoundError, PermissionError, Exception) as e:
-            return False
+    @staticmethod
+    def _report_update(task_name, result, error):
+        """Show the outcome of the parameter batch (UI thread)"""
+        if error:
+            messagebox.showerror("Error", f"{task_name}: {error}")
+        elif result.ok:
+            messagebox.showinfo("Success", f"{task_name}: {result.summary()}")
+        else:
+            messagebox.showwarning("Update Failed",
+                                   f"{task_name}: {result.summary()}\n\n{result.details()}")
+
+
+class TaskGrid:
+    """Virtualized task list: a small pool of TaskWidget rows bound to the tasks in view
+
+    Only as many rows as fit in the frame are ever created.  Scrolling
+    rebinds the pooled rows to other tasks instead of moving widgets, so
+    startup cost and widget memory do not depend on the number of tasks.
+    """
+    
+    def __init__(self, parent, worker, registry, history, preflight=None):
+        self.worker = worker
+        self.registry = registry
+        self.history = history
+        self.preflight = preflight
+        self.frame = tk.Frame(parent)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.on_scrollbar)
+        self.frame.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.rows = []
+        self.tasks = ()
+        self.first = 0
+        self.row_height = TASK_ROW_HEIGHT
+        self.visible_rows = 1
+        self.frame.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.frame)
+        
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.on_wheel)
+        widget.bind("<Button-4>", self.on_wheel)
+        widget.bind("<Button-5>", self.on_wheel)
+        for child in widget.winfo_children():
+            self.bind_wheel(child)
+            
+    def set_tasks(self, tasks):
+        """Show a new list of task mappings (snapshot.tasks)"""
+        self.tasks = tasks
+        self.refresh()
+        
+    def refresh(self):
+        """Bind the pooled rows to the tasks in view and update them"""
+        if not self.rows and self.tasks:
+            self._add_row()
+        self.first = max(0, min(self.first, len(self.tasks) - self.visible_rows))
+        in_view = min(self.visible_rows, len(self.tasks) - self.first)
+        while len(self.rows) < in_view:
+            self._add_row()
+        
+        for i, row in enumerate(self.rows):
+            if i >= in_view:
+                row.hide()
+                continue
+            task_info = self.tasks[self.first + i]
+            number = int(task_info['TaskNumber'])
+            row.bind_task(self.registry.get(number))
+            row.show()
+            row.update_display(task_info)
+            row.update_trend(self.history.task(number))
+        
+        if self.tasks:
+            self.scrollbar.set(self.first / len(self.tasks),
+                               (self.first + in_view) / len(self.tasks))
+        else:
+            self.scrollbar.set(0, 1)
+            
+    def _add_row(self):
+        # Any task will do; refresh() binds the row to the right one
+        task = self.registry.get(int(self.tasks[0]['TaskNumber']))
+        row = TaskWidget(self.frame, task, len(self.rows) + 1, self.worker,
+                         preflight=self.preflight)  # +1 for header row
+        for widget in row.row_widgets:
+            self.bind_wheel(widget)
+        if not self.rows:
+            # Measure a real row so the pool matches what fits
+            self.frame.update_idletasks()
+            self.row_height = row.height() or TASK_ROW_HEIGHT
+            height = self.frame.winfo_height()
+            if height > 1:
+                self._fit_rows(height)
+        self.rows.append(row)
+        
+    def _fit_rows(self, height):
+        # Row 0 holds the headers, which are about one row high
+        self.visible_rows = max(1, height // self.row_height - 1)
+        
+    def on_resize(self, event):
+        visible_rows = self.visible_rows
+        self._fit_rows(event.height)
+        if self.visible_rows != visible_rows:
+            self.refresh()
+            
+    def scroll_to(self, first):
+        first = max(0, min(int(first), len(self.tasks) - self.visible_rows))
+        if first != self.first:
+            self.first = first
+            self.refresh()
+            
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * len(self.tasks))
+        elif unit == "pages":
+            self.scroll_to(self.first + int(amount) * self.visible_rows)
+        else:
+            self.scroll_to(self.first + int(amount))
+            
+    def on_wheel(self, event):
+        if getattr(event, 'num', 0) == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.first - 3)
+        else:
+            self.scroll_to(self.first + 3)
 
 class MultiTaskAvionicsGUI:
-    def __init__(self, master):
+    def __init__(self, master, source=None, record_path=None, record_rate=10.0, perf=None):
         self.master = master
+        self.source = source or create_source("proc")
+        # Per-stage timers; disabled unless --perf or the Performance panel turns them on
+        self.perf = perf or PerfRecorder()
+        self.recorder = None
+        self.record_rate = record_rate
         master.title("Multi-Task Avionics Simulator with Priority Scheduling")
         master.geometry("1200x700")
         
         # Data storage
         self.system_data = {}
-        self.task_widgets = {}
+        self.snapshot = None
+        self.history = MetricHistory()
+        # Task set as reported by the source; every view looks tasks up here
+        self.registry = TaskRegistry()
+        
+        # All telemetry I/O happens on the worker; the UI only drains its results
+        self.poller = AdaptivePoller(POLL_INTERVAL_SEC, POLL_MIN_SEC, POLL_IDLE_SEC)
+        self.worker = TelemetryWorker(self.source, self.poller, self.perf)
         
         self.create_widgets()
-        self.update_data()  # Initial data load
+        if record_path:
+            self.start_recording(record_path)
+        
+        self.worker.start()
+        master.protocol("WM_DELETE_WINDOW", self.close)
+        master.bind("<Unmap>", self.on_visibility_change)
+        master.bind("<Map>", self.on_visibility_change)
+        self.drain_worker()
         
     def create_widgets(self):
         # Main title
@@ -314,25 +535,13 @@ class MultiTaskAvionicsGUI:
         tasks_padding_frame = tk.Frame(self.tasks_main_frame)
         tasks_padding_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Canvas and scrollbar for tasks
-        self.canvas = tk.Canvas(tasks_padding_frame)
-        self.scrollbar = ttk.Scrollbar(tasks_padding_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        # Virtualized task rows with their own scrollbar
+        self.task_grid = TaskGrid(tasks_padding_frame, self.worker, self.registry, self.history,
+                                  preflight=self.preflight_params)
         
         # Headers
         self.create_headers()
         
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.scrollbar.pack(side="right", fill="y")
-        
         # Control buttons frame
         self.control_buttons_frame = tk.Frame(self.master)
         self.control_buttons_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -369,6 +578,37 @@ class MultiTaskAvionicsGUI:
                                      bg="lightyellow")
         self.gantt_button.pack(side=tk.LEFT, padx=5)
         
+        # Execution log recording
+        self.record_button = tk.Button(self.control_buttons_frame, text="Start Recording",
+                                      command=self.toggle_recording,
+                                      font=("Arial", 10, "bold"),
+                                      bg="plum")
+        self.record_button.pack(side=tk.LEFT, padx=5)
+        
+        self.load_recording_button = tk.Button(self.control_buttons_frame, text="Load Recording",
+                                              command=self.load_recording,
+                                              font=("Arial", 10, "bold"),
+                                              bg="lightyellow")
+        self.load_recording_button.pack(side=tk.LEFT, padx=5)
+        
+        self.offline_sim_button = tk.Button(self.control_buttons_frame, text="Simulate Offline",
+                                           command=self.simulate_offline,
+                                           font=("Arial", 10, "bold"),
+                                           bg="lightgreen")
+        self.offline_sim_button.pack(side=tk.LEFT, padx=5)
+        
+        self.sweep_button = tk.Button(self.control_buttons_frame, text="Parameter Sweep",
+                                     command=self.open_sweep_window,
+                                     font=("Arial", 10, "bold"),
+                                     bg="lightyellow")
+        self.sweep_button.pack(side=tk.LEFT, padx=5)
+        
+        self.perf_button = tk.Button(self.control_buttons_frame, text="Performance",
+                                    command=self.open_performance_window,
+                                    font=("Arial", 10, "bold"),
+                                    bg="lightgray")
+        self.perf_button.pack(side=tk.LEFT, padx=5)
+        
         # Simulation status
         self.simulation_status_var = tk.StringVar(value="")
         self.simulation_status_label = tk.Label(self.control_buttons_frame,
@@ -379,8 +619,8 @@ class MultiTaskAvionicsGUI:
         
     def create_headers(self):
         """Create column headers for task display"""
-        headers_frame = tk.Frame(self.scrollable_frame, bg="#D3D3D3", relief="raised", bd=1)
-        headers_frame.grid(row=0, column=0, columnspan=5, sticky="ew", padx=2, pady=2)
+        headers_frame = tk.Frame(self.task_grid.frame, bg="#D3D3D3", relief="raised", bd=1)
+        headers_frame.grid(row=0, column=0, columnspan=6, sticky="ew", padx=2, pady=2)
         
         tk.Label(headers_frame, text="Pri", font=("Arial", 10, "bold"), 
                 bg="#D3D3D3", width=3).grid(row=0, column=0, padx=5, pady=5)
@@ -392,76 +632,56 @@ class MultiTaskAvionicsGUI:
                 bg="#D3D3D3", width=20).grid(row=0, column=3, padx=5, pady=5)
         tk.Label(headers_frame, text="Controls (P/D/W ms)", font=("Arial", 10, "bold"),
                 bg="#D3D3D3", width=25).grid(row=0, column=4, padx=5, pady=5)
-        
-    def read_proc_file(self):
-        """Read and parse the multi-task proc file"""
-        data = {}
-        try:
-            with open(PROC_FILE_PATH, 'r') as f:
-                content = f.read()
-                
-            # Parse system-level data
-            lines = content.strip().split('\n')
-            current_task = None
-            
-            for line in lines:
-                if ':' in line:
-                    key, value = line.strip().split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key.startswith('Task') and key.endswith('_Name'):
-                        # Extract task number and start new task
-                        task_num = key.split('_')[0].replace('Task', '')
-                        current_task = f"Task{task_num}"
-                        if current_task not in data:
-                            data[current_task] = {}
-                        data[current_task]['Name'] = value
-                        data[current_task]['TaskNumber'] = task_num
-                    elif key.startswith('Task') and current_task:
-                        # Add task-specific data
-                        param_name = key.split('_', 1)[1]  # Remove TaskX_ prefix
-                        data[current_task][param_name] = value
-                    else:
-                        # System-level data
-                        data[key] = value
-                        
-        except FileNotFoundError:
-            self.status_message_var.set("Error: Module not loaded or proc file not found")
-            return None
-        except Exception as e:
-            self.status_message_var.set(f"Error reading proc file: {e}")
-            return None
-            
-        return data
-        
-    def update_task_widgets(self, task_data):
-        """Update or create task widgets based on current data"""
-        current_tasks = set()
-        
-        for task_key, task_info in task_data.items():
-            if not task_key.startswith('Task'):
-                continue
-                
-            task_name = task_info.get('Name', f'Unknown Task {task_key}')
-            current_tasks.add(task_name)
-            priority = int(task_info.get('Priority', 99))
-            
-            if task_name not in self.task_widgets:
-                # Create new task widget
-                row = len(self.task_widgets) + 1  # +1 for header row
-                self.task_widgets[task_name] = TaskWidget(
-                    self.scrollable_frame, task_name, priority, row
-                )
-            
-            # Update task widget
-            self.task_widgets[task_name].update_display(task_info)
-        
-        # Remove widgets for tasks that no longer exist
-        for task_name in list(self.task_widgets.keys()):
-            if task_name not in current_tasks:
-                # TODO: Implement widget removal if needed
-                pass
+        tk.Label(headers_frame, text="Trend (exec/miss)", font=("Arial", 10, "bold"),
+                bg="#D3D3D3", width=16).grid(row=0, column=5, padx=5, pady=5)
+        self.task_grid.bind_wheel(headers_frame)
+        
+    def drain_worker(self):
+        """Apply whatever the telemetry worker has produced since the last tick"""
+        latest = None
+        for kind, payload in self.worker.drain(UI_DRAIN_LIMIT):
+            if kind == "snapshot":
+                # Only the newest snapshot is worth drawing
+                latest = payload
+            elif kind == "error":
+                if isinstance(payload, TelemetryError):
+                    self.status_message_var.set(f"Error: {payload}")
+                else:
+                    self.status_message_var.set(f"Error reading proc file: {payload}")
+            else:
+                callback, result, error = payload
+                if callback:
+                    callback(result, error)
+        if latest is not None:
+            self.update_data(latest)
+            if self.perf.enabled:
+                # Run Tk's pending layout/redraw now so its cost is measured on its own
+                with self.perf.stage("tk_redraw"):
+                    self.master.update_idletasks()
+                self.perf.record("snapshot_age", (time.time() - latest.taken_at) * 1000)
+        
+        self.master.after(UI_IDLE_DRAIN_MS if self.poller.idle else UI_DRAIN_MS, self.drain_worker)
+        
+    def on_visibility_change(self, event):
+        """Slow polling down while the main window is minimized"""
+        if event.widget is not self.master:
+            return
+        visible = event.type != tk.EventType.Unmap
+        if visible != self.poller.visible:
+            self.poller.visible = visible
+            if visible:
+                self.worker.refresh()
+        
+    def close(self):
+        """Stop background threads and close the window"""
+        self.worker.stop()
+        if self.recorder and self.recorder.running:
+            self.recorder.stop()
+        self.master.destroy()
+        
+    def update_task_widgets(self, tasks):
+        """Hand the task list to the grid; only the rows in view are touched"""
+        self.task_grid.set_tasks(tasks)
                 
     def update_system_status(self, system_data):
         """Update system-level status display"""
@@ -476,40 +696,83 @@ class MultiTaskAvionicsGUI:
         active_tasks = system_data.get('ActiveTasks', '0')
         self.active_tasks_var.set(f"Active Tasks: {active_tasks}")
         
-    def update_data(self):
-        """Main data update method"""
-        proc_data = self.read_proc_file()
-        if proc_data:
-            self.system_data = proc_data
-            self.update_system_status(proc_data)
-            self.update_task_widgets(proc_data)
-            self.status_message_var.set("Data updated successfully")
-        
-        # Schedule next update
-        self.master.after(1000, self.update_data)  # Update every 1 second
+    def update_data(self, snapshot):
+        """Main data update method; every view shares the snapshot"""
+        self.snapshot = snapshot
+        self.registry.update(snapshot)
+        with self.perf.stage("history"):
+            self.history.update(snapshot)
+        self.system_data = snapshot.system
+        with self.perf.stage("widgets"):
+            self.update_system_status(snapshot.system)
+            self.update_task_widgets(snapshot.tasks)
+        self.status_message_var.set(f"Data updated from {self.source.describe()} "
+                                    f"(read took {self.worker.last_read_ms:.1f} ms, "
+                                    f"next in {self.poller.interval:.1f} s)")
+        if self.recorder and self.recorder.running:
+            self.simulation_status_var.set(self.recorder.describe())
         
     def force_refresh(self):
         """Force immediate data refresh"""
-        self.update_data()
-        self.status_message_var.set("Manual refresh completed")
+        self.worker.refresh()
+        self.status_message_var.set("Manual refresh requested")
         
     def quick_stress_test(self):
         """Apply a quick stress test by increasing workloads"""
+        if not self.source.writable:
+            messagebox.showerror("Error", f"{self.source.describe()} is read-only")
+            return
+        if not self.snapshot:
+            messagebox.showwarning("No Data", "No task data received yet")
+            return
+        # Triple every workload (max 1000ms) in one validated batch
+        current = current_params(self.snapshot)
+        updates = [(task_name, 'workload', min(values['workload'] * 3, 1000))
+                   for task_name, values in current.items() if 'workload' in values]
+        report = self.analyze_updates(updates)
         if messagebox.askyesno("Stress Test", 
-                              "This will temporarily increase all task workloads to test deadline compliance. Continue?"):
-            # Store original values and increase workloads
-            for task_name, widget in self.task_widgets.items():
-                if task_name in TASK_PARAMS:
-                    try:
-                        current_workload = int(widget.control_vars['workload'].get() or "0")
-                        stress_workload = min(current_workload * 3, 1000)  # Triple workload, max 1000ms
-                        widget.control_vars['workload'].set(str(stress_workload))
-                        widget.update_task_params()
-                    except ValueError:
-                        pass
+                              "This will temporarily increase all task workloads to test deadline compliance.\n\n"
+                              f"Predicted: {report.summary()}\n\nContinue?"):
+            self.status_message_var.set("Applying stress test...")
+            self.worker.submit(apply_params, self.source, updates, current,
+                               callback=self._stress_test_applied)
             
-            self.status_message_var.set("Stress test applied - monitor deadline compliance!")
+    def _stress_test_applied(self, result, error):
+        """Report a stress-test batch with one message at most"""
+        if error:
+            messagebox.showerror("Stress Test", f"Stress test failed: {error}")
+        elif result.ok:
+            self.status_message_var.set(f"Stress test applied ({result.summary()}) - "
+                                        f"monitor deadline compliance!")
+            self.worker.refresh()
+        else:
+            self.status_message_var.set(f"Stress test not applied: {result.summary()}")
+            messagebox.showwarning("Stress Test", f"{result.summary()}\n\n{result.details()}")
             
+    def analyze_updates(self, updates):
+        """Schedulability report for the current task set with updates applied"""
+        overrides = {}
+        for task_name, param, value in updates:
+            if str(value).isdigit():
+                overrides.setdefault(task_name, {})[param] = int(value)
+        return analyze(task_specs(self.snapshot, overrides))
+        
+    def preflight_params(self, updates):
+        """Ask before applying updates that shrink any task's predicted slack or leave it at risk"""
+        if not self.snapshot:
+            return True
+        before = analyze(task_specs(self.snapshot))
+        after = self.analyze_updates(updates)
+        self.status_message_var.set(f"Pre-flight check: {after.summary()}")
+        worse = after.worse_than(before)
+        if not worse and after.schedulable:
+            return True
+        changes = "\n".join(worse) if worse else "No task's slack gets worse"
+        return messagebox.askyesno("Schedulability Check",
+                                   f"{after.summary()}\n\n"
+                                   f"Predicted worst-case response:\n{changes}\n\n"
+                                   f"{after.details()}\n\nApply anyway?")
+        
     def reset_all_stats(self):
         """Reset statistics by reloading the module (requires user confirmation)"""
         if messagebox.askyesno("Reset Statistics", 
@@ -520,36 +783,33 @@ class MultiTaskAvionicsGUI:
         """Start a 10-second simulation"""
         if messagebox.askyesno("10-Second Simulation", 
                               "This will restart the module with 10-second timer.\nContinue?"):
-            try:
-                # Restart module with 10-second timer
-                import subprocess
-                import time
-                
-                self.simulation_status_var.set("Stopping current module...")
-                self.master.update()
-                
-                # Stop current module
-                subprocess.run(['sudo', 'rmmod', 'avionics_sim'], capture_output=True)
-                time.sleep(1)
-                
-                # Load module with 10-second runtime
-                self.simulation_status_var.set("Starting 10-second simulation...")
-                self.master.update()
-                
-                result = subprocess.run(['sudo', 'insmod', 'avionics_sim.ko', 'system_runtime_sec=10'], 
-                                      capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    self.simulation_status_var.set("Simulation running... (10 seconds)")
-                    # Start countdown timer
-                    self.countdown_simulation(10)
-                else:
-                    self.simulation_status_var.set("Failed to start simulation")
-                    messagebox.showerror("Error", f"Failed to load module: {result.stderr}")
-                    
-            except Exception as e:
-                self.simulation_status_var.set("Error during simulation")
-                messagebox.showerror("Error", f"Simulation failed: {e}")
+            # The module reload (rmmod, settle, insmod) runs on the worker thread
+            self.simulation_status_var.set("Restarting module with 10-second timer...")
+            self.simulation_button.config(state=tk.DISABLED)
+            self.worker.submit(self._restart_source, 10, callback=self._simulation_started)
+            
+    def _restart_source(self, runtime_sec):
+        """Restart the scheduler with a new runtime; runs on the telemetry worker"""
+        if self.source.kind == "sim":
+            # In-process simulator: no module to reload
+            self.source.runtime_sec = runtime_sec
+            self.source.reset()
+        else:
+            reload_kernel_module(runtime_sec)
+            
+    def _simulation_started(self, result, error):
+        self.simulation_button.config(state=tk.NORMAL)
+        if error is None:
+            self.simulation_status_var.set("Simulation running... (10 seconds)")
+            self.worker.refresh()
+            # Start countdown timer
+            self.countdown_simulation(10)
+        elif isinstance(error, TelemetryError):
+            self.simulation_status_var.set("Failed to start simulation")
+            messagebox.showerror("Error", str(error))
+        else:
+            self.simulation_status_var.set("Error during simulation")
+            messagebox.showerror("Error", f"Simulation failed: {error}")
                 
     def countdown_simulation(self, seconds_left):
         """Countdown timer for simulation"""
@@ -565,8 +825,8 @@ class MultiTaskAvionicsGUI:
     def show_gantt_chart(self):
         """Show the Gantt chart visualization"""
         try:
-            # Read execution log from proc file
-            exec_log = self.parse_execution_log()
+            # Use the execution log of the latest snapshot
+            exec_log = self.snapshot.exec_log if self.snapshot else ()
             
             if not exec_log:
                 messagebox.showwarning("No Data", "No execution log found. Run a 10-second simulation first.")
@@ -578,43 +838,14 @@ class MultiTaskAvionicsGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show Gantt chart: {e}")
             
-    def parse_execution_log(self):
-        """Parse execution log from proc file"""
-        try:
-            with open(PROC_FILE_PATH, 'r') as f:
-                content = f.read()
-                
-            lines = content.strip().split('\n')
-            exec_log = []
-            in_log_section = False
-            
-            for line in lines:
-                if line.strip() == "EXECUTION_LOG:":
-                    in_log_section = True
-                    continue
-                    
-                if in_log_section and line.startswith("EXEC:"):
-                    # Parse: EXEC:task_type,start_time_ms,duration_ms,deadline_result
-                    parts = line[5:].split(',')  # Remove "EXEC:" prefix
-                    if len(parts) == 4:
-                        exec_log.append({
-                            'task_type': int(parts[0]),
-                            'start_time': int(parts[1]),
-                            'duration': int(parts[2]),
-                            'deadline_met': parts[3] == 'MET'
-                        })
-            
-            return exec_log
-            
-        except Exception as e:
-            print(f"Error parsing execution log: {e}")
-            return []
-            
-    def create_gantt_window(self, exec_log):
+    def create_gantt_window(self, exec_log, title="Avionics Task Execution - Gantt Chart", live=True,
+                            registry=None):
         """Create and display Gantt chart window"""
+        if registry is None:
+            registry = self.registry if len(self.registry) else TaskRegistry.from_task_set()
         # Create new window
         gantt_window = tk.Toplevel(self.master)
-        gantt_window.title("Avionics Task Execution - Gantt Chart")
+        gantt_window.title(title)
         gantt_window.geometry("1200x700")
         
         # Create main frame with scrollbars
@@ -632,310 +863,462 @@ class MultiTaskAvionicsGUI:
         h_scrollbar.pack(side="bottom", fill="x")
         canvas.pack(side="left", fill="both", expand=True)
         
-        # Draw Gantt chart
-        self.draw_gantt_chart(canvas, exec_log)
+        # Draw Gantt chart; items are kept and updated in place afterwards
+        chart = GanttChart(canvas, registry, perf=self.perf)
+        chart.bind_navigation()
+        chart.update(exec_log)
+        # Tasks in the log but not in the registry still get a row
+        chart.follow_registry(registry.with_ids(chart.index.tasks))
+        
+        # Live refresh toggle and view controls
+        nav_frame = tk.Frame(gantt_window)
+        nav_frame.pack(fill=tk.X, padx=10)
+        live_var = tk.BooleanVar(value=live)
+        tk.Checkbutton(nav_frame, text=f"Live update ({1000 // GANTT_REFRESH_MS} Hz)",
+                       variable=live_var).pack(side=tk.LEFT)
+        tk.Button(nav_frame, text="Reset View", command=chart.reset_view,
+                  font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        tk.Button(nav_frame, text="Export...", command=lambda: self.export_gantt_data(chart),
+                  font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        tk.Label(nav_frame, text="Mouse wheel: zoom | Drag: pan | Double-click: whole timeline",
+                 font=("Arial", 9, "italic"), fg="gray").pack(side=tk.LEFT, padx=10)
+        
+        # Deadline miss navigation: n / p step through the misses, the panel
+        # below shows what ran ahead of the selected one
+        miss_frame = tk.Frame(gantt_window)
+        miss_frame.pack(fill=tk.X, padx=10, pady=(5, 0))
+        miss_filter = ttk.Combobox(miss_frame, state="readonly", width=32)
+        miss_filter.configure(postcommand=lambda: miss_filter.configure(
+            values=[ALL_TASKS] + [f"P{task.priority} {task.name}" for task in chart.registry]))
+        miss_filter.set(ALL_TASKS)
+        miss_context = tk.Text(gantt_window, font=("Courier", 9), height=8, wrap=tk.NONE,
+                               bg="#FDF2E9", fg="black")
+        
+        def step_miss(forward):
+            self.step_miss(chart, miss_filter, miss_context, forward)
+            
+        tk.Button(miss_frame, text="◀ Previous miss (p)", command=lambda: step_miss(False),
+                  font=("Arial", 9)).pack(side=tk.LEFT)
+        tk.Button(miss_frame, text="Next miss ▶ (n)", command=lambda: step_miss(True),
+                  font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        tk.Label(miss_frame, text="Misses of:", font=("Arial", 9)).pack(side=tk.LEFT, padx=(10, 2))
+        miss_filter.pack(side=tk.LEFT)
+        miss_context.pack(fill=tk.X, padx=10, pady=(2, 0))
+        self.replace_text(miss_context, "Press n / p to step through the deadline misses.")
+        gantt_window.bind("<Key-n>", lambda event: step_miss(True))
+        gantt_window.bind("<Key-p>", lambda event: step_miss(False))
         
         # Add statistics
         stats_frame = tk.Frame(gantt_window)
         stats_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.show_execution_statistics(stats_frame, exec_log)
-        
-    def draw_gantt_chart(self, canvas, exec_log):
-        """Draw a traditional grid-based Gantt chart with millisecond timeline"""
-        if not exec_log:
-            canvas.create_text(500, 300, text="No execution data available", 
-                             font=("Arial", 16), fill="red")
-            canvas.create_text(500, 330, text="Run a 10-second simulation first", 
-                             font=("Arial", 12), fill="gray")
-            return
-            
-        # Task colors for execution bars
-        task_colors = {
-            0: "#E74C3C",  # Flight Attitude - Red
-            1: "#F39C12",  # Engine Control - Orange  
-            2: "#3498DB",  # Navigation - Blue
-            3: "#2ECC71",  # Communication - Green
-            4: "#9B59B6"   # Cabin Systems - Purple
-        }
-        
-        task_names = {
-            0: "Flight Attitude Monitor",
-            1: "Engine Control", 
-            2: "Navigation System",
-            3: "Communication System",
-            4: "Cabin Systems"
-        }
-        
-        # Chart dimensions
-        task_label_width = 200
-        chart_start_x = task_label_width + 20
-        chart_start_y = 100
-        row_height = 50
-        chart_height = 5 * row_height
-        chart_width = 1000
-        
-        # Calculate time range and scale
-        max_time = max(entry['start_time'] + entry['duration'] for entry in exec_log) if exec_log else 10000
-        min_time = min(entry['start_time'] for entry in exec_log) if exec_log else 0
-        time_range = max_time - min_time
-        time_scale = chart_width / time_range if time_range > 0 else 1
-        
-        # Clear canvas and set scroll region
-        canvas.delete("all")
-        total_width = chart_start_x + chart_width + 100
-        total_height = chart_start_y + chart_height + 100
-        canvas.configure(scrollregion=(0, 0, total_width, total_height))
-        
-        # Title
-        canvas.create_text(total_width//2, 30, 
-                          text="Avionics Task Execution Timeline", 
-                          font=("Arial", 18, "bold"), fill="#2C3E50")
-        
-        # Subtitle with timeline info
-        canvas.create_text(total_width//2, 55, 
-                          text=f"Timeline: {min_time}ms - {max_time}ms ({time_range}ms duration) | {len(exec_log)} executions", 
-                          font=("Arial", 12), fill="#7F8C8D")
-        
-        # Create header for time scale
-        header_y = chart_start_y - 30
-        
-        # Time scale header background
-        canvas.create_rectangle(chart_start_x, header_y - 15, chart_start_x + chart_width, header_y + 25, 
-                              fill="#34495E", outline="#2C3E50", width=2)
-        
-        canvas.create_text(chart_start_x + chart_width//2, header_y + 5, 
-                          text="TIME (milliseconds)", 
-                          font=("Arial", 12, "bold"), fill="white")
-        
-        # Draw vertical grid lines and time markers
-        time_interval = max(100, int(time_range / 10))  # Dynamic interval based on range
-        # Round interval to nice numbers
-        if time_interval < 500:
-            time_interval = 100
-        elif time_interval < 1000:
-            time_interval = 500
+        stats_widget = self.show_execution_statistics(stats_frame, exec_log, chart.registry)
+        
+        self.master.after(GANTT_REFRESH_MS, self.refresh_gantt_chart,
+                          gantt_window, chart, live_var, exec_log)
+        return gantt_window, chart, stats_widget
+        
+    def step_miss(self, chart, miss_filter, context_widget, forward):
+        """Centre the chart on the next/previous deadline miss and explain it"""
+        choice = miss_filter.current()
+        task_ids = None
+        if choice > 0 and choice <= len(chart.registry):
+            task_ids = [chart.registry.tasks[choice - 1].task_id]
+        miss = chart.select_miss(forward, task_ids)
+        if task_ids is None:
+            total = chart.index.miss_count
         else:
-            time_interval = 1000
-            
-        start_time = int(min_time / time_interval) * time_interval
-        
-        for time_ms in range(start_time, max_time + time_interval, time_interval):
-            x_pos = chart_start_x + (time_ms - min_time) * time_scale
-            if chart_start_x <= x_pos <= chart_start_x + chart_width:
-                # Vertical grid line
-                canvas.create_line(x_pos, chart_start_y, x_pos, chart_start_y + chart_height, 
-                                 fill="#BDC3C7", width=1)
-                
-                # Time label
-                canvas.create_text(x_pos, chart_start_y - 10, text=f"{time_ms}", 
-                                 font=("Arial", 9), anchor="n", fill="#2C3E50")
-        
-        # Draw task rows and labels
-        for task_id in range(5):
-            y_pos = chart_start_y + task_id * row_height
-            
-            # Task label area background
-            canvas.create_rectangle(20, y_pos, chart_start_x, y_pos + row_height, 
-                                  fill="#ECF0F1", outline="#BDC3C7", width=1)
-            
-            # Priority badge
-            priority_color = task_colors.get(task_id, "#95A5A6")
-            canvas.create_rectangle(25, y_pos + 10, 55, y_pos + 30, 
-                                  fill=priority_color, outline="#2C3E50", width=1)
-            canvas.create_text(40, y_pos + 20, text=f"P{task_id}", 
-                             font=("Arial", 10, "bold"), fill="white")
-            
-            # Task name
-            canvas.create_text(65, y_pos + 25, 
-                             text=task_names.get(task_id, f"Task {task_id}"), 
-                             font=("Arial", 11, "bold"), anchor="w", fill="#2C3E50")
-            
-            # Chart area for this task
-            canvas.create_rectangle(chart_start_x, y_pos, chart_start_x + chart_width, y_pos + row_height,
-                                  fill="white", outline="#BDC3C7", width=1)
+            total = len(chart.index.misses(task_ids[0]))
+        if miss is None:
+            text = f"No {'later' if forward else 'earlier'} deadline miss" if total else "No deadline misses"
+            if task_ids:
+                text += f" of {chart.registry.name(task_ids[0])}"
+            text += "."
+        else:
+            context = chart.index.miss_context(miss, chart.registry.higher_priority(miss.task_type))
+            text = self.format_miss_context(context, chart.registry,
+                                            chart.index.miss_position(miss, task_ids), total)
+        self.replace_text(context_widget, text)
+        
+    @staticmethod
+    def format_miss_context(context, registry, position, total):
+        """Text of the miss context panel"""
+        miss = context.miss
+        task = registry.get(miss.task_type)
+        priority = f"P{task.priority} " if task else ""
+        lines = [f"Deadline miss {position} of {total}: {priority}{registry.name(miss.task_type)}",
+                 f"  Ran {miss.start_time} - {miss.start_time + miss.duration} ms ({miss.duration} ms)"]
+        previous = context.previous
+        if previous is not None:
+            previous_end = previous.start_time + previous.duration
+            lines.append(f"  Previous run ended at {previous_end} ms "
+                         f"({miss.start_time - previous_end} ms before this one started)")
+        else:
+            lines.append("  No earlier run of this task recorded")
+        if not context.blockers:
+            lines.append("  No higher-priority task ran in between")
+        else:
+            shown = f", latest {len(context.blockers)} shown" if context.truncated else ""
+            lines.append(f"  Higher-priority executions in between ({context.blocked} ms{shown}):")
+            for entry in context.blockers:
+                result = "MET" if entry.deadline_met else "MISSED"
+                lines.append(f"    {entry.start_time:>10} - {entry.start_time + entry.duration:<10} "
+                             f"{entry.duration:>5} ms  {result:<6}  P{registry.get(entry.task_type).priority} "
+                             f"{registry.name(entry.task_type)}")
+        return "\n".join(lines)
+        
+    def refresh_gantt_chart(self, gantt_window, chart, live_var, last_log):
+        """Re-render an open Gantt chart whenever a new snapshot arrives"""
+        try:
+            if not gantt_window.winfo_exists():
+                return
+        except tk.TclError:
+            return
             
-            # Horizontal grid line
-            canvas.create_line(chart_start_x, y_pos + row_height, chart_start_x + chart_width, y_pos + row_height, 
-                             fill="#BDC3C7", width=1)
-        
-        # Draw execution bars
-        sorted_exec_log = sorted(exec_log, key=lambda x: x['start_time'])
-        
-        for entry in sorted_exec_log:
-            task_id = entry['task_type']
-            start_time = entry['start_time']
-            duration = entry['duration']
-            deadline_met = entry['deadline_met']
+        exec_log = self.snapshot.exec_log if self.snapshot else last_log
+        if live_var.get() and exec_log is not last_log:
+            chart.update(exec_log)
+            last_log = exec_log
+            chart.follow_registry(self.registry.with_ids(chart.index.tasks))
             
-            # Calculate position
-            y_pos = chart_start_y + task_id * row_height
-            x_start = chart_start_x + (start_time - min_time) * time_scale
-            x_end = chart_start_x + (start_time + duration - min_time) * time_scale
+        self.master.after(GANTT_REFRESH_MS, self.refresh_gantt_chart,
+                          gantt_window, chart, live_var, last_log)
+        
+    def export_gantt_data(self, chart):
+        """Export the executions shown in a Gantt window, plus per-task aggregates"""
+        path = filedialog.asksaveasfilename(title="Export executions to", defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"),
+                                                       ("Columnar", "*" + COLUMNAR_SUFFIX)])
+        if not path:
+            return
+        # The chart keeps growing (live refresh, a recording still loading),
+        # so the export thread streams from its own copy of the index
+        index = chart.index.copy()
+        task_names = {task.task_id: task.name for task in chart.registry}
+        self.simulation_status_var.set(f"Exporting {len(index)} executions to {path}...")
+        job = ExportJob(index.ordered(), path, aggregate_path_for(path), None, task_names).start()
+        self.master.after(EXPORT_POLL_MS, self.poll_export, job)
+        
+    def poll_export(self, job):
+        if job.running:
+            self.master.after(EXPORT_POLL_MS, self.poll_export, job)
+            return
+        if job.error:
+            self.simulation_status_var.set("Export failed")
+            messagebox.showerror("Error", f"Export failed: {job.error}")
+            return
+        result = job.result
+        self.simulation_status_var.set(f"Exported {result.executions} executions to "
+                                       f"{result.exec_path} and {result.aggregate_path} "
+                                       f"in {result.elapsed_sec:.1f} s")
+        
+    def toggle_recording(self):
+        """Start or stop the background execution log recorder"""
+        if self.recorder and self.recorder.running:
+            self.stop_recording()
+            return
+        path = filedialog.asksaveasfilename(title="Record execution log to",
+                                            defaultextension=".bin",
+                                            filetypes=[("Binary execution logs", "*.bin"),
+                                                       ("Text execution logs", "*.log"),
+                                                       ("All files", "*")])
+        if path:
+            self.start_recording(path)
             
-            # Ensure minimum width for visibility
-            min_width = 4
-            if x_end - x_start < min_width:
-                x_end = x_start + min_width
+    def start_recording(self, path):
+        try:
+            self.recorder = ExecLogRecorder(self.source.reader(), path, self.record_rate)
+            self.recorder.start()
+        except (OSError, ValueError, TelemetryError) as e:
+            self.recorder = None
+            messagebox.showerror("Error", f"Cannot record to {path}: {e}")
+            return
+        self.record_button.config(text="Stop Recording", bg="tomato")
+        self.simulation_status_var.set(self.recorder.describe())
+        
+    def stop_recording(self):
+        self.recorder.stop()
+        if self.recorder.source is not self.source:
+            self.recorder.source.close()
+        self.simulation_status_var.set(f"Recording stopped: {self.recorder.recorded} executions "
+                                       f"saved to {', '.join(self.recorder.paths)}")
+        self.record_button.config(text="Start Recording", bg="plum")
+        
+    def load_recording(self):
+        """Open a recorded execution log or capture in its own Gantt window
+
+        The file is parsed in chunks on a background thread; the chart and
+        statistics fill in while it loads, so large captures show up at once.
+        """
+        path = filedialog.askopenfilename(title="Open execution log",
+                                          filetypes=[("Execution logs", "*.bin *.log"),
+                                                     ("Captures", "*.txt *.cap"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            loader = ExecLogLoader(path).start()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Failed to read {path}: {e}")
+            return
+        gantt_window, chart, stats_widget = self.create_gantt_window(
+            (), title=f"Recorded Execution Log - {os.path.basename(path)}", live=False)
+        self.master.after(INGEST_POLL_MS, self.ingest_recording, loader, gantt_window, chart,
+                          stats_widget, 0.0, 0.0)
+        
+    def ingest_recording(self, loader, gantt_window, chart, stats_widget, next_render, next_stats):
+        """Index the next loaded chunks and refresh the chart and statistics as they grow"""
+        try:
+            if not gantt_window.winfo_exists():
+                loader.cancel()
+                return
+        except tk.TclError:
+            loader.cancel()
+            return
             
-            # Bar styling based on deadline compliance
-            if deadline_met:
-                fill_color = task_colors.get(task_id, "#95A5A6")
-                outline_color = "#27AE60"
-                outline_width = 1
+        added = loader.feed(chart.index)
+        done = loader.done
+        now = time.monotonic()
+        if done or (added and now >= next_render):
+            chart.follow_registry(chart.registry.with_ids(chart.index.tasks))
+            if chart.view is None and not done:
+                first_start = chart.index.span()[0]
+                chart.show_range(first_start, first_start + INGEST_VIEW_MS)
             else:
-                fill_color = "#E74C3C"  # Red for deadline misses
-                outline_color = "#C0392B"
-                outline_width = 2
-            
-            # Draw execution bar with padding
-            bar_padding = 8
-            canvas.create_rectangle(x_start, y_pos + bar_padding, 
-                                  x_end, y_pos + row_height - bar_padding, 
-                                  fill=fill_color, outline=outline_color, width=outline_width)
+                chart.render()
+            # Keep redraws and statistics under ~10% of the loading time
+            next_render = time.monotonic() + max(INGEST_RENDER_MS / 1000, 10 * (time.monotonic() - now))
+        if (added and now >= next_stats) or done:
+            started = time.monotonic()
+            summary = index_statistics(chart.index)
+            next_stats = time.monotonic() + max(INGEST_STATS_MS / 1000, 10 * (time.monotonic() - started))
+            self.replace_text(stats_widget, self.format_execution_statistics(summary, chart.registry))
+        gantt_window.title(f"Recorded Execution Log - {loader.describe()}")
+        self.simulation_status_var.set(loader.describe())
+        
+        if not done:
+            self.master.after(INGEST_POLL_MS, self.ingest_recording, loader, gantt_window, chart,
+                              stats_widget, next_render, next_stats)
+        elif loader.error:
+            messagebox.showerror("Error", f"Failed to read {loader.path}: {loader.error}")
+        elif not len(chart.index):
+            messagebox.showwarning("No Data", f"No executions found in {loader.path}")
+        
+    def simulate_offline(self):
+        """Run the scheduler model over a long virtual period and chart the result"""
+        minutes = simpledialog.askfloat("Offline Simulation", "Minutes of virtual time to simulate:",
+                                        initialvalue=60, minvalue=0.1, maxvalue=24 * 60,
+                                        parent=self.master)
+        if not minutes:
+            return
+        # Use the current parameters when available so edits can be tried out offline
+        task_set = task_specs(self.snapshot) if self.snapshot else DEFAULT_TASK_SET
+        self.simulation_status_var.set(f"Simulating {minutes:g} min...")
+        self.offline_sim_button.config(state=tk.DISABLED)
+        self.worker.submit(simulate, task_set, int(minutes * 60000),
+                           callback=lambda run, error: self._offline_simulation_done(minutes, run, error))
+        
+    def _offline_simulation_done(self, minutes, run, error):
+        self.offline_sim_button.config(state=tk.NORMAL)
+        if error:
+            self.simulation_status_var.set("Offline simulation failed")
+            messagebox.showerror("Error", f"Offline simulation failed: {error}")
+            return
+        self.simulation_status_var.set(f"Simulated {minutes:g} min: {len(run.exec_log)} executions "
+                                       f"in {run.elapsed_sec * 1000:.0f} ms")
+        if not run.exec_log:
+            messagebox.showwarning("No Data", "The task set produced no executions")
+            return
+        self.create_gantt_window(run.exec_log, title=f"Offline Simulation - {minutes:g} min",
+                                 live=False, registry=TaskRegistry.from_task_set(
+                                     (task.name, task.priority) for task in run.tasks))
+        
+    def open_sweep_window(self):
+        """Window for running workload/period sweeps and watching the heat map fill in"""
+        sweep_window = tk.Toplevel(self.master)
+        sweep_window.title("Parameter Sweep - Feasibility Heat Map")
+        sweep_window.geometry("900x650")
+        
+        # Sweep settings
+        settings_frame = tk.Frame(sweep_window)
+        settings_frame.pack(fill=tk.X, padx=10, pady=5)
+        settings = {}
+        for label, key, default in (("Workload scales", 'workload', "0.5:3:0.1"),
+                                    ("Period scales", 'period', "0.5:2:0.1"),
+                                    ("Seconds per point", 'seconds', "60")):
+            tk.Label(settings_frame, text=label, font=("Arial", 9)).pack(side=tk.LEFT)
+            settings[key] = tk.StringVar(value=default)
+            tk.Entry(settings_frame, textvariable=settings[key], width=12).pack(side=tk.LEFT, padx=5)
+        start_button = tk.Button(settings_frame, text="Start", font=("Arial", 9, "bold"), bg="lightgreen")
+        start_button.pack(side=tk.LEFT, padx=5)
+        stop_button = tk.Button(settings_frame, text="Stop", font=("Arial", 9, "bold"), bg="lightcoral",
+                                state=tk.DISABLED)
+        stop_button.pack(side=tk.LEFT)
+        progress_var = tk.StringVar(value="Scales are start:stop:step or a,b,c")
+        tk.Label(sweep_window, textvariable=progress_var, font=("Arial", 9, "italic")).pack(fill=tk.X)
+        
+        canvas = tk.Canvas(sweep_window, bg="white")
+        h_scrollbar = tk.Scrollbar(sweep_window, orient="horizontal", command=canvas.xview)
+        v_scrollbar = tk.Scrollbar(sweep_window, orient="vertical", command=canvas.yview)
+        canvas.configure(xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
+        h_scrollbar.pack(side="bottom", fill="x")
+        v_scrollbar.pack(side="right", fill="y")
+        canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        state = {'runner': None}
+        
+        def start():
+            try:
+                workload_scales = parse_scales(settings['workload'].get())
+                period_scales = parse_scales(settings['period'].get())
+                duration_ms = int(float(settings['seconds'].get()) * 1000)
+            except ValueError as e:
+                messagebox.showerror("Parameter Sweep", f"Invalid sweep settings: {e}", parent=sweep_window)
+                return
+            task_set = task_specs(self.snapshot) if self.snapshot else DEFAULT_TASK_SET
+            canvas.delete("all")
+            heat_map = SweepHeatMap(canvas, workload_scales, period_scales)
+            runner = SweepRunner(task_set, workload_scales, period_scales, duration_ms)
+            runner.start()
+            state['runner'] = runner
+            start_button.config(state=tk.DISABLED)
+            stop_button.config(state=tk.NORMAL)
+            poll(runner, heat_map)
             
-            # Add duration text if bar is wide enough
-            bar_width = x_end - x_start
-            bar_center_x = (x_start + x_end) / 2
-            bar_center_y = y_pos + row_height / 2
+        def poll(runner, heat_map):
+            try:
+                if not sweep_window.winfo_exists():
+                    runner.cancel()
+                    return
+            except tk.TclError:
+                runner.cancel()
+                return
+            for result in runner.drain():
+                heat_map.add(result)
+            if runner.running:
+                progress_var.set(f"{runner.completed}/{runner.total} combinations")
+                sweep_window.after(SWEEP_POLL_MS, poll, runner, heat_map)
+                return
+            for result in runner.drain():
+                heat_map.add(result)
+            start_button.config(state=tk.NORMAL)
+            stop_button.config(state=tk.DISABLED)
+            if runner.error:
+                progress_var.set(f"Sweep failed: {runner.error}")
+            else:
+                progress_var.set(f"{runner.completed}/{runner.total} combinations in "
+                                 f"{runner.elapsed_sec:.1f} s - black marks: feasibility frontier")
             
-            if bar_width > 30:
-                canvas.create_text(bar_center_x, bar_center_y, 
-                                 text=f"{duration}ms", 
-                                 font=("Arial", 8, "bold"), fill="white")
+        def stop():
+            if state['runner']:
+                state['runner'].cancel()
             
-            # Add deadline status indicator
-            if not deadline_met:
-                # Add warning triangle for deadline miss
-                triangle_x = x_end + 2
-                triangle_y = y_pos + 5
-                canvas.create_polygon(triangle_x, triangle_y, 
-                                    triangle_x + 8, triangle_y, 
-                                    triangle_x + 4, triangle_y + 8,
-                                    fill="#E74C3C", outline="#C0392B")
-                canvas.create_text(triangle_x + 4, triangle_y + 4, text="!", 
-                                 font=("Arial", 6, "bold"), fill="white")
-        
-        # Legend
-        legend_x = 20
-        legend_y = chart_start_y + chart_height + 20
-        
-        # Legend background
-        canvas.create_rectangle(legend_x - 5, legend_y - 5, 
-                              legend_x + 900, legend_y + 80, 
-                              fill="#F8F9FA", outline="#BDC3C7", width=1)
-        
-        # Legend title
-        canvas.create_text(legend_x + 5, legend_y + 5, text="LEGEND", 
-                         font=("Arial", 12, "bold"), anchor="nw", fill="#2C3E50")
-        
-        # Task priority colors
-        legend_col1_x = legend_x + 10
-        canvas.create_text(legend_col1_x, legend_y + 25, text="Task Priorities:", 
-                         font=("Arial", 10, "bold"), anchor="nw", fill="#2C3E50")
-        
-        for i, (task_id, color) in enumerate(task_colors.items()):
-            legend_item_x = legend_col1_x + (i * 120)
-            legend_item_y = legend_y + 45
+        start_button.config(command=start)
+        stop_button.config(command=stop)
+        
+    def open_performance_window(self):
+        """Live per-stage timing table, with enable/reset/save controls"""
+        perf_window = tk.Toplevel(self.master)
+        perf_window.title("Performance")
+        perf_window.geometry("640x360")
+        
+        controls = tk.Frame(perf_window)
+        controls.pack(fill=tk.X, padx=10, pady=5)
+        enabled_var = tk.BooleanVar(value=self.perf.enabled)
+        
+        def toggle():
+            self.perf.enabled = enabled_var.get()
             
-            canvas.create_rectangle(legend_item_x, legend_item_y, 
-                                  legend_item_x + 15, legend_item_y + 15, 
-                                  fill=color, outline="#2C3E50")
-            canvas.create_text(legend_item_x + 20, legend_item_y + 7, 
-                             text=f"P{task_id}", 
-                             font=("Arial", 9), anchor="w", fill="#2C3E50")
-        
-        # Status indicators
-        legend_col2_x = legend_x + 650
-        canvas.create_text(legend_col2_x, legend_y + 25, text="Status:", 
-                         font=("Arial", 10, "bold"), anchor="nw", fill="#2C3E50")
-        
-        # Deadline met
-        canvas.create_rectangle(legend_col2_x, legend_y + 45, 
-                              legend_col2_x + 20, legend_y + 55, 
-                              fill="#2ECC71", outline="#27AE60", width=1)
-        canvas.create_text(legend_col2_x + 25, legend_y + 50, text="Deadline Met", 
-                         font=("Arial", 9), anchor="w", fill="#2C3E50")
-        
-        # Deadline missed
-        canvas.create_rectangle(legend_col2_x + 120, legend_y + 45, 
-                              legend_col2_x + 140, legend_y + 55, 
-                              fill="#E74C3C", outline="#C0392B", width=2)
-        canvas.create_text(legend_col2_x + 145, legend_y + 50, text="Deadline MISSED", 
-                         font=("Arial", 9, "bold"), anchor="w", fill="#E74C3C")
-        
-    def show_execution_statistics(self, parent_frame, exec_log):
-        """Show execution statistics summary with enhanced details"""
-        # Calculate comprehensive statistics
-        task_stats = {}
-        total_executions = len(exec_log)
-        total_deadline_misses = 0
-        
-        # Calculate timeline span
-        if exec_log:
-            timeline_start = min(entry['start_time'] for entry in exec_log)
-            timeline_end = max(entry['start_time'] + entry['duration'] for entry in exec_log)
-            timeline_duration = timeline_end - timeline_start
-        else:
-            timeline_duration = 0
-        
-        for entry in exec_log:
-            task_id = entry['task_type']
-            if task_id not in task_stats:
-                task_stats[task_id] = {
-                    'count': 0, 
-                    'total_time': 0, 
-                    'misses': 0, 
-                    'min_duration': float('inf'),
-                    'max_duration': 0,
-                    'total_cpu_time': 0
-                }
+        def save():
+            path = filedialog.asksaveasfilename(title="Save timings as", defaultextension=".json",
+                                                filetypes=[("JSON", "*.json"), ("All files", "*")],
+                                                parent=perf_window)
+            if not path:
+                return
+            try:
+                self.perf.dump(path)
+            except OSError as e:
+                messagebox.showerror("Error", f"Cannot write {path}: {e}", parent=perf_window)
                 
-            stats = task_stats[task_id]
-            stats['count'] += 1
-            stats['total_time'] += entry['duration']
-            stats['total_cpu_time'] += entry['duration']
-            stats['min_duration'] = min(stats['min_duration'], entry['duration'])
-            stats['max_duration'] = max(stats['max_duration'], entry['duration'])
+        tk.Checkbutton(controls, text="Record timings", variable=enabled_var,
+                       command=toggle).pack(side=tk.LEFT)
+        tk.Button(controls, text="Reset", command=self.perf.reset,
+                  font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        tk.Button(controls, text="Save JSON...", command=save,
+                  font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        tk.Label(controls, text=f"last {self.perf.window} samples per stage",
+                 font=("Arial", 9, "italic"), fg="gray").pack(side=tk.RIGHT)
+        
+        table = tk.Text(perf_window, font=("Courier", 9), bg="#F5F5F5", fg="black", wrap=tk.NONE)
+        table.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        def refresh(shown_version):
+            try:
+                if not perf_window.winfo_exists():
+                    return
+            except tk.TclError:
+                return
+            if self.perf.version != shown_version:
+                shown_version = self.perf.version
+                table.config(state="normal")
+                table.delete("1.0", tk.END)
+                table.insert("1.0", self.perf.format_table())
+                table.config(state="disabled")
+            perf_window.after(PERF_PANEL_MS, refresh, shown_version)
             
-            if not entry['deadline_met']:
-                stats['misses'] += 1
-                total_deadline_misses += 1
+        refresh(None)
+        
+    @staticmethod
+    def _priority_list(tasks):
+        """'P0, P1' for a few tasks, 'P0 .. P199, 200 tasks' for many"""
+        if len(tasks) <= 6:
+            return ", ".join(f"P{task.priority}" for task in tasks)
+        return f"P{tasks[0].priority} .. P{tasks[-1].priority}, {len(tasks)} tasks"
+        
+    def format_execution_statistics(self, summary, registry=None):
+        """Text of the execution analysis report for an ExecutionStatistics"""
+        task_stats = summary.tasks
+        registry = (registry or self.registry).with_ids(task_stats)
+        total_executions = summary.total_executions
+        total_deadline_misses = summary.total_misses
+        timeline_duration = summary.timeline_duration
+        miss_share = total_deadline_misses / total_executions * 100 if total_executions else 0
         
         # Create enhanced statistics display
         stats_text = f"📊 EXECUTION ANALYSIS REPORT\n"
         stats_text += f"{'='*60}\n"
         stats_text += f"Total Executions: {total_executions}\n"
         stats_text += f"Timeline Duration: {timeline_duration:.0f} ms ({timeline_duration/1000:.1f} seconds)\n"
-        stats_text += f"Total Deadline Violations: {total_deadline_misses} ({total_deadline_misses/total_executions*100:.1f}%)\n"
+        stats_text += f"Total Deadline Violations: {total_deadline_misses} ({miss_share:.1f}%)\n"
         stats_text += f"System Health: {'🔴 CRITICAL' if total_deadline_misses > total_executions*0.2 else '🟡 WARNING' if total_deadline_misses > 0 else '🟢 HEALTHY'}\n"
         stats_text += f"\n{'TASK BREAKDOWN:'}\n"
         stats_text += f"{'-'*60}\n"
         
-        task_names = ["Flight Attitude Monitor", "Engine Control", "Navigation System", "Communication System", "Cabin Systems"]
+        bucket_labels = histogram_labels()
         
-        for task_id in range(5):
-            task_name = task_names[task_id]
-            stats_text += f"\nP{task_id}: {task_name}\n"
+        for task in registry:
+            task_id = task.task_id
+            stats_text += f"\nP{task.priority}: {task.name}\n"
             
             if task_id in task_stats:
                 stats = task_stats[task_id]
-                avg_time = stats['total_time'] / stats['count'] if stats['count'] > 0 else 0
-                miss_rate = (stats['misses'] / stats['count'] * 100) if stats['count'] > 0 else 0
-                cpu_utilization = (stats['total_cpu_time'] / timeline_duration * 100) if timeline_duration > 0 else 0
-                
-                # Fix min_duration display for tasks that didn't run
-                min_dur = stats['min_duration'] if stats['min_duration'] != float('inf') else 0
+                miss_rate = stats.misses / stats.count * 100
+                cpu_utilization = summary.utilization(task_id)
                 
-                stats_text += f"  ✓ Executions: {stats['count']}\n"
-                stats_text += f"  ⏱️  Avg Duration: {avg_time:.1f} ms\n"
-                stats_text += f"  📏 Duration Range: {min_dur} - {stats['max_duration']} ms\n"
-                stats_text += f"  🎯 Deadline Compliance: {stats['count'] - stats['misses']}/{stats['count']} ({100-miss_rate:.1f}%)\n"
-                stats_text += f"  ⚠️  Deadline Misses: {stats['misses']} ({miss_rate:.1f}%)\n"
+                stats_text += f"  ✓ Executions: {stats.count}\n"
+                stats_text += f"  ⏱️  Avg Duration: {stats.mean_duration:.1f} ms\n"
+                stats_text += f"  📏 Duration Range: {stats.min_duration} - {stats.max_duration} ms\n"
+                stats_text += (f"  📈 Percentiles: p50 {stats.p50:.1f} / p95 {stats.p95:.1f} / "
+                               f"p99 {stats.p99:.1f} / max {stats.max_duration} ms\n")
+                stats_text += f"  〰️  Start Jitter: {stats.jitter:.1f} ms\n"
+                stats_text += f"  🎯 Deadline Compliance: {stats.count - stats.misses}/{stats.count} ({100-miss_rate:.1f}%)\n"
+                stats_text += f"  ⚠️  Deadline Misses: {stats.misses} ({miss_rate:.1f}%)\n"
                 stats_text += f"  💻 CPU Utilization: {cpu_utilization:.1f}%\n"
+                histogram = ", ".join(f"{label}: {count}" for label, count
+                                      in zip(bucket_labels, stats.histogram) if count)
+                stats_text += f"  📊 Duration Histogram: {histogram}\n"
                 
                 # Status indicator
-                if stats['misses'] == 0:
+                if stats.misses == 0:
                     stats_text += f"  Status: 🟢 OPTIMAL\n"
                 elif miss_rate < 10:
                     stats_text += f"  Status: 🟡 ACCEPTABLE\n"
@@ -949,13 +1332,17 @@ class MultiTaskAvionicsGUI:
         stats_text += f"\n{'PRIORITY ANALYSIS:'}\n"
         stats_text += f"{'-'*60}\n"
         
-        total_high_priority_execs = sum(task_stats.get(i, {'count': 0})['count'] for i in [0, 1])
-        total_low_priority_execs = sum(task_stats.get(i, {'count': 0})['count'] for i in [2, 3, 4])
+        # The registry is ordered by priority; the first HIGH_PRIORITY_SHARE count as high
+        high_count = max(1, round(len(registry) * HIGH_PRIORITY_SHARE))
+        high_tasks = registry.tasks[:high_count]
+        low_tasks = registry.tasks[high_count:]
+        total_high_priority_execs = sum(task_stats[t.task_id].count for t in high_tasks if t.task_id in task_stats)
+        total_low_priority_execs = sum(task_stats[t.task_id].count for t in low_tasks if t.task_id in task_stats)
         
         if total_low_priority_execs == 0 and total_high_priority_execs > 0:
             stats_text += f"🚨 PRIORITY INVERSION DETECTED!\n"
-            stats_text += f"High-priority tasks (P0, P1) monopolizing CPU\n"
-            stats_text += f"Low-priority tasks (P2, P3, P4) starved\n"
+            stats_text += f"High-priority tasks ({self._priority_list(high_tasks)}) monopolizing CPU\n"
+            stats_text += f"Low-priority tasks ({self._priority_list(low_tasks)}) starved\n"
         elif total_high_priority_execs > total_low_priority_execs * 3:
             stats_text += f"⚠️  HIGH PRIORITY DOMINANCE\n"
             stats_text += f"High-priority: {total_high_priority_execs} executions\n"
@@ -964,6 +1351,15 @@ class MultiTaskAvionicsGUI:
             stats_text += f"✅ BALANCED EXECUTION\n"
             stats_text += f"Priority scheduling working correctly\n"
         
+        return stats_text
+        
+    def show_execution_statistics(self, parent_frame, exec_log, registry=None, summary=None):
+        """Show execution statistics summary with enhanced details; returns the text widget"""
+        # Calculate comprehensive statistics in one columnar pass
+        if summary is None:
+            summary = compute_statistics(exec_log)
+        stats_text = self.format_execution_statistics(summary, registry)
+        
         # Display enhanced statistics
         stats_frame = tk.Frame(parent_frame, relief="sunken", bd=2)
         stats_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -983,19 +1379,76 @@ class MultiTaskAvionicsGUI:
         
         stats_text_widget.insert("1.0", stats_text)
         stats_text_widget.config(state="disabled")  # Make read-only
+        return stats_text_widget
+        
+    @staticmethod
+    def replace_text(widget, text):
+        """Replace the contents of a read-only Text widget"""
+        widget.config(state="normal")
+        widget.delete("1.0", tk.END)
+        widget.insert("1.0", text)
+        widget.config(state="disabled")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-Task Avionics Simulator GUI")
+    parser.add_argument("--source", choices=sorted(TELEMETRY_SOURCES), default="proc",
+                        help="telemetry backend (default: proc)")
+    parser.add_argument("--path", help="proc file, status dump or capture to read")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="simulator time multiplier (sim source only)")
+    parser.add_argument("--runtime", type=int, default=0,
+                        help="simulated system_runtime_sec (sim source only, 0=infinite)")
+    parser.add_argument("--record", metavar="LOG",
+                        help="record every execution to LOG in the background")
+    parser.add_argument("--record-rate", type=float, default=10.0,
+                        help="recorder polls per second (default: 10)")
+    parser.add_argument("--monitor", action="store_true",
+                        help="terminal monitor instead of the GUI (default when there is no display)")
+    parser.add_argument("--monitor-rate", type=float, default=20.0,
+                        help="terminal monitor refreshes per second (default: 20)")
+    parser.add_argument("--metrics-port", type=int,
+                        help="also serve Prometheus/OpenMetrics metrics on this port")
+    parser.add_argument("--perf", action="store_true",
+                        help="time the read/parse/update/draw stages (see the Performance panel)")
+    parser.add_argument("--perf-dump", metavar="JSON",
+                        help="write the stage timings to JSON on exit (implies --perf)")
+    return parser.parse_args(argv)
+
+def build_source(args):
+    """Create the telemetry source selected on the command line"""
+    if args.source == "sim":
+        return create_source("sim", speed=args.speed, runtime_sec=args.runtime)
+    return create_source(args.source, args.path)
 
 if __name__ == "__main__":
+    args = parse_args()
+    try:
+        source = build_source(args)
+    except TelemetryError as e:
+        raise SystemExit(f"Could not open telemetry source: {e}")
+
+    if args.metrics_port:
+        try:
+            MetricsExporter(source.reader(), args.metrics_port, poll_sec=1.0).start()
+        except (OSError, TelemetryError) as e:
+            raise SystemExit(f"Could not serve metrics on port {args.metrics_port}: {e}")
+
     # Check for display
-    if os.environ.get('DISPLAY', '') == '':
+    if args.monitor or (os.environ.get('DISPLAY', '') == '' and sys.stdout.isatty()):
+        TextMonitor(source, rate_hz=args.monitor_rate).run()
+    elif os.environ.get('DISPLAY', '') == '':
         print("No display found. Attempting console output...")
         try:
-            with open(PROC_FILE_PATH, 'r') as f:
-                print(f"--- Contents of {PROC_FILE_PATH} ---")
-                print(f.read())
-                print("------------------------------------")
-        except Exception as e:
-            print(f"Could not read {PROC_FILE_PATH}: {e}")
+            print(f"--- Contents of {source.describe()} ---")
+            print(source.read_text())
+            print("------------------------------------")
+        except TelemetryError as e:
+            print(f"Could not read {source.describe()}: {e}")
     else:
         root = tk.Tk()
-        gui = MultiTaskAvionicsGUI(root)
-        root.mainloop() 
\ No newline at end of file
+        perf = PerfRecorder(enabled=args.perf or bool(args.perf_dump))
+        gui = MultiTaskAvionicsGUI(root, source, args.record, args.record_rate, perf)
+        root.mainloop()
+        if args.perf_dump:
+            perf.dump(args.perf_dump)
+            print(f"Stage timings written to {args.perf_dump}") 
\ No newline at end of file
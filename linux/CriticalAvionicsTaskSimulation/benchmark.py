@@ -0,0 +1,384 @@
+"""Benchmarks for the parse -> model -> render pipeline.
+
+Synthetic /proc/avionics_status payloads and execution logs of a given
+size (50, 10k and 1M executions by default) are generated from the
+scheduler model and pushed through every hot path: status parsing, log
+loading, statistics, the interval index, Gantt rendering and the
+snapshot -> task grid update.  Results are written as JSON so runs can
+be diffed; --baseline compares against an earlier run and exits
+non-zero on regressions.
+
+Rendering uses a real Tk canvas when a display is available.  Without
+one (CI, SSH) a HeadlessCanvas that only does the item bookkeeping is
+used instead: item counts are exact, timings then cover the Python side
+of the renderer only.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from exec_index import IntervalIndex
+from exec_stats import compute_statistics, np
+from execlog import BinaryExecLog, BinaryExecLogWriter, ExecLogWriter, format_exec_entry, read_exec_log
+from gantt import GanttChart
+from history import MetricHistory
+from ingest import iter_exec_chunks
+from scheduler_model import SchedulerModel
+from snapshot import ExecEntry, parse_status
+from telemetry import DEFAULT_TASK_SET, FileTelemetrySource, SimulatorTelemetrySource
+
+BENCHMARK_VERSION = 1
+DEFAULT_SIZES = (50, 10000, 1000000)
+
+# The pure-Python statistics engine is only timed up to this size
+PYTHON_STATS_LIMIT = 100000
+
+# Results slower than baseline * (1 + tolerance) count as regressions
+DEFAULT_TOLERANCE = 0.25
+
+
+class HeadlessCanvas:
+    """Item bookkeeping of tk.Canvas without a display
+
+    Supports what GanttChart uses.  `commands` counts the canvas calls
+    a real Tk canvas would have had to process.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.next_id = 1
+        self.commands = 0
+
+    def __getattr__(self, name):
+        if not name.startswith("create_"):
+            raise AttributeError(name)
+        item_type = name[len("create_"):]
+
+        def create(*coords, **options):
+            self.commands += 1
+            item = self.next_id
+            self.next_id += 1
+            self.items[item] = [item_type, coords, options]
+            return item
+        return create
+
+    def coords(self, item, *coords):
+        self.commands += 1
+        if coords:
+            self.items[item][1] = coords
+        return self.items[item][1]
+
+    def itemconfig(self, item, **options):
+        self.commands += 1
+        self.items[item][2].update(options)
+
+    def delete(self, item):
+        self.commands += 1
+        if item == "all":
+            self.items.clear()
+        else:
+            self.items.pop(item, None)
+
+    def tag_raise(self, tag):
+        self.commands += 1
+
+    def configure(self, **options):
+        self.commands += 1
+
+    def bind(self, *args):
+        pass
+
+    def canvasx(self, x):
+        return x
+
+    def find_all(self):
+        return tuple(self.items)
+
+
+def synthetic_exec_log(count, task_set=DEFAULT_TASK_SET):
+    """Yield `count` ExecEntry records from the scheduler model"""
+    model = SchedulerModel(task_set)
+    produced = 0
+    # Far more virtual time than needed; the generator stops at `count`
+    for execution in model.run(2 ** 62):
+        if produced >= count:
+            return
+        yield ExecEntry(*execution)
+        produced += 1
+
+
+def synthetic_status(exec_log, task_set=DEFAULT_TASK_SET):
+    """A status dump in the proc format whose EXEC section is all of exec_log"""
+    simulator = SimulatorTelemetrySource(task_set, clock=lambda: 0.0)
+    simulator.advance_to(5000)
+    header = simulator.render().split("---\nEXECUTION_LOG:\n")[0]
+    return header + "---\nEXECUTION_LOG:\n" + "".join(format_exec_entry(entry) for entry in exec_log)
+
+
+def _time(func, repeat):
+    """Best wall time of `repeat` calls (s) and the last return value"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def _result(name, size, seconds, throughput=True, **extra):
+    result = {'name': name, 'size': size, 'seconds': round(seconds, 6)}
+    if throughput and size and seconds > 0:
+        result['per_sec'] = round(size / seconds, 1)
+    result.update(extra)
+    return result
+
+
+def open_display():
+    """A Tk root for render benchmarks, or None when there is no display"""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    root.withdraw()
+    return root
+
+
+def bench_size(size, workdir, repeat=3, root=None):
+    """Run every benchmark for one log size; returns a list of result dicts"""
+    results = []
+    text_path = os.path.join(workdir, f"exec_{size}.log")
+    binary_path = os.path.join(workdir, f"exec_{size}.bin")
+    status_path = os.path.join(workdir, f"status_{size}.txt")
+
+    # Generate the inputs once: a text log, a binary log and a status dump
+    entries = list(synthetic_exec_log(size))
+    for writer in (ExecLogWriter(text_path), BinaryExecLogWriter(binary_path)):
+        writer.write(entries)
+        writer.close()
+    payload = synthetic_status(entries)
+    with open(status_path, 'w') as f:
+        f.write(payload)
+    del entries
+
+    seconds, _ = _time(lambda: parse_status(payload), repeat)
+    results.append(_result("parse_status", size, seconds,
+                           mb_per_sec=round(len(payload) / seconds / 1e6, 2)))
+    payload = None
+
+    seconds, _ = _time(lambda: list(read_exec_log(text_path)), repeat)
+    results.append(_result("read_text_log", size, seconds))
+
+    # Chunked loading: time to the first chunk (first frame) and to the end
+    for name, path in (("ingest_text", text_path), ("ingest_binary", binary_path)):
+        seconds, _ = _time(lambda: next(iter_exec_chunks(path)), repeat)
+        results.append(_result(f"{name}_first", size, seconds, throughput=False))
+        seconds, _ = _time(lambda: sum(len(entries) for entries, _ in iter_exec_chunks(path)), repeat)
+        results.append(_result(name, size, seconds))
+
+    exec_log = BinaryExecLog(binary_path)
+    try:
+        seconds, _ = _time(lambda: sum(1 for _ in exec_log), repeat)
+        results.append(_result("scan_binary_log", size, seconds))
+
+        seconds, _ = _time(lambda: compute_statistics(exec_log), repeat)
+        results.append(_result("statistics", size, seconds,
+                               engine="numpy" if np is not None else "python"))
+        if np is not None and size <= PYTHON_STATS_LIMIT:
+            seconds, _ = _time(lambda: compute_statistics(exec_log, use_numpy=False), repeat)
+            results.append(_result("statistics_python", size, seconds, engine="python"))
+
+        seconds, index = _time(lambda: IntervalIndex(exec_log), repeat)
+        results.append(_result("interval_index", size, seconds))
+
+        results += bench_gantt(index, repeat, root)
+        if root is not None:
+            results += bench_statistics_report(exec_log, status_path, repeat, root)
+    finally:
+        exec_log.close()
+
+    results += bench_snapshot(status_path, repeat, root)
+    return results
+
+
+def bench_gantt(index, repeat, root=None):
+    """First frame, an unchanged frame and a zoomed frame of the Gantt chart"""
+    size = len(index)
+    if root is not None:
+        import tkinter as tk
+        canvas = tk.Canvas(root, width=1400, height=500)
+    else:
+        canvas = HeadlessCanvas()
+    chart = GanttChart(canvas)
+    chart.index = index
+
+    def frame(name, render):
+        commands = getattr(canvas, 'commands', None)
+        seconds, _ = _time(render, 1)
+        if root is not None:
+            started = time.perf_counter()
+            root.update_idletasks()
+            seconds += time.perf_counter() - started
+        extra = {'canvas_items': len(canvas.find_all()), 'visible_items': chart.item_count()}
+        if commands is not None:
+            extra['canvas_commands'] = canvas.commands - commands
+        return _result(name, size, seconds, throughput=False, **extra)
+
+    results = [frame("gantt_first_frame", chart.render)]
+    steady = [frame("gantt_steady_frame", chart.render) for _ in range(repeat)]
+    results.append(min(steady, key=lambda result: result['seconds']))
+    span = index.span()
+    if span is not None:
+        # One second of timeline in the middle of the log
+        middle = (span[0] + span[1]) / 2
+        results.append(frame("gantt_zoomed_frame",
+                             lambda: chart._set_view(middle - 500, middle + 500)))
+        results.append(frame("gantt_pan_frame", lambda: chart.pan(200)))
+    if root is not None:
+        canvas.destroy()
+    return results
+
+
+def _open_gui(root, source):
+    """A main window on `source` with its telemetry worker stopped"""
+    import tkinter as tk
+    from avionics_gui import MultiTaskAvionicsGUI
+
+    window = tk.Toplevel(root)
+    gui = MultiTaskAvionicsGUI(window, source)
+    gui.worker.stop()
+    return window, gui
+
+
+def bench_statistics_report(exec_log, status_path, repeat, root):
+    """The Gantt window's text report (statistics pass plus Tk text widget)"""
+    import tkinter as tk
+
+    window, gui = _open_gui(root, FileTelemetrySource(status_path))
+    frame = tk.Frame(window)
+
+    def report():
+        gui.show_execution_statistics(frame, exec_log)
+        window.update_idletasks()
+
+    seconds, _ = _time(report, repeat)
+    window.destroy()
+    return [_result("statistics_report", len(exec_log), seconds)]
+
+
+def bench_snapshot(status_path, repeat, root=None):
+    """Read + parse + apply of one status dump
+
+    With a display this is snapshot-to-screen: the full GUI update_data()
+    and Tk's idle redraw.  Without one only the model side (history) runs.
+    """
+    source = FileTelemetrySource(status_path)
+    size = len(parse_status(source.read_text()).exec_log)
+    if root is None:
+        history = MetricHistory()
+        seconds, _ = _time(lambda: history.update(parse_status(source.read_text())), repeat)
+        return [_result("snapshot_to_model", size, seconds, throughput=False)]
+
+    window, gui = _open_gui(root, source)
+
+    def update():
+        gui.update_data(parse_status(source.read_text()))
+        window.update_idletasks()
+
+    seconds, _ = _time(update, repeat)
+    window.destroy()
+    return [_result("snapshot_to_screen", size, seconds, throughput=False)]
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=3, headless=False, progress=None):
+    """Run every benchmark for every size; returns the JSON-ready report"""
+    root = None if headless else open_display()
+    report = {
+        'benchmark': "avionics-pipeline",
+        'version': BENCHMARK_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__ if np is not None else None,
+        'canvas': "tk" if root is not None else "headless",
+        'repeat': repeat,
+        'results': [],
+    }
+    try:
+        with tempfile.TemporaryDirectory(prefix="avionics-bench-") as workdir:
+            for size in sizes:
+                for result in bench_size(size, workdir, repeat, root):
+                    report['results'].append(result)
+                    if progress:
+                        progress(result)
+    finally:
+        if root is not None:
+            root.destroy()
+    return report
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """(name, size, baseline s, current s) for every result slower than allowed"""
+    previous = {(r['name'], r['size']): r['seconds'] for r in baseline.get('results', [])}
+    regressions = []
+    for result in report['results']:
+        before = previous.get((result['name'], result['size']))
+        if before and result['seconds'] > before * (1 + tolerance):
+            regressions.append((result['name'], result['size'], before, result['seconds']))
+    return regressions
+
+
+def format_result(result):
+    line = f"{result['name']:<20} {result['size']:>9}  {result['seconds'] * 1000:10.2f} ms"
+    if 'per_sec' in result:
+        line += f"  {result['per_sec']:>14,.0f}/s"
+    if 'canvas_items' in result:
+        line += f"  items {result['canvas_items']} ({result['visible_items']} visible)"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the parse -> model -> render pipeline")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="execution log sizes (default: 50,10000,1000000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, best is kept (default: 3)")
+    parser.add_argument("--headless", action="store_true",
+                        help="never open a display; render into a HeadlessCanvas")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown against the baseline (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    report = run_benchmarks(sizes, args.repeat, args.headless,
+                            progress=lambda result: print(format_result(result), file=sys.stderr))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+        print(f"Report written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        for name, size, before, after in regressions:
+            print(f"REGRESSION {name} [{size}]: {before * 1000:.2f} ms -> {after * 1000:.2f} ms",
+                  file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
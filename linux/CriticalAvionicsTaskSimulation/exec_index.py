@@ -0,0 +1,435 @@
+"""Time-interval index over the execution log.
+
+Executions are kept per task, sorted by start time, in flat columns
+(start, duration, deadline result) so a viewport query is two bisects
+plus a short scan instead of a pass over the whole log, and the index
+costs a few bytes per execution rather than a Python object each.
+The start times of missed executions are kept per task as well, so
+stepping to the next or previous miss is one bisect per task.
+
+For zoomed-out views each task also keeps a multi-resolution summary:
+fixed-width time buckets (first start, latest end, executions, misses)
+at SUMMARY_BUCKET_MS, then coarser levels each SUMMARY_FANOUT times as
+wide.  summary() answers a view from the coarsest level that is still
+finer than a pixel, so a frame costs the same for a minute or a week.
+"""
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import namedtuple
+from heapq import merge
+
+from snapshot import ExecEntry
+
+
+# Higher-priority executions listed in a miss context, at most
+MISS_CONTEXT_LIMIT = 20
+
+# Width of the finest summary buckets; views with fewer milliseconds per
+# pixel than this are drawn from the executions themselves
+SUMMARY_BUCKET_MS = 1024
+
+# Buckets of one summary level merged into one of the next
+SUMMARY_FANOUT = 4
+
+# A run of executions of one task drawn as a single bar
+Span = namedtuple('Span', ['task_type', 'start_time', 'end_time', 'count', 'misses'])
+
+# A deadline miss with what ran before it: the task's previous execution
+# (or None), and the higher-priority executions between the end of that
+# and the end of the miss, latest last; `blocked` is their total time,
+# counted over all of them even when the list is truncated
+MissContext = namedtuple('MissContext', ['miss', 'previous', 'blockers', 'blocked', 'truncated'])
+
+
+class _Buckets:
+    """One summary level: executions grouped into buckets `width` ms wide
+
+    Only non-empty buckets are stored, in time order; a bucket's number
+    is its first start // width.  `consumed` counts the buckets of the
+    next finer level already folded into this one.
+    """
+    __slots__ = ('width', 'starts', 'ends', 'counts', 'misses', 'consumed')
+
+    def __init__(self, width):
+        self.width = width
+        self.starts = array('q')
+        self.ends = array('q')
+        self.counts = array('q')
+        self.misses = array('q')
+        self.consumed = 0
+
+    def copy(self):
+        other = _Buckets(self.width)
+        for name in ('starts', 'ends', 'counts', 'misses'):
+            setattr(other, name, array('q', getattr(self, name)))
+        other.consumed = self.consumed
+        return other
+
+    def append(self, start, end, count, misses):
+        self.starts.append(start)
+        self.ends.append(end)
+        self.counts.append(count)
+        self.misses.append(misses)
+
+    def add(self, start, end, count, misses):
+        """Fold executions into the newest bucket, or start one; starts arrive in order"""
+        starts = self.starts
+        if starts and start // self.width == starts[-1] // self.width:
+            if end > self.ends[-1]:
+                self.ends[-1] = end
+            self.counts[-1] += count
+            self.misses[-1] += misses
+        else:
+            self.append(start, end, count, misses)
+
+    def spans(self, task_id, pos, t0, t1):
+        """Buckets from position pos on that overlap [t0, t1], as Spans"""
+        starts = self.starts
+        ends = self.ends
+        hi = bisect_right(starts, t1)
+        return [Span(task_id, starts[i], ends[i], self.counts[i], self.misses[i])
+                for i in range(pos, hi) if ends[i] >= t0]
+
+
+class _TaskIntervals:
+    __slots__ = ('starts', 'durations', 'met', 'max_duration', 'misses', 'levels', 'summarized')
+
+    def __init__(self):
+        self.starts = array('q')
+        self.durations = array('q')
+        self.met = bytearray()
+        self.max_duration = 0
+        # Start times of the missed executions, sorted
+        self.misses = array('q')
+        self.forget_summary()
+
+    def forget_summary(self):
+        # Summary levels, finest first, and how many executions they cover;
+        # summarize() catches them up when a view needs them
+        self.levels = [_Buckets(SUMMARY_BUCKET_MS)]
+        self.summarized = 0
+
+    def copy(self):
+        other = _TaskIntervals()
+        other.starts = array('q', self.starts)
+        other.durations = array('q', self.durations)
+        other.met = bytearray(self.met)
+        other.max_duration = self.max_duration
+        other.misses = array('q', self.misses)
+        other.levels = [level.copy() for level in self.levels]
+        other.summarized = self.summarized
+        return other
+
+    def summarize(self):
+        """Bring the summary up to date with the executions added since the last call"""
+        if self.summarized < len(self.starts):
+            self._bucket_new()
+        self._coarsen()
+
+    def _bucket_new(self):
+        """Add the unsummarized executions to the level 0 buckets"""
+        buckets = self.levels[0]
+        starts, durations, met = self.starts, self.durations, self.met
+        width = buckets.width
+        first = self.summarized
+        # Reopen the newest bucket, which the new executions may extend
+        if buckets.starts:
+            end = buckets.ends.pop()
+            first -= buckets.counts.pop()
+            buckets.starts.pop()
+            buckets.misses.pop()
+        else:
+            end = starts[first] + durations[first]
+        limit = (starts[first] // width + 1) * width
+        add_start, add_end = buckets.starts.append, buckets.ends.append
+        add_count, add_misses = buckets.counts.append, buckets.misses.append
+        for pos in range(first, len(starts)):
+            start = starts[pos]
+            if start >= limit:
+                # Executions are sorted, so a bucket closes once a later one begins
+                add_start(starts[first])
+                add_end(end)
+                add_count(pos - first)
+                add_misses(met.count(0, first, pos))
+                first = pos
+                end = start + durations[pos]
+                limit = (start // width + 1) * width
+            elif start + durations[pos] > end:
+                end = start + durations[pos]
+        buckets.append(starts[first], end, len(starts) - first, met.count(0, first, len(starts)))
+        self.summarized = len(starts)
+
+    def _coarsen(self):
+        """Fold finished buckets into the coarser levels, adding levels while they help"""
+        levels = self.levels
+        k = 1
+        while True:
+            finer = levels[k - 1]
+            # The finer level's last bucket may still grow; leave it for later
+            done = len(finer.starts) - 1
+            if k == len(levels):
+                if done < 2 * SUMMARY_FANOUT:
+                    return
+                levels.append(_Buckets(finer.width * SUMMARY_FANOUT))
+            level = levels[k]
+            starts, ends, counts, misses = finer.starts, finer.ends, finer.counts, finer.misses
+            width = level.width
+            pos = level.consumed
+            while pos < done:
+                # The finer buckets under one coarse bucket are one slice
+                hi = bisect_left(starts, (starts[pos] // width + 1) * width, pos, done)
+                level.add(starts[pos], max(ends[pos:hi]), sum(counts[pos:hi]), sum(misses[pos:hi]))
+                pos = hi
+            level.consumed = max(level.consumed, done)
+            k += 1
+
+    def entry(self, task_id, pos):
+        return ExecEntry(task_id, self.starts[pos], self.durations[pos], bool(self.met[pos]))
+
+
+class IntervalIndex:
+    """Per-task sorted interval index with bisect lookups
+
+    Entries are ExecEntry-like records (task_type, start_time, duration,
+    deadline_met).  Adding an execution that is already indexed (same
+    task and start time) is a no-op, so overlapping EXEC windows from
+    successive snapshots can be fed in as they arrive.
+    """
+
+    def __init__(self, entries=()):
+        self.tasks = {}
+        self.count = 0
+        self.miss_count = 0
+        self.min_time = None
+        self.max_time = None
+        self.extend(entries)
+
+    def __len__(self):
+        return self.count
+
+    def copy(self):
+        """Independent snapshot of the index (column copies, no per-execution objects)"""
+        other = IntervalIndex()
+        other.tasks = {task_id: intervals.copy() for task_id, intervals in self.tasks.items()}
+        other.count = self.count
+        other.miss_count = self.miss_count
+        other.min_time = self.min_time
+        other.max_time = self.max_time
+        return other
+
+    def add(self, entry):
+        """Index one execution; returns False if it was already present"""
+        intervals = self.tasks.get(entry.task_type)
+        if intervals is None:
+            intervals = self.tasks[entry.task_type] = _TaskIntervals()
+
+        starts = intervals.starts
+        start = entry.start_time
+        in_order = not starts or start > starts[-1]
+        if in_order:
+            # Common case: executions arrive in time order
+            starts.append(start)
+            intervals.durations.append(entry.duration)
+            intervals.met.append(1 if entry.deadline_met else 0)
+        else:
+            pos = bisect_left(starts, start)
+            if pos < len(starts) and starts[pos] == start:
+                return False
+            starts.insert(pos, start)
+            intervals.durations.insert(pos, entry.duration)
+            intervals.met.insert(pos, 1 if entry.deadline_met else 0)
+
+        if not entry.deadline_met:
+            if not intervals.misses or start > intervals.misses[-1]:
+                intervals.misses.append(start)
+            else:
+                insort(intervals.misses, start)
+            self.miss_count += 1
+        if entry.duration > intervals.max_duration:
+            intervals.max_duration = entry.duration
+        end = start + entry.duration
+
+        if not in_order and pos < intervals.summarized:
+            # Lands among executions already summarized; summarize afresh
+            intervals.forget_summary()
+        if self.min_time is None or start < self.min_time:
+            self.min_time = start
+        if self.max_time is None or end > self.max_time:
+            self.max_time = end
+        self.count += 1
+        return True
+
+    def extend(self, entries):
+        """Index several executions; returns how many were new"""
+        added = 0
+        for entry in entries:
+            if self.add(entry):
+                added += 1
+        return added
+
+    def task_ids(self):
+        return sorted(self.tasks)
+
+    def span(self):
+        """(first start, last end) over every task, or None when empty"""
+        if self.min_time is None:
+            return None
+        return self.min_time, self.max_time
+
+    def query(self, task_id, t0, t1):
+        """Executions of task_id overlapping [t0, t1], in start order"""
+        intervals = self.tasks.get(task_id)
+        if intervals is None:
+            return []
+        starts = intervals.starts
+        # Nothing starting before t0 - max_duration can still be running at t0
+        lo = bisect_left(starts, t0 - intervals.max_duration)
+        hi = bisect_right(starts, t1)
+        durations = intervals.durations
+        return [intervals.entry(task_id, pos) for pos in range(lo, hi)
+                if starts[pos] + durations[pos] >= t0]
+
+    def summary(self, task_id, t0, t1, resolution):
+        """Spans of task_id overlapping [t0, t1] from buckets at most `resolution` ms wide
+
+        Returns None when resolution is finer than SUMMARY_BUCKET_MS (use
+        query() instead).  Each span is one bucket: its first start, the
+        latest end and how many executions and misses it holds.
+        """
+        if resolution < SUMMARY_BUCKET_MS:
+            return None
+        intervals = self.tasks.get(task_id)
+        if intervals is None:
+            return []
+        intervals.summarize()
+        levels = intervals.levels
+        top = 0
+        while top + 1 < len(levels) and levels[top + 1].width <= resolution:
+            top += 1
+        # The chosen level covers the finer buckets it has consumed; the
+        # rest of the timeline comes from the finer levels, in time order
+        lower = t0 - intervals.max_duration
+        spans = []
+        pos = None
+        for k in range(top, -1, -1):
+            level = levels[k]
+            first = bisect_left(level.starts, lower // level.width * level.width)
+            if pos is not None:
+                first = max(first, pos)
+            spans += level.spans(task_id, first, t0, t1)
+            pos = level.consumed
+        return spans
+
+    def query_all(self, t0, t1):
+        """{task_id: executions overlapping [t0, t1]} for every task"""
+        return {task_id: self.query(task_id, t0, t1) for task_id in self.tasks}
+
+    def entries(self, task_id):
+        """All executions of one task, in start order"""
+        intervals = self.tasks.get(task_id)
+        if intervals is None:
+            return
+        for pos in range(len(intervals.starts)):
+            yield intervals.entry(task_id, pos)
+
+    def ordered(self):
+        """Every execution in start order, merged lazily across tasks"""
+        return merge(*(self.entries(task_id) for task_id in self.task_ids()),
+                     key=lambda entry: entry.start_time)
+
+    # --- Deadline misses ---
+    def misses(self, task_id):
+        """Start times of task_id's missed executions, in order"""
+        intervals = self.tasks.get(task_id)
+        return intervals.misses if intervals is not None else array('q')
+
+    def find(self, task_id, start_time):
+        """The execution of task_id starting at start_time, or None"""
+        intervals = self.tasks.get(task_id)
+        if intervals is None:
+            return None
+        pos = bisect_left(intervals.starts, start_time)
+        if pos < len(intervals.starts) and intervals.starts[pos] == start_time:
+            return intervals.entry(task_id, pos)
+        return None
+
+    def next_miss(self, time_ms, task_id=None, task_ids=None):
+        """First miss after time_ms, or None
+
+        Misses are ordered by (start time, task id); pass the task_id of
+        the current miss to step past it to one starting at the same time.
+        task_ids limits the search to those tasks.
+        """
+        best = None
+        for candidate in (self.tasks if task_ids is None else task_ids):
+            misses = self.misses(candidate)
+            if task_id is None or candidate <= task_id:
+                pos = bisect_right(misses, time_ms)
+            else:
+                pos = bisect_left(misses, time_ms)
+            if pos < len(misses) and (best is None or (misses[pos], candidate) < best):
+                best = (misses[pos], candidate)
+        return self.find(best[1], best[0]) if best else None
+
+    def previous_miss(self, time_ms, task_id=None, task_ids=None):
+        """Last miss before time_ms, or None; see next_miss()"""
+        best = None
+        for candidate in (self.tasks if task_ids is None else task_ids):
+            misses = self.misses(candidate)
+            if task_id is None or candidate >= task_id:
+                pos = bisect_left(misses, time_ms) - 1
+            else:
+                pos = bisect_right(misses, time_ms) - 1
+            if pos >= 0 and (best is None or (misses[pos], candidate) > best):
+                best = (misses[pos], candidate)
+        return self.find(best[1], best[0]) if best else None
+
+    def miss_position(self, miss, task_ids=None):
+        """1-based position of a miss among all misses (of task_ids), by (start, task)"""
+        position = 1
+        for candidate in (self.tasks if task_ids is None else task_ids):
+            misses = self.misses(candidate)
+            if candidate < miss.task_type:
+                position += bisect_right(misses, miss.start_time)
+            else:
+                position += bisect_left(misses, miss.start_time)
+        return position
+
+    def previous_execution(self, entry):
+        """The execution of the same task before entry, or None"""
+        intervals = self.tasks.get(entry.task_type)
+        if intervals is None:
+            return None
+        pos = bisect_left(intervals.starts, entry.start_time) - 1
+        return intervals.entry(entry.task_type, pos) if pos >= 0 else None
+
+    def miss_context(self, miss, higher_task_ids, limit=MISS_CONTEXT_LIMIT):
+        """MissContext of a miss: what higher-priority tasks ran since the task last did"""
+        previous = self.previous_execution(miss)
+        window_start = previous.start_time + previous.duration if previous else miss.start_time
+        window_end = miss.start_time + miss.duration
+        blockers = []
+        blocked = 0
+        truncated = False
+        for task_id in higher_task_ids:
+            intervals = self.tasks.get(task_id)
+            if intervals is None:
+                continue
+            starts = intervals.starts
+            durations = intervals.durations
+            lo = bisect_left(starts, window_start - intervals.max_duration)
+            hi = bisect_left(starts, window_end)
+            # The blocked time counts every overlapping execution; only the
+            # latest `limit` of each task can make the displayed list
+            overlapping = [pos for pos in range(lo, hi) if starts[pos] + durations[pos] > window_start]
+            blocked += sum(min(starts[pos] + durations[pos], window_end) - max(starts[pos], window_start)
+                           for pos in overlapping)
+            if len(overlapping) > limit:
+                overlapping = overlapping[-limit:]
+                truncated = True
+            blockers.extend(intervals.entry(task_id, pos) for pos in overlapping)
+        blockers.sort(key=lambda entry: entry.start_time)
+        if len(blockers) > limit:
+            blockers = blockers[-limit:]
+            truncated = True
+        return MissContext(miss, previous, blockers, blocked, truncated)
@@ -0,0 +1,222 @@
+"""Columnar statistics over the execution log.
+
+compute_statistics() turns an execution log into per-task counts,
+duration percentiles, start jitter and duration histograms in one
+batched pass.  NumPy is used when it is installed (binary logs are then
+read straight out of the mmap without copying); otherwise the same
+numbers are computed in pure Python.
+"""
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Upper edges (ms) of the duration histogram buckets; the last is open ended
+HISTOGRAM_EDGES_MS = (10, 20, 50, 100, 200, 500, 1000)
+
+PERCENTILES = (50, 95, 99)
+
+TaskStats = namedtuple('TaskStats', [
+    'task_type', 'count', 'misses', 'total_time',
+    'min_duration', 'mean_duration', 'max_duration',
+    'p50', 'p95', 'p99',
+    'jitter',       # standard deviation of the interval between starts (ms)
+    'histogram',    # counts per HISTOGRAM_EDGES_MS bucket, plus overflow
+])
+
+
+class ExecutionStatistics(namedtuple('ExecutionStatistics', [
+        'total_executions', 'total_misses', 'timeline_start', 'timeline_end', 'tasks'])):
+    """Whole-log totals plus a {task_type: TaskStats} mapping"""
+
+    __slots__ = ()
+
+    @property
+    def timeline_duration(self):
+        return self.timeline_end - self.timeline_start
+
+    def utilization(self, task_type):
+        """Share of the timeline spent executing task_type, in percent"""
+        stats = self.tasks.get(task_type)
+        if stats is None or self.timeline_duration <= 0:
+            return 0.0
+        return stats.total_time / self.timeline_duration * 100
+
+
+def histogram_labels():
+    """Human readable names for the histogram buckets"""
+    labels = []
+    lower = 0
+    for edge in HISTOGRAM_EDGES_MS:
+        labels.append(f"{lower}-{edge}ms")
+        lower = edge
+    labels.append(f">{lower}ms")
+    return labels
+
+
+# --- NumPy engine ---
+if np is not None:
+    _RECORD_DTYPE = np.dtype([('start', '<i8'), ('duration', '<i4'),
+                              ('task', '<u2'), ('met', 'u1'), ('pad', 'u1')])
+    # One ExecEntry (task_type, start_time, duration, deadline_met) per row
+    _ENTRY_DTYPE = np.dtype([('task', np.int64), ('start', np.int64),
+                             ('duration', np.int64), ('met', bool)])
+
+
+def exec_columns(exec_log):
+    """(task, start, duration, met) NumPy columns for an execution log
+
+    Binary logs (anything with a `records` buffer) are viewed in place;
+    other sequences are converted once.
+    """
+    records = getattr(exec_log, 'records', None)
+    if records is not None and len(records):
+        table = np.frombuffer(records, dtype=_RECORD_DTYPE)
+        return table['task'], table['start'], table['duration'], table['met'].astype(bool)
+    # One pass over the entries, filling all four columns at C speed
+    table = np.fromiter(exec_log, dtype=_ENTRY_DTYPE, count=len(exec_log))
+    return table['task'], table['start'], table['duration'], table['met']
+
+
+def _task_stats_numpy(task_id, sorted_starts, durations, misses):
+    p50, p95, p99 = np.percentile(durations, PERCENTILES).tolist()
+    intervals = np.diff(sorted_starts)
+    histogram = np.bincount(np.searchsorted(np.asarray(HISTOGRAM_EDGES_MS), durations, side='left'),
+                            minlength=len(HISTOGRAM_EDGES_MS) + 1)
+    return TaskStats(
+        task_id, len(durations), misses, int(durations.sum()),
+        int(durations.min()), float(durations.mean()), int(durations.max()),
+        p50, p95, p99,
+        float(intervals.std()) if len(intervals) else 0.0,
+        tuple(histogram.tolist()),
+    )
+
+
+def _compute_numpy(exec_log):
+    task, start, duration, met = exec_columns(exec_log)
+    if not len(task):
+        return ExecutionStatistics(0, 0, 0, 0, {})
+
+    # Group by task once; stable sort keeps each task's executions in log order
+    order = np.argsort(task, kind='stable')
+    task_sorted = task[order]
+    ids, first, counts = np.unique(task_sorted, return_index=True, return_counts=True)
+    missed = ~met
+
+    tasks = {}
+    for task_id, lo, count in zip(ids.tolist(), first.tolist(), counts.tolist()):
+        rows = order[lo:lo + count]
+        tasks[task_id] = _task_stats_numpy(task_id, np.sort(start[rows]), duration[rows],
+                                           int(missed[rows].sum()))
+
+    return ExecutionStatistics(len(task), int(missed.sum()),
+                               int(start.min()), int((start + duration).max()), tasks)
+
+
+# --- Pure Python engine ---
+def percentile(sorted_values, q):
+    """Linear interpolation between closest ranks (NumPy's default)"""
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _task_stats_python(task_id, sorted_starts, durations, misses):
+    values = sorted(durations)
+    count = len(values)
+    intervals = [b - a for a, b in zip(sorted_starts, sorted_starts[1:])]
+    if intervals:
+        mean_interval = sum(intervals) / len(intervals)
+        jitter = (sum((i - mean_interval) ** 2 for i in intervals) / len(intervals)) ** 0.5
+    else:
+        jitter = 0.0
+    histogram = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+    for value in values:
+        bucket = 0
+        while bucket < len(HISTOGRAM_EDGES_MS) and value > HISTOGRAM_EDGES_MS[bucket]:
+            bucket += 1
+        histogram[bucket] += 1
+    total = sum(values)
+    return TaskStats(
+        task_id, count, misses, total,
+        values[0], total / count, values[-1],
+        *(percentile(values, q) for q in PERCENTILES),
+        jitter, tuple(histogram),
+    )
+
+
+def _compute_python(exec_log):
+    durations = {}
+    starts = {}
+    misses = {}
+    total_misses = 0
+    timeline_start = None
+    timeline_end = None
+
+    for entry in exec_log:
+        task_id = entry.task_type
+        if task_id not in durations:
+            durations[task_id] = []
+            starts[task_id] = []
+            misses[task_id] = 0
+        durations[task_id].append(entry.duration)
+        starts[task_id].append(entry.start_time)
+        if not entry.deadline_met:
+            misses[task_id] += 1
+            total_misses += 1
+        end = entry.start_time + entry.duration
+        if timeline_start is None or entry.start_time < timeline_start:
+            timeline_start = entry.start_time
+        if timeline_end is None or end > timeline_end:
+            timeline_end = end
+
+    tasks = {task_id: _task_stats_python(task_id, sorted(starts[task_id]), durations[task_id],
+                                         misses[task_id])
+             for task_id in sorted(durations)}
+
+    if timeline_start is None:
+        return ExecutionStatistics(0, 0, 0, 0, {})
+    return ExecutionStatistics(sum(len(v) for v in durations.values()), total_misses,
+                               timeline_start, timeline_end, tasks)
+
+
+def index_statistics(index, use_numpy=None):
+    """compute_statistics() for an IntervalIndex, read from its per-task columns
+
+    The index already holds each task's starts in order, so this works
+    while a recording is still being loaded into it, without a second
+    copy of the log.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    tasks = {}
+    for task_id in index.task_ids():
+        intervals = index.tasks[task_id]
+        if not len(intervals.starts):
+            continue
+        misses = len(intervals.met) - sum(intervals.met)
+        if use_numpy:
+            tasks[task_id] = _task_stats_numpy(task_id, np.array(intervals.starts, dtype=np.int64),
+                                               np.array(intervals.durations, dtype=np.int64), misses)
+        else:
+            tasks[task_id] = _task_stats_python(task_id, intervals.starts, intervals.durations, misses)
+    span = index.span()
+    if span is None:
+        return ExecutionStatistics(0, 0, 0, 0, {})
+    return ExecutionStatistics(len(index), sum(stats.misses for stats in tasks.values()),
+                               span[0], span[1], tasks)
+
+
+def compute_statistics(exec_log, use_numpy=None):
+    """Per-task statistics for an execution log (any sequence of ExecEntry)"""
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return _compute_numpy(exec_log)
+    return _compute_python(exec_log)
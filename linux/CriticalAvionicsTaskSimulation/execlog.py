@@ -0,0 +1,380 @@
+"""Persistent execution-log recording.
+
+The kernel module only shows the last 50 EXEC lines of its log, so a
+1 s GUI poll loses everything that scrolls past in between.  The
+recorder polls a telemetry source in a background thread, keeps only
+executions it has not seen before and appends them to an on-disk log
+that outlives the /proc window.
+
+Two on-disk formats are supported:
+
+* text -- the proc format's own `EXEC:<type>,<start>,<duration>,<MET|MISSED>`
+  lines, which can also be replayed as status dumps;
+* binary (`.bin`) -- a 16 byte header followed by fixed-width 16 byte
+  records, written append-only and read back zero-copy through mmap.
+"""
+import argparse
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import deque
+
+from snapshot import ExecEntry
+
+
+class ExecWindowMerger:
+    """Filters overlapping EXEC windows down to new executions
+
+    Successive reads return overlapping slices of the kernel log.  An
+    execution is identified by (start_time_ms, task_type); the merger
+    remembers the keys of the last `memory` executions and rejects
+    anything it has seen or that is older than everything it remembers.
+
+    A module reload or simulator reset restarts the timestamps from zero.
+    That is detected when ExecutionLogCount goes down or the newest
+    execution of a window is older than the newest one already seen;
+    the merger then forgets its state and counts a restart.
+    """
+
+    def __init__(self, memory=256):
+        self.memory = memory
+        self.gaps = 0
+        self.restarts = 0
+        self._forget()
+
+    def _forget(self):
+        self.recent = deque()
+        self.recent_keys = set()
+        self.high_water = None
+        self.log_count = None
+
+    def _restarted(self, exec_log, log_count):
+        if log_count is not None and self.log_count is not None and log_count < self.log_count:
+            return True
+        return (self.high_water is not None and bool(exec_log)
+                and max(entry.start_time for entry in exec_log) < self.high_water)
+
+    def merge(self, exec_log, log_count=None):
+        """Return the entries of exec_log not returned by an earlier call
+
+        log_count is the snapshot's ExecutionLogCount, when known.
+        """
+        if self._restarted(exec_log, log_count):
+            self._forget()
+            self.restarts += 1
+        if log_count is not None:
+            self.log_count = log_count
+        new_entries = []
+        for entry in exec_log:
+            key = (entry.start_time, entry.task_type)
+            if key in self.recent_keys:
+                continue
+            if self.recent and entry.start_time < self.recent[0][0]:
+                continue
+            new_entries.append(entry)
+            self.recent.append(key)
+            self.recent_keys.add(key)
+            if len(self.recent) > self.memory:
+                self.recent_keys.discard(self.recent.popleft())
+
+        if new_entries and self.high_water is not None and exec_log:
+            # The whole window was new: executions may have scrolled past unseen
+            if len(new_entries) == len(exec_log) and exec_log[0].start_time > self.high_water:
+                self.gaps += 1
+        if new_entries:
+            latest = max(entry.start_time for entry in new_entries)
+            if self.high_water is None or latest > self.high_water:
+                self.high_water = latest
+        return new_entries
+
+
+def exec_log_count(snapshot):
+    """ExecutionLogCount of a snapshot as an int, or None"""
+    try:
+        return int(snapshot.get('ExecutionLogCount'))
+    except (TypeError, ValueError):
+        return None
+
+
+def format_exec_entry(entry):
+    return (f"EXEC:{entry.task_type},{entry.start_time},{entry.duration},"
+            f"{'MET' if entry.deadline_met else 'MISSED'}\n")
+
+
+def read_exec_log(path):
+    """Yield ExecEntry records from a recorded text log"""
+    with open(path, 'r') as f:
+        for line in f:
+            if not line.startswith("EXEC:"):
+                continue
+            parts = line[5:].rstrip().split(',')
+            if len(parts) == 4:
+                yield ExecEntry(int(parts[0]), int(parts[1]), int(parts[2]), parts[3] == 'MET')
+
+
+class ExecLogWriter:
+    """Append-only writer for recorded execution logs"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'a')
+        self.count = 0
+
+    def write(self, entries):
+        if entries:
+            self.file.write("".join(format_exec_entry(entry) for entry in entries))
+            self.file.flush()
+            self.count += len(entries)
+
+    def close(self):
+        self.file.close()
+
+
+# Binary log layout: header (magic, version, record size) then records of
+# (start_time_ms, duration_ms, task_type, deadline_met), little endian
+EXEC_LOG_MAGIC = b"AVXLOG\x00\x01"
+EXEC_LOG_VERSION = 1
+EXEC_LOG_HEADER = struct.Struct('<8sHH4x')
+EXEC_LOG_RECORD = struct.Struct('<qiHBx')
+BINARY_LOG_SUFFIX = ".bin"
+
+
+class BinaryExecLogWriter:
+    """Append-only writer for the fixed-width binary log format"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'a+b')
+        self.file.seek(0, os.SEEK_END)
+        if self.file.tell() == 0:
+            self.file.write(EXEC_LOG_HEADER.pack(EXEC_LOG_MAGIC, EXEC_LOG_VERSION,
+                                                 EXEC_LOG_RECORD.size))
+            self.file.flush()
+        else:
+            self.file.seek(0)
+            _check_header(self.file.read(EXEC_LOG_HEADER.size), path)
+            self.file.seek(0, os.SEEK_END)
+        self.count = 0
+
+    def write(self, entries):
+        if not entries:
+            return
+        record = EXEC_LOG_RECORD
+        buffer = bytearray(record.size * len(entries))
+        for i, entry in enumerate(entries):
+            record.pack_into(buffer, i * record.size, entry.start_time, entry.duration,
+                             entry.task_type, entry.deadline_met)
+        self.file.write(buffer)
+        self.file.flush()
+        self.count += len(entries)
+
+    def close(self):
+        self.file.close()
+
+
+def _check_header(header, path):
+    if len(header) < EXEC_LOG_HEADER.size:
+        raise ValueError(f"{path}: truncated header")
+    magic, version, record_size = EXEC_LOG_HEADER.unpack(header[:EXEC_LOG_HEADER.size])
+    if magic != EXEC_LOG_MAGIC:
+        raise ValueError(f"{path}: not a binary execution log")
+    if version != EXEC_LOG_VERSION or record_size != EXEC_LOG_RECORD.size:
+        raise ValueError(f"{path}: unsupported log version {version}")
+
+
+class BinaryExecLog:
+    """Read-only, memory-mapped view of a binary execution log
+
+    Behaves like a sequence of ExecEntry records; records are decoded
+    on access, so opening a log costs the same for a thousand or a
+    million executions.  `records` exposes the raw record bytes for
+    columnar consumers.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        _check_header(self.file.read(EXEC_LOG_HEADER.size), path)
+        self.map = None
+        self.records = memoryview(b"")
+        self.refresh()
+
+    def refresh(self):
+        """Pick up records appended since the log was opened"""
+        size = os.fstat(self.file.fileno()).st_size
+        count = (size - EXEC_LOG_HEADER.size) // EXEC_LOG_RECORD.size
+        if self.map is not None and count == len(self):
+            return
+        self.records.release()
+        if self.map is not None:
+            self.map.close()
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        start = EXEC_LOG_HEADER.size
+        self.records = memoryview(self.map)[start:start + count * EXEC_LOG_RECORD.size]
+
+    def __len__(self):
+        return len(self.records) // EXEC_LOG_RECORD.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("execution log index out of range")
+        start, duration, task_type, met = EXEC_LOG_RECORD.unpack_from(
+            self.records, index * EXEC_LOG_RECORD.size)
+        return ExecEntry(task_type, start, duration, bool(met))
+
+    def __iter__(self):
+        for start, duration, task_type, met in EXEC_LOG_RECORD.iter_unpack(self.records):
+            yield ExecEntry(task_type, start, duration, bool(met))
+
+    def close(self):
+        self.records.release()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def is_binary_exec_log(path):
+    with open(path, 'rb') as f:
+        return f.read(len(EXEC_LOG_MAGIC)) == EXEC_LOG_MAGIC
+
+
+def run_log_path(path, run):
+    """Log file for the run-th run of a recording: soak.bin, soak.run2.bin, ..."""
+    if run <= 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.run{run}{ext}"
+
+
+def create_exec_log_writer(path):
+    """Binary writer for `.bin` paths, text writer otherwise"""
+    if path.endswith(BINARY_LOG_SUFFIX):
+        return BinaryExecLogWriter(path)
+    return ExecLogWriter(path)
+
+
+class ExecLogRecorder:
+    """Background thread that records every execution the source reports
+
+    rate_hz should be high enough that fewer than 50 executions happen
+    between polls (with the default task set about 25 per second).
+
+    When the source restarts (module reload, simulator reset) its
+    timestamps start over, so the new run goes to a file of its own
+    (see run_log_path()) instead of being mixed into the previous one.
+    """
+
+    def __init__(self, source, path, rate_hz=10.0):
+        self.source = source
+        self.path = path
+        self.paths = [path]
+        self.interval = 1.0 / rate_hz
+        self.merger = ExecWindowMerger()
+        self.writer = None
+        self.rotated = 0
+        self.polls = 0
+        self.errors = 0
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def recorded(self):
+        return self.rotated + (self.writer.count if self.writer else 0)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self.writer = create_exec_log_writer(self.path)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ExecLogRecorder", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.writer is not None:
+            self.writer.close()
+
+    def poll_once(self):
+        """Read one snapshot and append its new executions"""
+        self.polls += 1
+        snapshot = self.source.snapshot()
+        restarts = self.merger.restarts
+        new_entries = self.merger.merge(snapshot.exec_log, exec_log_count(snapshot))
+        if self.merger.restarts != restarts:
+            self._rotate()
+        self.writer.write(new_entries)
+        return new_entries
+
+    def _rotate(self):
+        """Continue in the next free run file"""
+        run = len(self.paths) + 1
+        while os.path.exists(run_log_path(self.path, run)):
+            run += 1
+        self.rotated += self.writer.count
+        self.writer.close()
+        self.writer = create_exec_log_writer(run_log_path(self.path, run))
+        self.paths.append(self.writer.path)
+
+    def _run(self):
+        next_poll = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+            next_poll += self.interval
+            self._stop.wait(max(0.0, next_poll - time.monotonic()))
+
+    def describe(self):
+        runs = f", {len(self.paths)} runs" if len(self.paths) > 1 else ""
+        return (f"Recording {self.recorded} executions to {self.paths[-1]} "
+                f"({self.merger.gaps} possible gaps{runs})")
+
+
+def main(argv=None):
+    from telemetry import TELEMETRY_SOURCES, create_source
+
+    parser = argparse.ArgumentParser(description="Record the avionics execution log to disk")
+    parser.add_argument("output", help="log file to append to (.bin for the binary format)")
+    parser.add_argument("--source", choices=sorted(TELEMETRY_SOURCES), default="proc")
+    parser.add_argument("--path", help="proc file or capture for the source")
+    parser.add_argument("--rate", type=float, default=10.0, help="polls per second (default: 10)")
+    args = parser.parse_args(argv)
+
+    recorder = ExecLogRecorder(create_source(args.source, args.path), args.output, args.rate)
+    recorder.start()
+    print(f"Recording to {args.output} at {args.rate:g} Hz (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+            print(f"\r{recorder.describe()}", end="", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        recorder.stop()
+        print(f"\nStopped. {recorder.describe()}")
+
+
+if __name__ == "__main__":
+    main()
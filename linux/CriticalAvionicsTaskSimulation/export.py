@@ -0,0 +1,372 @@
+"""Streaming export of execution logs for offline analysis.
+
+export_log() makes one pass over an execution log and writes every
+execution plus per-task aggregates as CSV, JSON Lines or a columnar
+binary file.  Nothing is held per execution: rows are written as they
+are read (the columnar writer buffers one row group), and the aggregates
+are running sums, so memory stays flat however long the log is.
+
+Columnar layout (`.col`): an 8 byte magic, then row groups in which
+each column is a contiguous little-endian array, then a JSON footer
+(column names and types, row-group offsets, metadata) followed by its
+length and the magic again -- the same idea as Parquet, readable with
+nothing more than the standard library (see read_columnar()).
+"""
+import argparse
+import csv
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+from exec_stats import HISTOGRAM_EDGES_MS, histogram_labels
+from execlog import BinaryExecLog, is_binary_exec_log, read_exec_log
+
+COLUMNAR_MAGIC = b"AVXCOL\x00\x01"
+COLUMNAR_FOOTER = struct.Struct('<Q8s')
+COLUMNAR_SUFFIX = ".col"
+ROW_GROUP_ROWS = 65536
+
+EXPORT_FORMATS = {".csv": "csv", ".jsonl": "jsonl", COLUMNAR_SUFFIX: "columnar"}
+
+# (column, array typecode) of the execution table; deadline_met is 1/0 in
+# every format, as in the binary log
+EXEC_COLUMNS = (('task_type', 'H'), ('start_time', 'q'), ('duration', 'i'), ('deadline_met', 'B'))
+
+ExportResult = namedtuple('ExportResult', ['executions', 'tasks', 'exec_path', 'aggregate_path',
+                                           'elapsed_sec'])
+
+
+def export_format(path, fmt=None):
+    """Format name for a path: explicit `fmt`, else from the file extension"""
+    if fmt:
+        return fmt
+    fmt = EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError(f"{path}: unknown export format (use .csv, .jsonl or {COLUMNAR_SUFFIX})")
+    return fmt
+
+
+def aggregate_path_for(exec_path):
+    """Default aggregate file next to an execution export: run.csv -> run_tasks.csv"""
+    stem, suffix = os.path.splitext(exec_path)
+    return f"{stem}_tasks{suffix}"
+
+
+# --- Per-task running aggregates ---
+def _bucket_columns():
+    return tuple("hist_" + label.replace(">", "gt_").replace("-", "_") for label in histogram_labels())
+
+
+class TaskAggregate:
+    """Running statistics of one task, O(1) memory"""
+
+    __slots__ = ('task_type', 'count', 'misses', 'total_time', 'min_duration', 'max_duration',
+                 'first_start', 'last_end', 'last_start', 'interval_count', 'interval_mean',
+                 'interval_m2', 'histogram')
+
+    def __init__(self, task_type):
+        self.task_type = task_type
+        self.count = 0
+        self.misses = 0
+        self.total_time = 0
+        self.min_duration = None
+        self.max_duration = None
+        self.first_start = None
+        self.last_end = None
+        self.last_start = None
+        # Welford's running variance of the interval between starts
+        self.interval_count = 0
+        self.interval_mean = 0.0
+        self.interval_m2 = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+
+    def add(self, entry):
+        duration = entry.duration
+        start = entry.start_time
+        self.count += 1
+        if not entry.deadline_met:
+            self.misses += 1
+        self.total_time += duration
+        if self.min_duration is None or duration < self.min_duration:
+            self.min_duration = duration
+        if self.max_duration is None or duration > self.max_duration:
+            self.max_duration = duration
+        if self.first_start is None or start < self.first_start:
+            self.first_start = start
+        end = start + duration
+        if self.last_end is None or end > self.last_end:
+            self.last_end = end
+        if self.last_start is not None:
+            interval = start - self.last_start
+            self.interval_count += 1
+            delta = interval - self.interval_mean
+            self.interval_mean += delta / self.interval_count
+            self.interval_m2 += delta * (interval - self.interval_mean)
+        self.last_start = start
+        self.histogram[bisect_left(HISTOGRAM_EDGES_MS, duration)] += 1
+
+    def row(self, name):
+        """Values in AGGREGATE_FIELDS order"""
+        jitter = (self.interval_m2 / self.interval_count) ** 0.5 if self.interval_count else 0.0
+        return [
+            self.task_type, name, self.count, self.misses,
+            round(self.misses / self.count, 6) if self.count else 0.0,
+            self.total_time, self.min_duration,
+            round(self.total_time / self.count, 3) if self.count else 0.0,
+            self.max_duration, round(jitter, 3), self.first_start, self.last_end,
+        ] + self.histogram
+
+
+# (column, array typecode) of the aggregate table; 'name' is text, so the
+# columnar writer drops it and records the names in the footer metadata
+AGGREGATE_COLUMNS = ((('task_type', 'H'), ('name', None), ('count', 'q'), ('misses', 'q'),
+                      ('miss_rate', 'd'), ('total_time', 'q'), ('min_duration', 'q'),
+                      ('mean_duration', 'd'), ('max_duration', 'q'), ('jitter', 'd'),
+                      ('first_start', 'q'), ('last_end', 'q'))
+                     + tuple((column, 'q') for column in _bucket_columns()))
+
+
+# --- Writers ---
+# Every writer takes (path, columns, metadata) with columns as (name,
+# typecode) pairs, then write(values) per row in column order.
+class CsvTableWriter:
+    def __init__(self, path, columns, metadata=None):
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([name for name, _ in columns])
+
+    def write(self, values):
+        self.writer.writerow(values)
+
+    def close(self):
+        self.file.close()
+
+
+def _json_value(value):
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if type(value) is int:
+        return str(value)
+    return json.dumps(value)
+
+
+class JsonLinesTableWriter:
+    def __init__(self, path, columns, metadata=None):
+        self.file = open(path, 'w')
+        # One preformatted object per line; cheaper than a dict per row
+        self.template = "{" + ",".join(f'{json.dumps(name)}:%s' for name, _ in columns) + "}\n"
+
+    def write(self, values):
+        self.file.write(self.template % tuple(map(_json_value, values)))
+
+    def close(self):
+        self.file.close()
+
+
+class ColumnarTableWriter:
+    """Row-group columnar writer; only the current row group is kept in memory"""
+
+    def __init__(self, path, columns, metadata=None, row_group_rows=ROW_GROUP_ROWS):
+        self.file = open(path, 'wb')
+        # Text columns have no typecode and are skipped
+        self.positions = [i for i, (_, typecode) in enumerate(columns) if typecode]
+        self.columns = [columns[i] for i in self.positions]
+        self.metadata = metadata or {}
+        self.row_group_rows = row_group_rows
+        self.row_groups = []
+        self.rows = 0
+        self.file.write(COLUMNAR_MAGIC)
+        self._new_group()
+
+    def _new_group(self):
+        self.buffers = [array(typecode) for _, typecode in self.columns]
+        self.pending = 0
+
+    def write(self, values):
+        for buffer, position in zip(self.buffers, self.positions):
+            value = values[position]
+            buffer.append(value if value is not None else 0)
+        self.pending += 1
+        if self.pending >= self.row_group_rows:
+            self._flush()
+
+    def _flush(self):
+        if not self.pending:
+            return
+        offsets = []
+        for buffer in self.buffers:
+            if sys.byteorder != 'little':
+                buffer.byteswap()
+            offsets.append([self.file.tell(), buffer.itemsize * len(buffer)])
+            buffer.tofile(self.file)
+        self.row_groups.append({'rows': self.pending, 'columns': offsets})
+        self.rows += self.pending
+        self._new_group()
+
+    def close(self):
+        self._flush()
+        footer = json.dumps({
+            'columns': [{'name': name, 'type': typecode} for name, typecode in self.columns],
+            'rows': self.rows,
+            'row_groups': self.row_groups,
+            'metadata': self.metadata,
+        }).encode('utf-8')
+        self.file.write(footer)
+        self.file.write(COLUMNAR_FOOTER.pack(len(footer), COLUMNAR_MAGIC))
+        self.file.close()
+
+
+TABLE_WRITERS = {'csv': CsvTableWriter, 'jsonl': JsonLinesTableWriter, 'columnar': ColumnarTableWriter}
+
+
+def read_columnar_footer(path):
+    """The JSON footer of a columnar file"""
+    with open(path, 'rb') as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path}: not a columnar export")
+        f.seek(-COLUMNAR_FOOTER.size, os.SEEK_END)
+        length, magic = COLUMNAR_FOOTER.unpack(f.read(COLUMNAR_FOOTER.size))
+        if magic != COLUMNAR_MAGIC:
+            raise ValueError(f"{path}: truncated columnar export")
+        f.seek(-COLUMNAR_FOOTER.size - length, os.SEEK_END)
+        return json.loads(f.read(length))
+
+
+def read_columnar(path, columns=None):
+    """Yield one {column: array} dict per row group, reading only `columns`"""
+    footer = read_columnar_footer(path)
+    wanted = [(i, column['name'], column['type']) for i, column in enumerate(footer['columns'])
+              if columns is None or column['name'] in columns]
+    with open(path, 'rb') as f:
+        for group in footer['row_groups']:
+            table = {}
+            for i, name, typecode in wanted:
+                offset, length = group['columns'][i]
+                f.seek(offset)
+                values = array(typecode)
+                values.frombytes(f.read(length))
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                table[name] = values
+            yield table
+
+
+# --- Export ---
+def iter_exec_log(path):
+    """Yield ExecEntry records from a text or binary log without loading it all"""
+    if is_binary_exec_log(path):
+        with BinaryExecLog(path) as exec_log:
+            yield from exec_log
+    else:
+        yield from read_exec_log(path)
+
+
+def export_log(exec_log, exec_path, aggregate_path=None, fmt=None, task_names=None):
+    """Write every execution of exec_log to exec_path and per-task aggregates to aggregate_path
+
+    exec_log is any iterable of ExecEntry and is read once, in order.
+    Either path may be None to skip that table; formats default to the
+    file extensions, task_names maps task ids to names for the aggregate
+    table.  Returns an ExportResult.
+    """
+    started = time.perf_counter()
+    exec_writer = None
+    if exec_path:
+        exec_writer = TABLE_WRITERS[export_format(exec_path, fmt)](exec_path, EXEC_COLUMNS)
+
+    aggregates = {}
+    count = 0
+    try:
+        for entry in exec_log:
+            aggregate = aggregates.get(entry.task_type)
+            if aggregate is None:
+                aggregate = aggregates[entry.task_type] = TaskAggregate(entry.task_type)
+            aggregate.add(entry)
+            if exec_writer is not None:
+                exec_writer.write((entry.task_type, entry.start_time, entry.duration,
+                                   1 if entry.deadline_met else 0))
+            count += 1
+    finally:
+        if exec_writer is not None:
+            exec_writer.close()
+
+    if aggregate_path:
+        task_names = task_names or {}
+        names = {task_type: task_names.get(task_type, f"Task {task_type}") for task_type in aggregates}
+        writer = TABLE_WRITERS[export_format(aggregate_path, fmt)](
+            aggregate_path, AGGREGATE_COLUMNS,
+            {'task_names': {str(task_type): name for task_type, name in names.items()}})
+        try:
+            for task_type in sorted(aggregates):
+                writer.write(aggregates[task_type].row(names[task_type]))
+        finally:
+            writer.close()
+
+    return ExportResult(count, len(aggregates), exec_path, aggregate_path,
+                        time.perf_counter() - started)
+
+
+class ExportJob:
+    """Runs export_log() on its own thread; poll `running`, then read result or error"""
+
+    def __init__(self, exec_log, exec_path, aggregate_path=None, fmt=None, task_names=None):
+        self.args = (exec_log, exec_path, aggregate_path, fmt, task_names)
+        self.result = None
+        self.error = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="ExportJob", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.result = export_log(*self.args)
+        except Exception as e:
+            self.error = e
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a recorded execution log for analysis")
+    parser.add_argument("log", help="recorded execution log (text or .bin)")
+    parser.add_argument("output", nargs='?',
+                        help=f"execution table (.csv, .jsonl or {COLUMNAR_SUFFIX}); "
+                             "omit to write only the aggregates")
+    parser.add_argument("--aggregates", metavar="PATH",
+                        help="per-task aggregate table (default: <output>_tasks.<ext>)")
+    parser.add_argument("--format", choices=sorted(TABLE_WRITERS),
+                        help="override the format implied by the file extensions")
+    args = parser.parse_args(argv)
+
+    aggregate_path = args.aggregates or (aggregate_path_for(args.output) if args.output else None)
+    if not args.output and not aggregate_path:
+        parser.error("give an output file and/or --aggregates")
+    # Recordings carry task ids only; name them after the default task set
+    from task_registry import TaskRegistry
+    task_names = {task.task_id: task.name for task in TaskRegistry.from_task_set()}
+    try:
+        result = export_log(iter_exec_log(args.log), args.output, aggregate_path, args.format, task_names)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Export failed: {e}")
+    print(f"Exported {result.executions} executions of {result.tasks} tasks "
+          f"in {result.elapsed_sec:.2f} s")
+    for path in (result.exec_path, result.aggregate_path):
+        if path:
+            print(f"  {path}")
+
+
+if __name__ == "__main__":
+    main()
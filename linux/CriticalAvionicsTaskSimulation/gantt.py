@@ -0,0 +1,633 @@
+"""Retained-mode Gantt chart renderer.
+
+The chart keeps its canvas items alive between frames.  Static parts
+(title, rows, legend) are drawn once; grid lines and execution bars come
+from keyed item pools that move and recolour existing items with
+coords()/itemconfig() instead of deleting and recreating them.  At low
+zoom, executions closer together than a pixel are merged into spans, and
+once a pixel covers more than SUMMARY_BUCKET_MS the bars come from the
+index's bucket summary instead of from every execution in view.
+"""
+from exec_index import IntervalIndex, Span
+from perf import PerfRecorder
+from task_registry import TaskRegistry
+
+# Rows shrink from GanttChart.row_height towards this once the task set
+# no longer fits in max_rows_height
+MIN_ROW_HEIGHT = 16
+
+# Tasks listed individually in the legend
+LEGEND_TASKS = 7
+
+# Stacking order of the pooled layers, bottom to top
+LAYERS = ("grid", "bar", "bar_label", "marker", "selection")
+
+
+def coalesce_row(entries, min_time, time_scale, min_bar_px=4, min_gap_px=1):
+    """Merge one row's executions that would not be visibly separate
+
+    `entries` must belong to one task and be sorted by start_time; see
+    coalesce_spans().
+    """
+    return coalesce_spans((Span(entry.task_type, entry.start_time, entry.start_time + entry.duration,
+                                1, 0 if entry.deadline_met else 1) for entry in entries),
+                          min_time, time_scale, min_bar_px, min_gap_px)
+
+
+def coalesce_spans(spans, min_time, time_scale, min_bar_px=4, min_gap_px=1):
+    """Merge one row's spans that would not be visibly separate
+
+    `spans` must belong to one task and be sorted by start_time.  A span
+    joins the current one when it starts less than min_gap_px after the
+    current one's drawn end (bars are at least min_bar_px wide), so the
+    number of spans is bounded by the row's pixel width rather than by
+    the number of executions.  Deadline misses are counted per span so
+    their markers survive aggregation.
+    """
+    merged = []
+    current = None   # [task_type, start, end, count, misses]
+    drawn_end_px = 0.0
+
+    for span in spans:
+        end_time = span.end_time
+        if end_time < min_time:
+            continue
+        start_px = (span.start_time - min_time) * time_scale
+        if current is not None and start_px < drawn_end_px + min_gap_px:
+            current[2] = max(current[2], end_time)
+            current[3] += span.count
+            current[4] += span.misses
+        else:
+            if current is not None:
+                merged.append(Span(*current))
+            current = [span.task_type, span.start_time, end_time, span.count, span.misses]
+            drawn_end_px = start_px + min_bar_px
+        drawn_end_px = max(drawn_end_px, (end_time - min_time) * time_scale)
+
+    if current is not None:
+        merged.append(Span(*current))
+    return merged
+
+
+def grid_interval(time_range):
+    """Dynamic grid interval based on range, rounded to nice numbers"""
+    if time_range < 1000:
+        # Zoomed in below a second: 1-2-5 steps down to 1 ms
+        target = time_range / 10
+        for candidate in (1, 2, 5, 10, 20, 50):
+            if candidate >= target:
+                return candidate
+        return 100
+    time_interval = max(100, int(time_range / 10))
+    if time_interval < 500:
+        return 100
+    if time_interval < 1000:
+        return 500
+    # Long captures: keep roughly ten lines using 1-2-5 steps
+    step = 1000
+    while True:
+        for factor in (1, 2, 5):
+            if step * factor >= time_interval:
+                return step * factor
+        step *= 10
+
+
+class CanvasItemPool:
+    """Recycles canvas items of one type across frames
+
+    Call begin_frame(), then draw() once per visible item with a stable
+    key, then end_frame().  Items whose key was not drawn are hidden and
+    kept for reuse rather than deleted.
+    """
+
+    def __init__(self, canvas, item_type, tag):
+        self.canvas = canvas
+        self.item_type = item_type
+        self.tag = tag
+        self.live = {}   # key -> [item id, coords, options]
+        self.free = []
+        self.touched = set()
+        self.created = 0
+
+    def begin_frame(self):
+        self.touched = set()
+        self.created = 0
+
+    def draw(self, key, coords, **options):
+        slot = self.live.get(key)
+        if slot is None:
+            if self.free:
+                item = self.free.pop()
+                self.canvas.coords(item, *coords)
+                self.canvas.itemconfig(item, state="normal", **options)
+            else:
+                create = getattr(self.canvas, f"create_{self.item_type}")
+                item = create(*coords, tags=(self.tag,), **options)
+                self.created += 1
+            self.live[key] = [item, coords, options]
+        else:
+            item, old_coords, old_options = slot
+            if old_coords != coords:
+                self.canvas.coords(item, *coords)
+                slot[1] = coords
+            changed = {name: value for name, value in options.items()
+                       if old_options.get(name) != value}
+            if changed:
+                self.canvas.itemconfig(item, **changed)
+                slot[2] = options
+        self.touched.add(key)
+        return item
+
+    def end_frame(self):
+        for key in [key for key in self.live if key not in self.touched]:
+            item = self.live.pop(key)[0]
+            self.canvas.itemconfig(item, state="hidden")
+            self.free.append(item)
+
+    def __len__(self):
+        return len(self.live)
+
+
+class GanttChart:
+    """Grid-based Gantt chart with a millisecond timeline
+
+    Executions live in an IntervalIndex; the chart shows the window
+    between view[0] and view[1] (the whole timeline by default) and can
+    be zoomed with the mouse wheel and panned by dragging.  render() can
+    be called as often as new data arrives; only items whose position or
+    style changed are touched.
+    """
+
+    task_label_width = 200
+    chart_start_x = task_label_width + 20
+    chart_start_y = 100
+    row_height = 50
+    max_rows_height = 600
+    chart_width = 1000
+    bar_padding = 8
+    min_bar_width = 4
+    min_view_ms = 10
+    focus_view_ms = 5000   # window shown around a selected miss when zoomed all the way out
+    zoom_step = 1.25
+
+    def __init__(self, canvas, registry=None, perf=None):
+        self.canvas = canvas
+        self.perf = perf or PerfRecorder()
+        self.index = IntervalIndex()
+        self.view = None      # None = whole timeline
+        self.follow = True    # keep the right edge on the newest execution
+        self._drag_x = None
+        self.selected = None  # execution highlighted by select_miss()
+        self.set_registry(registry or TaskRegistry.from_task_set())
+
+    def follow_registry(self, registry):
+        """Re-lay the chart out if registry is new or has changed since it was shown"""
+        if registry is self.registry and registry.version == self.registry_version:
+            return False
+        self.set_registry(registry)
+        return True
+
+    def set_registry(self, registry):
+        """Lay the chart out for a task set (one row per task, by priority) and redraw"""
+        self.registry = registry
+        self.registry_version = registry.version
+        self.rows = {task.task_id: row for row, task in enumerate(registry)}
+        count = max(len(registry), 1)
+        self.row_height = max(MIN_ROW_HEIGHT, min(type(self).row_height, self.max_rows_height // count))
+        self.bar_padding = max(2, type(self).bar_padding * self.row_height // type(self).row_height)
+        self.chart_height = count * self.row_height
+        self.total_width = self.chart_start_x + self.chart_width + 100
+        self.total_height = self.chart_start_y + self.chart_height + 100
+
+        canvas = self.canvas
+        self.pools = {
+            'grid_line': CanvasItemPool(canvas, "line", "grid"),
+            'grid_label': CanvasItemPool(canvas, "text", "grid"),
+            'bar': CanvasItemPool(canvas, "rectangle", "bar"),
+            'bar_label': CanvasItemPool(canvas, "text", "bar_label"),
+            'marker': CanvasItemPool(canvas, "polygon", "marker"),
+            'marker_label': CanvasItemPool(canvas, "text", "marker"),
+            'selection': CanvasItemPool(canvas, "rectangle", "selection"),
+        }
+        self.empty_items = []
+        self._draw_static()
+        if len(self.index):
+            self.render()
+
+    # --- Static layer, drawn once ---
+    def _draw_static(self):
+        canvas = self.canvas
+        chart_start_x = self.chart_start_x
+        chart_start_y = self.chart_start_y
+        chart_width = self.chart_width
+        row_height = self.row_height
+        total_width = self.total_width
+
+        canvas.delete("all")
+        canvas.configure(scrollregion=(0, 0, total_width, self.total_height))
+
+        # Title
+        canvas.create_text(total_width//2, 30,
+                          text="Avionics Task Execution Timeline",
+                          font=("Arial", 18, "bold"), fill="#2C3E50")
+
+        # Subtitle with timeline info, refreshed every frame
+        self.subtitle = canvas.create_text(total_width//2, 55, text="",
+                                           font=("Arial", 12), fill="#7F8C8D")
+        self._subtitle_text = ""
+
+        # Time scale header
+        header_y = chart_start_y - 30
+        canvas.create_rectangle(chart_start_x, header_y - 15, chart_start_x + chart_width, header_y + 25,
+                              fill="#34495E", outline="#2C3E50", width=2)
+        canvas.create_text(chart_start_x + chart_width//2, header_y + 5,
+                          text="TIME (milliseconds)",
+                          font=("Arial", 12, "bold"), fill="white")
+
+        # Task rows and labels
+        compact = row_height < type(self).row_height
+        for row, task in enumerate(self.registry):
+            y_pos = chart_start_y + row * row_height
+
+            # Task label area background
+            canvas.create_rectangle(20, y_pos, chart_start_x, y_pos + row_height,
+                                  fill="#ECF0F1", outline="#BDC3C7", width=1)
+
+            if compact:
+                # Small rows: colour swatch and "P<n> name" on one line
+                canvas.create_rectangle(25, y_pos + 3, 35, y_pos + row_height - 3,
+                                      fill=task.color, outline="#2C3E50", width=1)
+                canvas.create_text(40, y_pos + row_height // 2, text=f"P{task.priority} {task.name}",
+                                 font=("Arial", 8), anchor="w", fill="#2C3E50")
+            else:
+                # Priority badge
+                canvas.create_rectangle(25, y_pos + 10, 55, y_pos + 30,
+                                      fill=task.color, outline="#2C3E50", width=1)
+                canvas.create_text(40, y_pos + 20, text=f"P{task.priority}",
+                                 font=("Arial", 10, "bold"), fill="white")
+
+                # Task name
+                canvas.create_text(65, y_pos + 25, text=task.name,
+                                 font=("Arial", 11, "bold"), anchor="w", fill="#2C3E50")
+
+            # Chart area for this task
+            canvas.create_rectangle(chart_start_x, y_pos, chart_start_x + chart_width, y_pos + row_height,
+                                  fill="white", outline="#BDC3C7", width=1)
+
+        self._draw_legend()
+
+    def _draw_legend(self):
+        canvas = self.canvas
+        legend_x = 20
+        legend_y = self.chart_start_y + self.chart_height + 20
+
+        # Legend background
+        canvas.create_rectangle(legend_x - 5, legend_y - 5,
+                              legend_x + 900, legend_y + 80,
+                              fill="#F8F9FA", outline="#BDC3C7", width=1)
+
+        # Legend title
+        canvas.create_text(legend_x + 5, legend_y + 5, text="LEGEND",
+                         font=("Arial", 12, "bold"), anchor="nw", fill="#2C3E50")
+
+        # Task priority colors
+        legend_col1_x = legend_x + 10
+        canvas.create_text(legend_col1_x, legend_y + 25, text="Task Priorities:",
+                         font=("Arial", 10, "bold"), anchor="nw", fill="#2C3E50")
+
+        tasks = self.registry.tasks
+        for i, task in enumerate(tasks[:LEGEND_TASKS]):
+            legend_item_x = legend_col1_x + (i * 85)
+            legend_item_y = legend_y + 45
+
+            canvas.create_rectangle(legend_item_x, legend_item_y,
+                                  legend_item_x + 15, legend_item_y + 15,
+                                  fill=task.color, outline="#2C3E50")
+            canvas.create_text(legend_item_x + 20, legend_item_y + 7,
+                             text=f"P{task.priority}",
+                             font=("Arial", 9), anchor="w", fill="#2C3E50")
+        if len(tasks) > LEGEND_TASKS:
+            canvas.create_text(legend_col1_x + LEGEND_TASKS * 85, legend_y + 52,
+                             text=f"+{len(tasks) - LEGEND_TASKS} more",
+                             font=("Arial", 9, "italic"), anchor="w", fill="#2C3E50")
+
+        # Status indicators
+        legend_col2_x = legend_x + 650
+        canvas.create_text(legend_col2_x, legend_y + 25, text="Status:",
+                         font=("Arial", 10, "bold"), anchor="nw", fill="#2C3E50")
+
+        # Deadline met
+        canvas.create_rectangle(legend_col2_x, legend_y + 45,
+                              legend_col2_x + 20, legend_y + 55,
+                              fill="#2ECC71", outline="#27AE60", width=1)
+        canvas.create_text(legend_col2_x + 25, legend_y + 50, text="Deadline Met",
+                         font=("Arial", 9), anchor="w", fill="#2C3E50")
+
+        # Deadline missed
+        canvas.create_rectangle(legend_col2_x + 120, legend_y + 45,
+                              legend_col2_x + 140, legend_y + 55,
+                              fill="#E74C3C", outline="#C0392B", width=2)
+        canvas.create_text(legend_col2_x + 145, legend_y + 50, text="Deadline MISSED",
+                         font=("Arial", 9, "bold"), anchor="w", fill="#E74C3C")
+
+    # --- Dynamic layers ---
+    def _set_empty_message(self, empty):
+        if empty and not self.empty_items:
+            self.empty_items = [
+                self.canvas.create_text(self.total_width//2, self.chart_start_y + self.chart_height//2 - 15,
+                                        text="No execution data available",
+                                        font=("Arial", 16), fill="red"),
+                self.canvas.create_text(self.total_width//2, self.chart_start_y + self.chart_height//2 + 15,
+                                        text="Run a 10-second simulation first",
+                                        font=("Arial", 12), fill="gray"),
+            ]
+        elif not empty and self.empty_items:
+            for item in self.empty_items:
+                self.canvas.delete(item)
+            self.empty_items = []
+
+    # --- Viewport ---
+    def update(self, exec_log):
+        """Index new executions and redraw; already indexed ones are skipped"""
+        with self.perf.stage("gantt_index"):
+            self.index.extend(exec_log)
+        self.render()
+
+    def visible_range(self):
+        """(start, end) in ms of the time window currently on screen"""
+        span = self.index.span()
+        if span is None:
+            return None
+        if self.view is None:
+            return span
+        view_start, view_end = self.view
+        if self.follow:
+            # Keep the zoom level but stick to the newest data
+            width = view_end - view_start
+            return span[1] - width, span[1]
+        return self.view
+
+    def time_at(self, canvas_x):
+        """Timeline position (ms) under a canvas x coordinate"""
+        view_start, view_end = self.visible_range()
+        fraction = (canvas_x - self.chart_start_x) / self.chart_width
+        return view_start + min(max(fraction, 0.0), 1.0) * (view_end - view_start)
+
+    def zoom(self, factor, canvas_x=None):
+        """Zoom in (factor > 1) or out around the time under canvas_x"""
+        visible = self.visible_range()
+        if visible is None:
+            return
+        view_start, view_end = visible
+        anchor = self.time_at(canvas_x) if canvas_x is not None else (view_start + view_end) / 2
+        width = (view_end - view_start) / factor
+        full_start, full_end = self.index.span()
+        width = min(max(width, self.min_view_ms), max(full_end - full_start, self.min_view_ms))
+        new_start = anchor - (anchor - view_start) / (view_end - view_start or 1) * width
+        self._set_view(new_start, new_start + width)
+
+    def pan(self, dx_pixels):
+        """Shift the view by a pixel distance (positive moves later in time)"""
+        visible = self.visible_range()
+        if visible is None:
+            return
+        view_start, view_end = visible
+        shift = dx_pixels * (view_end - view_start) / self.chart_width
+        self._set_view(view_start + shift, view_end + shift)
+
+    def show_range(self, view_start, view_end):
+        """Show [view_start, view_end] ms, clamped to the data; keeps following if it ends at the newest"""
+        if self.index.span() is not None:
+            self._set_view(view_start, view_end)
+
+    def center_on(self, time_ms, width=None):
+        """Centre the view on time_ms, keeping the zoom level unless it shows everything"""
+        visible = self.visible_range()
+        if visible is None:
+            return
+        if width is None:
+            width = visible[1] - visible[0] if self.view is not None else self.focus_view_ms
+        self.show_range(time_ms - width / 2, time_ms + width / 2)
+
+    def select_miss(self, forward=True, task_ids=None):
+        """Select the next (or previous) deadline miss and centre on it; returns it or None
+
+        Steps from the selected miss, or from the edge of the view when
+        nothing is selected; task_ids limits the search to those tasks.
+        """
+        visible = self.visible_range()
+        if visible is None:
+            return None
+        selected = self.selected
+        if selected is not None and (task_ids is None or selected.task_type in task_ids):
+            time_ms, task_id = selected.start_time, selected.task_type
+        else:
+            time_ms, task_id = (visible[0] - 1, None) if forward else (visible[1] + 1, None)
+        if forward:
+            miss = self.index.next_miss(time_ms, task_id, task_ids)
+        else:
+            miss = self.index.previous_miss(time_ms, task_id, task_ids)
+        if miss is not None:
+            self.selected = miss
+            self.center_on(miss.start_time + miss.duration / 2)
+        return miss
+
+    def reset_view(self):
+        """Show the whole indexed timeline again and follow new data"""
+        self.view = None
+        self.follow = True
+        self.render()
+
+    def _set_view(self, view_start, view_end):
+        full_start, full_end = self.index.span()
+        width = view_end - view_start
+        # Clamp to the data, keeping the requested width
+        if view_end > full_end:
+            view_start, view_end = full_end - width, full_end
+        if view_start < full_start:
+            view_start, view_end = full_start, full_start + width
+        self.view = (view_start, view_end)
+        self.follow = view_end >= full_end
+        self.render()
+
+    def bind_navigation(self):
+        """Mouse wheel zooms around the pointer, dragging pans"""
+        canvas = self.canvas
+
+        def on_wheel(event):
+            direction = 1 if (getattr(event, 'num', 0) == 4 or getattr(event, 'delta', 0) > 0) else -1
+            self.zoom(self.zoom_step if direction > 0 else 1 / self.zoom_step, canvas.canvasx(event.x))
+
+        def on_press(event):
+            self._drag_x = event.x
+
+        def on_drag(event):
+            if self._drag_x is not None:
+                self.pan(self._drag_x - event.x)
+                self._drag_x = event.x
+
+        def on_release(event):
+            self._drag_x = None
+
+        canvas.bind("<MouseWheel>", on_wheel)
+        canvas.bind("<Button-4>", on_wheel)
+        canvas.bind("<Button-5>", on_wheel)
+        canvas.bind("<ButtonPress-1>", on_press)
+        canvas.bind("<B1-Motion>", on_drag)
+        canvas.bind("<ButtonRelease-1>", on_release)
+        canvas.bind("<Double-Button-1>", lambda event: self.reset_view())
+
+    # --- Drawing ---
+    def render(self):
+        """Bring the canvas in line with the index and the current view
+
+        Only executions overlapping the visible window are looked up, so
+        the cost of a frame depends on what is on screen, not on how long
+        the capture is.
+        """
+        with self.perf.stage("gantt_draw"):
+            self._render()
+
+    def _render(self):
+        for pool in self.pools.values():
+            pool.begin_frame()
+
+        visible = self.visible_range()
+        self._set_empty_message(visible is None)
+        if visible is not None:
+            min_time, max_time = visible
+            self._render_grid(min_time, max_time)
+            shown = self._render_bars(min_time, max_time)
+            self._render_selection(min_time, max_time)
+            subtitle = (f"Timeline: {min_time:.0f}ms - {max_time:.0f}ms "
+                        f"({max_time - min_time:.0f}ms shown) | {shown} of {len(self.index)} executions")
+        else:
+            subtitle = ""
+
+        if subtitle != self._subtitle_text:
+            self.canvas.itemconfig(self.subtitle, text=subtitle)
+            self._subtitle_text = subtitle
+
+        created = 0
+        for pool in self.pools.values():
+            pool.end_frame()
+            created += pool.created
+        if created:
+            # New items land on top of the stack; restore the layer order
+            for layer in LAYERS:
+                self.canvas.tag_raise(layer)
+
+    def _render_grid(self, min_time, max_time):
+        chart_start_x = self.chart_start_x
+        chart_start_y = self.chart_start_y
+        time_range = max_time - min_time
+        time_scale = self.chart_width / time_range if time_range > 0 else 1
+
+        time_interval = grid_interval(time_range)
+
+        start_time = int(min_time // time_interval) * time_interval
+        for time_ms in range(start_time, int(max_time) + time_interval, time_interval):
+            x_pos = chart_start_x + (time_ms - min_time) * time_scale
+            if chart_start_x <= x_pos <= chart_start_x + self.chart_width:
+                self.pools['grid_line'].draw(
+                    time_ms, (x_pos, chart_start_y, x_pos, chart_start_y + self.chart_height),
+                    fill="#BDC3C7", width=1)
+                self.pools['grid_label'].draw(
+                    time_ms, (x_pos, chart_start_y - 10),
+                    text=f"{time_ms}", font=("Arial", 9), anchor="n", fill="#2C3E50")
+
+    def _render_bars(self, min_time, max_time):
+        chart_start_x = self.chart_start_x
+        chart_end_x = chart_start_x + self.chart_width
+        row_height = self.row_height
+        bar_padding = self.bar_padding
+        time_range = max_time - min_time
+        time_scale = self.chart_width / time_range if time_range > 0 else 1
+        shown = 0
+
+        for task_id in self.index.tasks:
+            row = self.rows.get(task_id)
+            if row is None:
+                continue
+            y_pos = self.chart_start_y + row * row_height
+            # Zoomed out past SUMMARY_BUCKET_MS a pixel, bars come from the index summary
+            spans = self.index.summary(task_id, min_time, max_time, 1 / time_scale)
+            if spans is None:
+                entries = self.index.query(task_id, min_time, max_time)
+                shown += len(entries)
+                spans = coalesce_row(entries, min_time, time_scale, self.min_bar_width)
+            else:
+                shown += sum(span.count for span in spans)
+                spans = coalesce_spans(spans, min_time, time_scale, self.min_bar_width)
+
+            for span in spans:
+                # Calculate position
+                x_start = chart_start_x + (max(span.start_time, min_time) - min_time) * time_scale
+                x_end = chart_start_x + (span.end_time - min_time) * time_scale
+
+                # Ensure minimum width for visibility
+                if x_end - x_start < self.min_bar_width:
+                    x_end = x_start + self.min_bar_width
+                x_end = min(x_end, chart_end_x)
+
+                # Bar styling based on deadline compliance
+                if span.count > 1:
+                    # Several executions merged at this zoom level
+                    fill_color = self.registry.color(task_id)
+                    outline_color = "#C0392B" if span.misses else "#2C3E50"
+                    outline_width = 2 if span.misses else 1
+                    label = f"{span.count}x"
+                elif span.misses == 0:
+                    fill_color = self.registry.color(task_id)
+                    outline_color = "#27AE60"
+                    outline_width = 1
+                    label = f"{span.end_time - span.start_time}ms"
+                else:
+                    fill_color = "#E74C3C"  # Red for deadline misses
+                    outline_color = "#C0392B"
+                    outline_width = 2
+                    label = f"{span.end_time - span.start_time}ms"
+
+                key = (task_id, span.start_time)
+                self.pools['bar'].draw(
+                    key, (x_start, y_pos + bar_padding, x_end, y_pos + row_height - bar_padding),
+                    fill=fill_color, outline=outline_color, width=outline_width)
+
+                # Add duration text if bar is wide enough
+                if x_end - x_start > 30:
+                    self.pools['bar_label'].draw(
+                        key, ((x_start + x_end) / 2, y_pos + row_height / 2),
+                        text=label, font=("Arial", 8, "bold"), fill="white")
+
+                # Warning triangle for deadline misses, one per span
+                if span.misses:
+                    triangle_x = x_end + 2
+                    triangle_y = y_pos + 5
+                    self.pools['marker'].draw(
+                        key, (triangle_x, triangle_y,
+                              triangle_x + 8, triangle_y,
+                              triangle_x + 4, triangle_y + 8),
+                        fill="#E74C3C", outline="#C0392B")
+                    self.pools['marker_label'].draw(
+                        key, (triangle_x + 4, triangle_y + 4),
+                        text="!", font=("Arial", 6, "bold"), fill="white")
+
+        return shown
+
+    def _render_selection(self, min_time, max_time):
+        selected = self.selected
+        row = self.rows.get(selected.task_type) if selected is not None else None
+        if row is None or selected.start_time > max_time or selected.start_time + selected.duration < min_time:
+            return
+        time_scale = self.chart_width / (max_time - min_time) if max_time > min_time else 1
+        x_start = self.chart_start_x + (max(selected.start_time, min_time) - min_time) * time_scale
+        x_end = self.chart_start_x + (min(selected.start_time + selected.duration, max_time) - min_time) * time_scale
+        y_pos = self.chart_start_y + row * self.row_height
+        self.pools['selection'].draw(
+            'selected', (x_start - 3, y_pos + 1, max(x_end, x_start + self.min_bar_width) + 3,
+                         y_pos + self.row_height - 1),
+            outline="#F1C40F", width=3)
+
+    def item_count(self):
+        """Number of pooled items currently visible"""
+        return sum(len(pool) for pool in self.pools.values())
@@ -0,0 +1,176 @@
+"""Rolling per-task metric history and the sparklines that draw it.
+
+Every snapshot appends one sample per task to fixed-size, array-backed
+ring buffers (execution time, miss rate since the previous snapshot and
+CPU utilization over the same window), so memory stays O(window) however
+long the GUI runs.  Sparklines keep their canvas items and only move
+them when the buffer behind them has changed.
+"""
+from array import array
+
+from execlog import ExecWindowMerger, exec_log_count
+
+# Samples kept per metric (one per snapshot, so two minutes at 1 Hz)
+HISTORY_WINDOW = 120
+
+
+class RingBuffer:
+    """Fixed-capacity float buffer; the oldest sample is overwritten when full"""
+
+    __slots__ = ('data', 'capacity', 'start', 'count', 'version')
+
+    def __init__(self, capacity=HISTORY_WINDOW):
+        self.data = array('d', [0.0]) * capacity
+        self.capacity = capacity
+        self.start = 0
+        self.count = 0
+        # Bumped on every append so views can tell whether to redraw
+        self.version = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        if self.count < self.capacity:
+            self.data[(self.start + self.count) % self.capacity] = value
+            self.count += 1
+        else:
+            self.data[self.start] = value
+            self.start = (self.start + 1) % self.capacity
+        self.version += 1
+
+    def __iter__(self):
+        data = self.data
+        for i in range(self.count):
+            yield data[(self.start + i) % self.capacity]
+
+    def values(self):
+        """Samples oldest first, as a list"""
+        end = self.start + self.count
+        if end <= self.capacity:
+            return self.data[self.start:end].tolist()
+        return (self.data[self.start:] + self.data[:end - self.capacity]).tolist()
+
+    def last(self, default=0.0):
+        if not self.count:
+            return default
+        return self.data[(self.start + self.count - 1) % self.capacity]
+
+
+class TaskHistory:
+    __slots__ = ('exec_time', 'miss_rate', 'utilization', 'last_total', 'last_missed')
+
+    def __init__(self, window):
+        self.exec_time = RingBuffer(window)
+        self.miss_rate = RingBuffer(window)
+        self.utilization = RingBuffer(window)
+        self.last_total = None
+        self.last_missed = None
+
+
+def _int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class MetricHistory:
+    """Per-task ring buffers fed from successive snapshots"""
+
+    def __init__(self, window=HISTORY_WINDOW):
+        self.window = window
+        self.tasks = {}
+        self.merger = ExecWindowMerger()
+        self.log_time = None
+        self.samples = 0
+
+    def task(self, number):
+        """TaskHistory for task `number`, or None before its first sample"""
+        return self.tasks.get(number)
+
+    def update(self, snapshot):
+        """Append one sample per task"""
+        # Busy time per task from executions not seen before, over the log time they cover
+        busy = {}
+        restarts = self.merger.restarts
+        new_entries = self.merger.merge(snapshot.exec_log, exec_log_count(snapshot))
+        if self.merger.restarts != restarts:
+            # Timestamps started over; measure the new log from scratch
+            self.log_time = None
+        log_time = self.log_time
+        for entry in new_entries:
+            busy[entry.task_type] = busy.get(entry.task_type, 0) + entry.duration
+            end = entry.start_time + entry.duration
+            if log_time is None or end > log_time:
+                log_time = end
+        window_ms = log_time - self.log_time if self.log_time is not None and log_time else 0
+        self.log_time = log_time
+
+        for task in snapshot.tasks:
+            number = _int(task.get('TaskNumber'), None)
+            history = self.tasks.get(number)
+            if history is None:
+                history = self.tasks[number] = TaskHistory(self.window)
+
+            total = _int(task.get('TotalExecs'))
+            missed = _int(task.get('MissedCount'))
+            miss_rate = 0.0
+            if history.last_total is not None and total > history.last_total:
+                miss_rate = max(0, missed - history.last_missed) / (total - history.last_total)
+            history.last_total = total
+            history.last_missed = missed
+
+            history.exec_time.append(_int(task.get('LastExecTime')))
+            history.miss_rate.append(miss_rate)
+            if window_ms > 0:
+                history.utilization.append(min(busy.get(number, 0) / window_ms, 1.0))
+            else:
+                history.utilization.append(history.utilization.last())
+        self.samples += 1
+
+
+class Sparkline:
+    """A polyline over a RingBuffer, drawn on a small canvas
+
+    The line item is created once; update() moves its points with
+    coords() and does nothing if the buffer has not changed.
+    """
+
+    def __init__(self, canvas, width, height, color, pad=2):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.version = None
+        self.item = canvas.create_line(0, 0, 0, 0, fill=color, width=1)
+
+    def clear(self):
+        """Hide the line until the next update(), e.g. when the canvas is reused"""
+        self.version = None
+        self.canvas.coords(self.item, 0, 0, 0, 0)
+
+    def update(self, buffer, maximum=None):
+        if buffer.version == self.version:
+            return False
+        self.version = buffer.version
+        values = buffer.values()
+        if not values:
+            return False
+        if maximum is None:
+            maximum = max(values)
+        maximum = maximum or 1.0
+        step = (self.width - 2 * self.pad) / max(buffer.capacity - 1, 1)
+        # Right-aligned so the newest sample is always at the right edge
+        x = self.width - self.pad - (len(values) - 1) * step
+        bottom = self.height - self.pad
+        span = self.height - 2 * self.pad
+        coords = []
+        for value in values:
+            coords.append(x)
+            coords.append(bottom - min(value / maximum, 1.0) * span)
+            x += step
+        if len(coords) == 2:
+            coords *= 2
+        self.canvas.coords(self.item, *coords)
+        return True
@@ -0,0 +1,164 @@
+"""Chunked, background loading of large recordings.
+
+iter_exec_chunks() reads an execution log or a status capture a block at
+a time and yields lists of ExecEntry, never holding more than one block
+of the file: text is scanned with one regex per block (so status fields
+between EXEC lines cost nothing), binary logs are sliced straight out of
+the mmap.  The first block is small so something can be drawn almost
+immediately; later blocks are larger to keep the per-chunk overhead low.
+
+ExecLogLoader runs that reader on a thread and hands chunks to the UI
+through a short bounded queue; the UI indexes them a few at a time with
+feed(), so the Gantt chart and statistics fill in while loading
+continues and memory does not grow with the size of the file.
+"""
+import os
+import queue
+import re
+import threading
+import time
+
+from execlog import EXEC_LOG_HEADER, EXEC_LOG_RECORD, BinaryExecLog, is_binary_exec_log
+from snapshot import ExecEntry
+
+# Bytes of text parsed per chunk: the first one small for a quick first frame
+FIRST_BLOCK_BYTES = 64 * 1024
+BLOCK_BYTES = 512 * 1024
+
+# Binary records per chunk (16 bytes each)
+FIRST_CHUNK_RECORDS = 2048
+CHUNK_RECORDS = 16384
+
+# Parsed chunks buffered ahead of the UI; bounds memory while loading
+QUEUE_CHUNKS = 4
+
+_EXEC_RE = re.compile(rb'^EXEC:(\d+),(-?\d+),(-?\d+),(MET|MISSED)[ \t\r]*$', re.MULTILINE)
+
+
+def _parse_block(data, end=None):
+    return [ExecEntry(int(task), int(start), int(duration), met == b'MET')
+            for task, start, duration, met in _EXEC_RE.findall(data, 0, len(data) if end is None else end)]
+
+
+def iter_text_chunks(path, first_block=FIRST_BLOCK_BYTES, block=BLOCK_BYTES):
+    """Yield (entries, bytes_done) for the EXEC lines of a text log or capture"""
+    with open(path, 'rb') as f:
+        tail = b""
+        size = first_block
+        while True:
+            data = f.read(size)
+            if not data:
+                break
+            size = block
+            data = tail + data
+            # Only whole lines are parsed; the rest waits for the next block
+            cut = data.rfind(b"\n") + 1
+            tail = data[cut:]
+            if cut:
+                yield _parse_block(data, cut), f.tell() - len(tail)
+        if tail:
+            yield _parse_block(tail), f.tell()
+
+
+def iter_binary_chunks(path, first_chunk=FIRST_CHUNK_RECORDS, chunk=CHUNK_RECORDS):
+    """Yield (entries, bytes_done) for a binary execution log"""
+    with BinaryExecLog(path) as exec_log:
+        records = exec_log.records
+        pos = 0
+        size = first_chunk * EXEC_LOG_RECORD.size
+        while pos < len(records):
+            with records[pos:pos + size] as view:
+                entries = [ExecEntry(task, start, duration, bool(met)) for start, duration, task, met
+                           in EXEC_LOG_RECORD.iter_unpack(view)]
+                pos += len(view)
+            size = chunk * EXEC_LOG_RECORD.size
+            yield entries, EXEC_LOG_HEADER.size + pos
+
+
+def iter_exec_chunks(path):
+    """Yield (entries, bytes_done) chunks from a recording in any format"""
+    if is_binary_exec_log(path):
+        return iter_binary_chunks(path)
+    return iter_text_chunks(path)
+
+
+class ExecLogLoader:
+    """Parse a recording on a background thread, chunk by chunk"""
+
+    def __init__(self, path):
+        self.path = path
+        self.total_bytes = os.path.getsize(path)
+        self.bytes_done = 0
+        # New executions indexed; captures repeat each one in several frames
+        self.loaded = 0
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._queue = queue.Queue(maxsize=QUEUE_CHUNKS)
+        self._reading = True
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="exec-log-loader", daemon=True)
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def done(self):
+        """True once every chunk has been read and handed out"""
+        return not self._reading and self._queue.empty()
+
+    @property
+    def progress(self):
+        """Fraction of the file handed out so far"""
+        if self.done or not self.total_bytes:
+            return 1.0
+        return self.bytes_done / self.total_bytes
+
+    def _run(self):
+        try:
+            for chunk in iter_exec_chunks(self.path):
+                # Block while the UI is behind, but keep checking for cancel
+                while not self._cancel.is_set():
+                    try:
+                        self._queue.put(chunk, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if self._cancel.is_set():
+                    break
+        except (OSError, ValueError) as e:
+            self.error = e
+        finally:
+            self._reading = False
+
+    def feed(self, index, budget_sec=0.04):
+        """Index queued chunks for about budget_sec; returns how many executions were new"""
+        deadline = time.perf_counter() + budget_sec
+        added = 0
+        while True:
+            try:
+                entries, bytes_done = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            added += index.extend(entries)
+            self.bytes_done = bytes_done
+            if time.perf_counter() >= deadline:
+                break
+        self.loaded += added
+        if self.done and self.finished_at is None:
+            self.finished_at = time.perf_counter()
+        return added
+
+    def describe(self):
+        if self.error:
+            return f"Loading {os.path.basename(self.path)} failed: {self.error}"
+        if self.finished_at is not None:
+            return (f"Loaded {self.loaded} executions from {os.path.basename(self.path)} "
+                    f"in {self.finished_at - self.started_at:.1f} s")
+        return (f"Loading {os.path.basename(self.path)}: {self.progress * 100:.0f}% "
+                f"({self.loaded} executions)")
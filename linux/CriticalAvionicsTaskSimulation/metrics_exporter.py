@@ -0,0 +1,268 @@
+"""Prometheus / OpenMetrics exporter for the avionics status.
+
+Serves /metrics over HTTP with per-task deadline counters, the last
+execution time and a duration histogram per task.  Histograms are
+accumulated incrementally from the EXEC window of each snapshot (new
+executions only, see ExecWindowMerger).  A rendered page is reused for
+`cache_sec`, so any number of scrapers costs at most one procfs read per
+cache period.
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from exec_stats import HISTOGRAM_EDGES_MS
+from execlog import ExecWindowMerger, exec_log_count
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# (metric, snapshot field, type, help)
+TASK_METRICS = [
+    ("avionics_task_deadline_met", 'MetCount', "counter", "Executions that met their deadline"),
+    ("avionics_task_deadline_missed", 'MissedCount', "counter", "Executions that missed their deadline"),
+    ("avionics_task_executions", 'TotalExecs', "counter", "Executions started"),
+    ("avionics_task_last_exec_time_ms", 'LastExecTime', "gauge", "Duration of the last execution (ms)"),
+]
+
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _DurationHistogram:
+    __slots__ = ('buckets', 'count', 'sum')
+
+    def __init__(self):
+        self.buckets = [0] * len(HISTOGRAM_EDGES_MS)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, duration):
+        for i, edge in enumerate(HISTOGRAM_EDGES_MS):
+            if duration <= edge:
+                self.buckets[i] += 1
+                break
+        self.count += 1
+        self.sum += duration
+
+
+class MetricsCollector:
+    """Turns snapshots into exposition text, re-reading at most every cache_sec"""
+
+    def __init__(self, source, cache_sec=1.0):
+        self.source = source
+        self.cache_sec = cache_sec
+        self.merger = ExecWindowMerger()
+        self.histograms = {}
+        self.task_names = {}
+        self.snapshot = None
+        self.read_ms = 0.0
+        self.read_errors = 0
+        self.last_read_ok = False
+        self.reads = 0
+        self.scrapes = 0
+        self._refreshed_at = None
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Read a snapshot and fold its new executions into the histograms"""
+        started = time.perf_counter()
+        try:
+            snapshot = self.source.snapshot()
+        except Exception:
+            self.read_errors += 1
+            snapshot = None
+        self.last_read_ok = snapshot is not None
+        self.read_ms = (time.perf_counter() - started) * 1000
+        self.reads += 1
+        self._refreshed_at = time.monotonic()
+        self._pages = {}
+        if snapshot is None:
+            return
+        self.snapshot = snapshot
+        for task in snapshot.tasks:
+            self.task_names[task['TaskNumber']] = task.get('Name', f"Task {task['TaskNumber']}")
+        for entry in self.merger.merge(snapshot.exec_log, exec_log_count(snapshot)):
+            histogram = self.histograms.get(entry.task_type)
+            if histogram is None:
+                histogram = self.histograms[entry.task_type] = _DurationHistogram()
+            histogram.observe(entry.duration)
+
+    def _refresh_if_stale(self):
+        if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.cache_sec:
+            self.refresh()
+
+    def update(self):
+        """Re-read the source if the cache is stale, without counting a scrape"""
+        with self._lock:
+            self._refresh_if_stale()
+
+    def page(self, openmetrics=False):
+        """Exposition text for one scrape, from cache when it is fresh enough"""
+        with self._lock:
+            self.scrapes += 1
+            self._refresh_if_stale()
+            page = self._pages.get(openmetrics)
+            if page is None:
+                page = self._pages[openmetrics] = self.render(openmetrics).encode('utf-8')
+            return page
+
+    def render(self, openmetrics=False):
+        lines = []
+
+        def family(name, metric_type, help_text):
+            # OpenMetrics names counter families without the _total suffix
+            family_name = name if openmetrics or metric_type != "counter" else f"{name}_total"
+            lines.append(f"# HELP {family_name} {help_text}")
+            lines.append(f"# TYPE {family_name} {metric_type}")
+
+        def sample_name(name, metric_type):
+            return f"{name}_total" if metric_type == "counter" else name
+
+        snapshot = self.snapshot
+        family("avionics_up", "gauge", "1 if the last status read succeeded")
+        lines.append(f"avionics_up {1 if self.last_read_ok else 0}")
+        family("avionics_status_read_ms", "gauge", "Time taken by the last status read (ms)")
+        lines.append(f"avionics_status_read_ms {self.read_ms:.3f}")
+        family("avionics_status_read_errors", "counter", "Failed status reads")
+        lines.append(f"{sample_name('avionics_status_read_errors', 'counter')} {self.read_errors}")
+        family("avionics_exec_log_gaps", "counter", "Times executions may have scrolled past between reads")
+        lines.append(f"{sample_name('avionics_exec_log_gaps', 'counter')} {self.merger.gaps}")
+        family("avionics_exec_log_restarts", "counter", "Times the execution log restarted (module reload)")
+        lines.append(f"{sample_name('avionics_exec_log_restarts', 'counter')} {self.merger.restarts}")
+
+        if snapshot is not None:
+            family("avionics_scheduler_running", "gauge", "1 while the scheduler is RUNNING")
+            lines.append(f"avionics_scheduler_running {1 if snapshot.get('SchedulerStatus') == 'RUNNING' else 0}")
+            family("avionics_exec_log_entries", "gauge", "Entries in the module's execution log")
+            lines.append(f"avionics_exec_log_entries {_number(snapshot.get('ExecutionLogCount')) or 0}")
+
+            for name, field, metric_type, help_text in TASK_METRICS:
+                family(name, metric_type, help_text)
+                for task in snapshot.tasks:
+                    value = _number(task.get(field))
+                    if value is not None:
+                        lines.append(f"{sample_name(name, metric_type)}{self._labels(task['TaskNumber'])} {value}")
+
+        if self.histograms:
+            family("avionics_task_exec_duration_ms", "histogram", "Execution durations (ms)")
+            for task_type in sorted(self.histograms):
+                histogram = self.histograms[task_type]
+                cumulative = 0
+                for edge, count in zip(HISTOGRAM_EDGES_MS, histogram.buckets):
+                    cumulative += count
+                    lines.append(f"avionics_task_exec_duration_ms_bucket"
+                                 f"{self._labels(str(task_type), le=edge)} {cumulative}")
+                lines.append(f"avionics_task_exec_duration_ms_bucket"
+                             f"{self._labels(str(task_type), le='+Inf')} {histogram.count}")
+                lines.append(f"avionics_task_exec_duration_ms_sum{self._labels(str(task_type))} {histogram.sum}")
+                lines.append(f"avionics_task_exec_duration_ms_count{self._labels(str(task_type))} {histogram.count}")
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _labels(self, task_number, **extra):
+        name = self.task_names.get(task_number, f"Task {task_number}")
+        labels = f'task_id="{task_number}",task="{_label_value(name)}"'
+        for key, value in extra.items():
+            labels += f',{key}="{value}"'
+        return "{" + labels + "}"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    collector = None
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        openmetrics = 'application/openmetrics-text' in self.headers.get('Accept', '')
+        body = self.collector.page(openmetrics)
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsExporter:
+    """Embedded HTTP server publishing a MetricsCollector on a background thread
+
+    With poll_sec set, the collector also refreshes on its own so that
+    histograms keep up with the EXEC window between infrequent scrapes.
+    """
+
+    def __init__(self, source, port=9105, host="", cache_sec=1.0, poll_sec=None):
+        self.collector = MetricsCollector(source, cache_sec)
+        handler = type("MetricsHandler", (_MetricsHandler,), {'collector': self.collector})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.poll_sec = poll_sec
+        self._stop = threading.Event()
+        self._threads = []
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    def start(self):
+        serve = threading.Thread(target=self.server.serve_forever, name="MetricsExporter", daemon=True)
+        serve.start()
+        self._threads.append(serve)
+        if self.poll_sec:
+            poll = threading.Thread(target=self._poll, name="MetricsPoller", daemon=True)
+            poll.start()
+            self._threads.append(poll)
+
+    def _poll(self):
+        while not self._stop.wait(self.poll_sec):
+            self.collector.update()
+
+    def stop(self):
+        self._stop.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main(argv=None):
+    from telemetry import TELEMETRY_SOURCES, create_source
+
+    parser = argparse.ArgumentParser(description="Prometheus/OpenMetrics exporter for the avionics status")
+    parser.add_argument("--port", type=int, default=9105, help="HTTP port (default: 9105)")
+    parser.add_argument("--source", choices=sorted(TELEMETRY_SOURCES), default="proc")
+    parser.add_argument("--path", help="proc file or capture for the source")
+    parser.add_argument("--cache", type=float, default=1.0,
+                        help="seconds a rendered page is reused between scrapes (default: 1)")
+    parser.add_argument("--poll", type=float, default=1.0,
+                        help="background refresh interval in seconds, 0 to read only on scrape (default: 1)")
+    args = parser.parse_args(argv)
+
+    exporter = MetricsExporter(create_source(args.source, args.path), args.port,
+                               cache_sec=args.cache, poll_sec=args.poll or None)
+    exporter.start()
+    print(f"Serving metrics on http://localhost:{exporter.port}/metrics (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        exporter.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Batched task-parameter updates.
+
+apply_params() validates a whole parameter set before touching the
+module, writes it in one pass and, if any write fails, restores the
+values it had already changed, so the scheduler never runs with half a
+profile applied.  The outcome comes back as one ParamBatchResult that
+the caller can report in a single message.
+"""
+import time
+from collections import namedtuple
+
+from telemetry import TelemetryError
+
+PARAM_NAMES = ('period', 'deadline', 'workload')
+
+# Upper bound accepted for any period/deadline/workload value (ms)
+MAX_PARAM_MS = 60000
+
+ParamUpdate = namedtuple('ParamUpdate', ['task_name', 'param', 'value'])
+
+
+class ParamBatchResult(namedtuple('ParamBatchResult', [
+        'applied', 'unchanged', 'failed', 'rolled_back', 'elapsed_ms'])):
+    """Outcome of apply_params(); `failed` holds (ParamUpdate, reason) pairs"""
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def summary(self):
+        """One line description suitable for a status bar"""
+        if self.ok:
+            text = f"Updated {len(self.applied)} parameter(s)"
+            if self.unchanged:
+                text += f", {len(self.unchanged)} already set"
+            return f"{text} in {self.elapsed_ms:.1f} ms"
+        if self.rolled_back:
+            return f"{len(self.failed)} parameter(s) failed; changes rolled back"
+        return f"{len(self.failed)} parameter(s) failed, {len(self.applied)} applied"
+
+    def details(self):
+        """One line per failed update"""
+        return "\n".join(f"{update.task_name} {update.param}={update.value}: {reason}"
+                         for update, reason in self.failed)
+
+
+def current_params(snapshot):
+    """{task_name: {param: value}} for every task in a snapshot"""
+    current = {}
+    for task in snapshot.tasks:
+        values = {}
+        for param in PARAM_NAMES:
+            try:
+                values[param] = int(task.get(param.capitalize()))
+            except (TypeError, ValueError):
+                pass
+        current[task.get('Name', f"Task {task['TaskNumber']}")] = values
+    return current
+
+
+def validate_params(updates, current=None):
+    """Check a parameter set; returns (normalized updates, rejected pairs)
+
+    Values must be whole milliseconds in 1..MAX_PARAM_MS.  When the
+    current parameters are known, tasks must exist and every task must
+    end up with its deadline no later than its period.
+    """
+    normalized = []
+    rejected = []
+    seen = {}
+    for update in updates:
+        update = ParamUpdate(*update)
+        if current is not None and update.task_name not in current:
+            rejected.append((update, "unknown task"))
+            continue
+        if update.param not in PARAM_NAMES:
+            rejected.append((update, "unknown parameter"))
+            continue
+        try:
+            value = int(str(update.value).strip())
+        except ValueError:
+            rejected.append((update, "not a whole number of milliseconds"))
+            continue
+        if not 1 <= value <= MAX_PARAM_MS:
+            rejected.append((update, f"must be between 1 and {MAX_PARAM_MS} ms"))
+            continue
+        key = (update.task_name, update.param)
+        if seen.get(key, value) != value:
+            rejected.append((update, "conflicting values in one batch"))
+            continue
+        seen[key] = value
+        normalized.append(update._replace(value=value))
+
+    if current is not None:
+        for task_name in {update.task_name for update in normalized}:
+            values = dict(current[task_name])
+            values.update((param, seen[(task_name, param)]) for param in PARAM_NAMES
+                          if (task_name, param) in seen)
+            if values.get('deadline', 0) > values.get('period', MAX_PARAM_MS):
+                for update in normalized:
+                    if update.task_name == task_name and update.param in ('period', 'deadline'):
+                        rejected.append((update, "deadline would exceed period"))
+
+    return normalized, rejected
+
+
+def apply_params(source, updates, current=None, rollback=True):
+    """Validate and apply a parameter set through a telemetry source
+
+    Nothing is written if validation fails.  Parameters that already
+    hold the requested value are skipped.  If a write fails, earlier
+    writes of the batch are undone (when `rollback` is set and the old
+    value could be read).
+    """
+    started = time.perf_counter()
+    normalized, rejected = validate_params(updates, current)
+    if rejected:
+        return ParamBatchResult((), (), tuple(rejected), False,
+                                (time.perf_counter() - started) * 1000)
+
+    applied = []
+    previous = []
+    unchanged = []
+    failed = []
+    rolled_back = False
+    with source.transaction():
+        for update in normalized:
+            old = source.read_param(update.task_name, update.param)
+            if old == update.value:
+                unchanged.append(update)
+                continue
+            try:
+                source.set_param(*update)
+            except TelemetryError as e:
+                failed.append((update, str(e)))
+                break
+            applied.append(update)
+            previous.append(old)
+
+        if failed and rollback and applied:
+            for update, old in reversed(list(zip(applied, previous))):
+                if old is None:
+                    failed.append((update, "applied, but the old value is unknown"))
+                    continue
+                try:
+                    source.set_param(update.task_name, update.param, old)
+                except TelemetryError as e:
+                    failed.append((update, f"rollback failed: {e}"))
+            rolled_back = True
+            applied = []
+
+    return ParamBatchResult(tuple(applied), tuple(unchanged), tuple(failed), rolled_back,
+                            (time.perf_counter() - started) * 1000)
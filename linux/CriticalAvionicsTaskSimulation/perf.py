@@ -0,0 +1,135 @@
+"""Optional per-stage timing of the GUI's hot paths.
+
+A PerfRecorder keeps the last PERF_WINDOW wall times of every stage in a
+ring buffer, plus call counts and totals, so percentiles are always
+available without unbounded memory.  While disabled, stage() returns a
+shared no-op context manager and costs next to nothing.
+
+Stages recorded by the GUI:
+
+* read / parse -- procfs read and status parsing, on the telemetry worker
+* history / widgets -- per-snapshot model update and task grid refresh
+* tk_redraw -- Tk's own idle-time layout and drawing after an update
+* snapshot_age -- time from the read to the end of the screen update
+* gantt_index / gantt_draw -- Gantt chart indexing and canvas updates
+"""
+import contextlib
+import json
+import threading
+import time
+
+from exec_stats import PERCENTILES, percentile
+from history import RingBuffer
+
+# Samples kept per stage for the percentiles
+PERF_WINDOW = 1000
+
+_NOOP = contextlib.nullcontext()
+
+
+class _StageTimer:
+    __slots__ = ('recorder', 'stage', 'started')
+
+    def __init__(self, recorder, stage):
+        self.recorder = recorder
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.recorder.record(self.stage, (time.perf_counter() - self.started) * 1000)
+
+
+class _StageSamples:
+    __slots__ = ('samples', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self, window):
+        self.samples = RingBuffer(window)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+
+class PerfRecorder:
+    """Wall time and call counts per stage, with percentile summaries"""
+
+    def __init__(self, enabled=False, window=PERF_WINDOW):
+        self.enabled = enabled
+        self.window = window
+        self.stages = {}
+        self.started_at = time.time()
+        # Bumped on every sample so views can tell whether to redraw
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        """Context manager timing one run of stage `name`"""
+        if not self.enabled:
+            return _NOOP
+        return _StageTimer(self, name)
+
+    def record(self, name, elapsed_ms):
+        if not self.enabled:
+            return
+        # The telemetry worker records from its own thread
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = _StageSamples(self.window)
+            stage.samples.append(elapsed_ms)
+            stage.count += 1
+            stage.total_ms += elapsed_ms
+            if elapsed_ms > stage.max_ms:
+                stage.max_ms = elapsed_ms
+            self.version += 1
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+            self.started_at = time.time()
+            self.version += 1
+
+    def summary(self):
+        """{stage: {count, total_ms, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}}"""
+        with self._lock:
+            stages = [(name, stage, stage.samples.values()) for name, stage in self.stages.items()]
+        summary = {}
+        for name, stage, samples in stages:
+            samples.sort()
+            entry = {
+                'count': stage.count,
+                'total_ms': round(stage.total_ms, 3),
+                'mean_ms': round(stage.total_ms / stage.count, 3),
+            }
+            for q in PERCENTILES:
+                entry[f'p{q}_ms'] = round(percentile(samples, q), 3)
+            entry['max_ms'] = round(stage.max_ms, 3)
+            summary[name] = entry
+        return summary
+
+    def to_dict(self):
+        return {
+            'started_at': self.started_at,
+            'dumped_at': time.time(),
+            'window': self.window,
+            'stages': self.summary(),
+        }
+
+    def dump(self, path):
+        """Write the summary as JSON"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def format_table(self):
+        """Fixed-width text table of the summary, slowest p95 first"""
+        summary = self.summary()
+        lines = [f"{'Stage':<14}{'Count':>8}{'Mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'Max':>9}  (ms)",
+                 "-" * 72]
+        for name, entry in sorted(summary.items(), key=lambda item: -item[1]['p95_ms']):
+            lines.append(f"{name:<14}{entry['count']:>8}{entry['mean_ms']:>9.2f}{entry['p50_ms']:>9.2f}"
+                         f"{entry['p95_ms']:>9.2f}{entry['p99_ms']:>9.2f}{entry['max_ms']:>9.2f}")
+        if not summary:
+            lines.append("No samples yet" if self.enabled else "Timing is disabled")
+        return "\n".join(lines)
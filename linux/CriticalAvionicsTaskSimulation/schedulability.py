@@ -0,0 +1,181 @@
+"""Offline schedulability analysis for the avionics task set.
+
+Two classic tests are applied to (period, deadline, workload, priority):
+
+* the Liu & Layland utilization bound U <= n(2^(1/n) - 1), a sufficient
+  test for rate-monotonic priorities;
+* fixed-priority response-time analysis adapted to how avionics_sim.c
+  actually schedules: jobs run to completion (mdelay), releases are only
+  noticed at the next 10 ms scheduler tick, and the scheduler re-arms
+  itself 10 ms after every execution.
+
+The module itself only flags a miss when a job's execution time exceeds
+its deadline; the response-time test also catches jobs that start too
+late or whose release is lost because the previous one is still pending.
+"""
+import argparse
+from collections import namedtuple
+
+# Scheduler timer period of avionics_sim.c; the scheduler model uses it too
+SCHEDULER_TICK_MS = 10
+
+# Give up on the response-time recurrence once it passes this many hyperperiods
+_MAX_BUSY_PERIODS = 100
+
+TaskSpec = namedtuple('TaskSpec', ['name', 'priority', 'period', 'deadline', 'workload'])
+
+TaskVerdict = namedtuple('TaskVerdict', [
+    'name', 'priority', 'utilization',
+    'response_time',    # worst-case release-to-completion time (ms), None if unbounded
+    'deadline',
+    'schedulable',      # response_time <= deadline
+    'module_miss',      # workload > deadline: the module reports every job as MISSED
+])
+
+
+class SchedulabilityReport(namedtuple('SchedulabilityReport', [
+        'tasks', 'utilization', 'effective_utilization', 'll_bound'])):
+    """Per-task verdicts (highest priority first) plus the utilization tests"""
+
+    __slots__ = ()
+
+    @property
+    def ll_guaranteed(self):
+        return self.utilization <= self.ll_bound
+
+    @property
+    def schedulable(self):
+        return all(task.schedulable and not task.module_miss for task in self.tasks)
+
+    def failing(self):
+        """Names of tasks that fail either test"""
+        return {task.name for task in self.tasks if not task.schedulable or task.module_miss}
+
+    def slack(self):
+        """{task name: deadline minus worst-case response (ms)}; None when unbounded"""
+        return {task.name: None if task.response_time is None else task.deadline - task.response_time
+                for task in self.tasks}
+
+    def worse_than(self, before):
+        """Lines for the tasks whose slack is smaller here than in the `before` report"""
+        old_slack = before.slack()
+        lines = []
+        for name, slack in self.slack().items():
+            if name not in old_slack:
+                continue
+            old = old_slack[name]
+            if slack is None and old is not None:
+                lines.append(f"{name}: slack {old} ms -> unbounded (overload)")
+            elif slack is not None and old is not None and slack < old:
+                lines.append(f"{name}: slack {old} ms -> {slack} ms")
+        return lines
+
+    def summary(self):
+        verdict = "schedulable" if self.schedulable else f"{len(self.failing())} task(s) at risk"
+        return (f"U = {self.utilization:.3f} (bound {self.ll_bound:.3f}, "
+                f"{self.effective_utilization:.3f} with tick overhead): {verdict}")
+
+    def details(self):
+        """One line per task"""
+        lines = []
+        for task in self.tasks:
+            if task.response_time is None:
+                response = "unbounded (overload)"
+            else:
+                response = f"{task.response_time} ms"
+            line = f"{task.name}: R = {response}, D = {task.deadline} ms"
+            if task.module_miss:
+                line += " - workload exceeds deadline"
+            elif not task.schedulable:
+                line += " - may miss"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def liu_layland_bound(n):
+    return n * (2 ** (1 / n) - 1) if n else 1.0
+
+
+def _response_time(task, higher, blocking, tick_ms):
+    """Worst-case response time of a non-preemptive job, or None if unbounded
+
+    A job can be blocked by one lower-priority job that has just started,
+    then waits for every higher-priority job released before it starts.
+    Each execution also costs one scheduler tick before the next dispatch,
+    and every release can be noticed up to one tick late.
+    """
+    limit = _MAX_BUSY_PERIODS * max([task.period] + [hp.period for hp in higher])
+    start = blocking
+    while True:
+        demand = blocking + sum(((start + tick_ms) // hp.period + 1) * (hp.workload + tick_ms)
+                                for hp in higher)
+        if demand == start:
+            return tick_ms + start + task.workload
+        if demand > limit:
+            return None
+        start = demand
+
+
+def analyze(tasks, tick_ms=SCHEDULER_TICK_MS):
+    """SchedulabilityReport for a list of TaskSpec"""
+    ordered = sorted(tasks, key=lambda task: task.priority)
+    verdicts = []
+    for i, task in enumerate(ordered):
+        higher = [hp for hp in ordered[:i] if hp.priority < task.priority]
+        lower = [lp for lp in ordered[i + 1:] if lp.priority >= task.priority]
+        blocking = max([lp.workload + tick_ms for lp in lower], default=0)
+        response = _response_time(task, higher, blocking, tick_ms)
+        verdicts.append(TaskVerdict(
+            task.name, task.priority, task.workload / task.period,
+            response, task.deadline,
+            response is not None and response <= task.deadline,
+            task.workload > task.deadline,
+        ))
+
+    utilization = sum(task.workload / task.period for task in ordered)
+    effective = sum((task.workload + tick_ms) / task.period for task in ordered)
+    return SchedulabilityReport(tuple(verdicts), utilization, effective,
+                                liu_layland_bound(len(ordered)))
+
+
+def task_specs(snapshot, overrides=None):
+    """TaskSpec list from a snapshot, with {task_name: {param: value}} applied on top"""
+    overrides = overrides or {}
+    specs = []
+    for task in snapshot.tasks:
+        name = task.get('Name', f"Task {task['TaskNumber']}")
+        try:
+            spec = TaskSpec(name, int(task.get('Priority', 99)), int(task['Period']),
+                            int(task['Deadline']), int(task['Workload']))
+        except (KeyError, ValueError):
+            continue
+        values = {param: int(value) for param, value in overrides.get(name, {}).items()}
+        specs.append(spec._replace(**values))
+    return specs
+
+
+def main(argv=None):
+    from telemetry import DEFAULT_TASK_SET, TELEMETRY_SOURCES, TelemetryError, create_source
+
+    parser = argparse.ArgumentParser(description="Schedulability analysis of the avionics task set")
+    parser.add_argument("--source", choices=sorted(TELEMETRY_SOURCES),
+                        help="read the task set from a telemetry source (default: built-in set)")
+    parser.add_argument("--path", help="proc file or capture for the source")
+    args = parser.parse_args(argv)
+
+    if args.source:
+        try:
+            specs = task_specs(create_source(args.source, args.path).snapshot())
+        except TelemetryError as e:
+            raise SystemExit(f"Could not read task set: {e}")
+    else:
+        specs = [TaskSpec(name, priority, period, deadline, workload)
+                 for name, priority, period, deadline, workload in DEFAULT_TASK_SET]
+
+    report = analyze(specs)
+    print(report.summary())
+    print(report.details())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Single-pass parser turning a status dump into an immutable snapshot.
+
+One read of /proc/avionics_status is parsed exactly once per refresh and
+the resulting Snapshot is shared by the task grid, the Gantt chart and
+the statistics views.
+"""
+import re
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+# One EXEC line of the kernel's execution log
+ExecEntry = namedtuple('ExecEntry', ['task_type', 'start_time', 'duration', 'deadline_met'])
+
+# Every line of the proc format matches exactly one of these alternatives:
+#   EXEC:<type>,<start_ms>,<duration_ms>,<MET|MISSED>
+#   Task<n>_<Field>: <value>
+#   <Key>: <value>
+_LINE_RE = re.compile(
+    r'^(?:EXEC:(\d+),(-?\d+),(-?\d+),(MET|MISSED)'
+    r'|Task(\d+)_(\w+):[ \t]*(.*?)'
+    r'|(\w+):[ \t]*(.*?))[ \t]*$',
+    re.MULTILINE
+)
+
+_EMPTY = MappingProxyType({})
+
+
+class Snapshot(namedtuple('Snapshot', ['system', 'tasks', 'exec_log', 'taken_at'])):
+    """Parsed view of one status dump
+
+    system   -- read-only mapping of system level fields (SchedulerStatus, ...)
+    tasks    -- tuple of read-only per-task mappings, ordered by task number;
+                keys are the field names without the TaskN_ prefix plus
+                'TaskNumber'
+    exec_log -- tuple of ExecEntry records in the order the module emitted them
+    taken_at -- time.time() when the dump was parsed
+    """
+
+    __slots__ = ()
+
+    def get(self, key, default=None):
+        """Look up a system level field"""
+        return self.system.get(key, default)
+
+    def task(self, number):
+        """Return the fields of task `number`, or an empty mapping"""
+        for task in self.tasks:
+            if task.get('TaskNumber') == str(number):
+                return task
+        return _EMPTY
+
+
+def parse_status(text, taken_at=None):
+    """Parse a /proc/avionics_status dump into a Snapshot"""
+    system = {}
+    tasks = {}
+    exec_log = []
+
+    for (ex_type, ex_start, ex_duration, ex_result,
+         task_num, task_key, task_value,
+         key, value) in _LINE_RE.findall(text):
+        if ex_type:
+            exec_log.append(ExecEntry(int(ex_type), int(ex_start), int(ex_duration),
+                                      ex_result == 'MET'))
+        elif task_num:
+            fields = tasks.get(task_num)
+            if fields is None:
+                fields = tasks[task_num] = {'TaskNumber': task_num}
+            fields[task_key] = task_value
+        elif key:
+            system[key] = value
+
+    ordered_tasks = tuple(
+        MappingProxyType(tasks[num]) for num in sorted(tasks, key=int)
+    )
+    return Snapshot(MappingProxyType(system), ordered_tasks, tuple(exec_log),
+                    time.time() if taken_at is None else taken_at)
@@ -0,0 +1,291 @@
+"""Parallel parameter sweeps over the scheduler model.
+
+A sweep scales every task's workload and period by factors taken from
+two grids (e.g. workload 0.5x..3x against period 0.5x..2x) and runs the
+scheduler model once per combination in a ProcessPoolExecutor.  Results
+stream back as they complete, so a heat map of miss rates -- and the
+frontier between feasible and infeasible settings -- fills in while the
+sweep is still running.
+"""
+import argparse
+import csv
+import os
+import queue
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from scheduler_model import SchedulerModel
+
+SweepResult = namedtuple('SweepResult', [
+    'workload_scale', 'period_scale',
+    'executions', 'misses',     # misses as the module reports them (workload > deadline)
+    'dropped',                  # releases lost because the previous job never started
+    'miss_rate',                # (misses + dropped) / releases
+])
+
+
+def parse_scales(text):
+    """Scale factors from "start:stop:step" (inclusive) or "a,b,c" """
+    if ':' in text:
+        start, stop, step = (float(part) for part in text.split(':'))
+        if step <= 0 or stop < start:
+            raise ValueError(f"bad range {text!r}")
+        count = int(round((stop - start) / step)) + 1
+        return [round(start + i * step, 6) for i in range(count)]
+    return [float(part) for part in text.split(',') if part.strip()]
+
+
+def scale_task_set(task_set, workload_scale, period_scale):
+    """Task set with workloads and periods (and deadlines, with their period) scaled"""
+    return [(name, priority,
+             max(1, round(period * period_scale)),
+             max(1, round(deadline * period_scale)),
+             max(1, round(workload * workload_scale)))
+            for name, priority, period, deadline, workload in task_set]
+
+
+def run_point(task_set, workload_scale, period_scale, duration_ms):
+    """Simulate one grid point; runs in a worker process"""
+    model = SchedulerModel(scale_task_set(task_set, workload_scale, period_scale))
+    for _ in model.run(duration_ms):
+        pass
+    executions = sum(task.total_execs for task in model.tasks)
+    misses = sum(task.missed_count for task in model.tasks)
+    dropped = sum(task.dropped_releases for task in model.tasks)
+    releases = executions + dropped
+    return SweepResult(workload_scale, period_scale, executions, misses, dropped,
+                       (misses + dropped) / releases if releases else 0.0)
+
+
+def run_sweep(task_set, workload_scales, period_scales, duration_ms, workers=None):
+    """Yield a SweepResult per (workload, period) combination as each completes
+
+    Closing the generator early cancels the combinations not yet started.
+    """
+    task_set = [tuple(task) for task in task_set]
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(run_point, task_set, workload_scale, period_scale, duration_ms)
+                   for period_scale in period_scales
+                   for workload_scale in workload_scales]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SweepRunner:
+    """Runs a sweep on a background thread and queues results for a UI to drain"""
+
+    def __init__(self, task_set, workload_scales, period_scales, duration_ms, workers=None):
+        self.task_set = task_set
+        self.workload_scales = workload_scales
+        self.period_scales = period_scales
+        self.duration_ms = duration_ms
+        self.workers = workers
+        self.total = len(workload_scales) * len(period_scales)
+        self.completed = 0
+        self.error = None
+        self.elapsed_sec = 0.0
+        self.results = queue.SimpleQueue()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="SweepRunner", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def drain(self):
+        results = []
+        while True:
+            try:
+                results.append(self.results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def _run(self):
+        started = time.perf_counter()
+        sweep = run_sweep(self.task_set, self.workload_scales, self.period_scales,
+                          self.duration_ms, self.workers)
+        try:
+            for result in sweep:
+                self.results.put(result)
+                self.completed += 1
+                if self._cancel.is_set():
+                    break
+        except Exception as e:
+            self.error = e
+        finally:
+            sweep.close()
+            self.elapsed_sec = time.perf_counter() - started
+
+
+def miss_rate_color(rate):
+    """Green at 0, through yellow, to red at 50% or more"""
+    low, mid, high = (0x2E, 0xCC, 0x71), (0xF1, 0xC4, 0x0F), (0xE7, 0x4C, 0x3C)
+    if rate <= 0:
+        return "#%02X%02X%02X" % low
+    fraction = min(rate / 0.5, 1.0)
+    start, end, t = (low, mid, fraction * 2) if fraction < 0.5 else (mid, high, fraction * 2 - 1)
+    return "#%02X%02X%02X" % tuple(int(a + (b - a) * t) for a, b in zip(start, end))
+
+
+class SweepHeatMap:
+    """Canvas heat map of miss rate over the (workload, period) grid
+
+    Cells are coloured as results arrive.  In each period row a black
+    marker sits on the feasibility frontier: the left edge of the first
+    cell with misses, once every cell to its left is known to be clean.
+    """
+
+    margin_x = 90
+    margin_y = 50
+    cell_width = 28
+    cell_height = 22
+
+    def __init__(self, canvas, workload_scales, period_scales):
+        self.canvas = canvas
+        self.workload_scales = list(workload_scales)
+        self.period_scales = list(period_scales)
+        self.columns = {scale: i for i, scale in enumerate(self.workload_scales)}
+        self.rows = {scale: i for i, scale in enumerate(self.period_scales)}
+        self.rates = [[None] * len(self.workload_scales) for _ in self.period_scales]
+        self.cells = {}
+        self.frontier = {}
+        self._draw_axes()
+
+    def _cell_origin(self, row, column):
+        # Period grows upwards, like a plot
+        y = self.margin_y + (len(self.period_scales) - 1 - row) * self.cell_height
+        return self.margin_x + column * self.cell_width, y
+
+    def _draw_axes(self):
+        canvas = self.canvas
+        width = len(self.workload_scales) * self.cell_width
+        height = len(self.period_scales) * self.cell_height
+        canvas.create_text(self.margin_x + width / 2, 20, text="Miss rate by workload x period scale",
+                           font=("Arial", 12, "bold"))
+        label_every = max(1, len(self.workload_scales) // 15)
+        for i, scale in enumerate(self.workload_scales):
+            if i % label_every == 0:
+                x, _ = self._cell_origin(0, i)
+                canvas.create_text(x + self.cell_width / 2, self.margin_y + height + 12,
+                                   text=f"{scale:g}x", font=("Arial", 8))
+        label_every = max(1, len(self.period_scales) // 20)
+        for row, scale in enumerate(self.period_scales):
+            if row % label_every == 0:
+                _, y = self._cell_origin(row, 0)
+                canvas.create_text(self.margin_x - 10, y + self.cell_height / 2,
+                                   text=f"{scale:g}x", anchor="e", font=("Arial", 8))
+        canvas.create_text(self.margin_x + width / 2, self.margin_y + height + 30,
+                           text="Workload scale", font=("Arial", 10))
+        canvas.create_text(20, self.margin_y + height / 2, text="Period\nscale", font=("Arial", 10))
+        canvas.configure(scrollregion=(0, 0, self.margin_x + width + 20, self.margin_y + height + 50))
+
+    def add(self, result):
+        row = self.rows[result.period_scale]
+        column = self.columns[result.workload_scale]
+        self.rates[row][column] = result.miss_rate
+        x, y = self._cell_origin(row, column)
+        self.cells[row, column] = self.canvas.create_rectangle(
+            x, y, x + self.cell_width, y + self.cell_height,
+            fill=miss_rate_color(result.miss_rate), outline="white")
+        self._update_frontier(row)
+
+    def _update_frontier(self, row):
+        boundary = None
+        for column, rate in enumerate(self.rates[row]):
+            if rate is None:
+                break
+            if rate > 0:
+                boundary = column
+                break
+        if boundary is None:
+            return
+        x, y = self._cell_origin(row, boundary)
+        marker = self.frontier.get(row)
+        if marker is None:
+            self.frontier[row] = self.canvas.create_line(x, y, x, y + self.cell_height,
+                                                         fill="black", width=3)
+        else:
+            self.canvas.coords(marker, x, y, x, y + self.cell_height)
+            self.canvas.tag_raise(marker)
+
+
+def render_text_heatmap(results, workload_scales, period_scales):
+    """ASCII heat map, highest period scale first"""
+    shades = " .:-=+*#%@"
+    rates = {(r.workload_scale, r.period_scale): r.miss_rate for r in results}
+    lines = []
+    for period_scale in reversed(period_scales):
+        row = ""
+        for workload_scale in workload_scales:
+            rate = rates.get((workload_scale, period_scale))
+            if rate is None:
+                row += "?"
+            elif rate <= 0:
+                row += shades[0]
+            else:
+                row += shades[min(max(1, int(rate * 2 * (len(shades) - 1))), len(shades) - 1)]
+        lines.append(f"{period_scale:6.2f}x |{row}|")
+    lines.append(" " * 8 + "+" + "-" * len(workload_scales) + "+")
+    lines.append(f"{'':9}workload {workload_scales[0]:g}x .. {workload_scales[-1]:g}x "
+                 f"(' ' = no misses, '@' = 50%+)")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    from telemetry import DEFAULT_TASK_SET
+
+    parser = argparse.ArgumentParser(description="Parallel workload/period sweep of the scheduler model")
+    parser.add_argument("--workload", default="0.5:3:0.25",
+                        help="workload scales, start:stop:step or a,b,c (default: 0.5:3:0.25)")
+    parser.add_argument("--period", default="0.5:2:0.25",
+                        help="period scales, start:stop:step or a,b,c (default: 0.5:2:0.25)")
+    parser.add_argument("--seconds", type=float, default=60,
+                        help="virtual time simulated per combination (default: 60)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help=f"worker processes (default: {os.cpu_count()})")
+    parser.add_argument("--csv", help="also write every result to this CSV file")
+    args = parser.parse_args(argv)
+
+    workload_scales = parse_scales(args.workload)
+    period_scales = parse_scales(args.period)
+    total = len(workload_scales) * len(period_scales)
+    writer = None
+    if args.csv:
+        csv_file = open(args.csv, 'w', newline='')
+        writer = csv.writer(csv_file)
+        writer.writerow(SweepResult._fields)
+
+    started = time.perf_counter()
+    results = []
+    try:
+        for result in run_sweep(DEFAULT_TASK_SET, workload_scales, period_scales,
+                                int(args.seconds * 1000), args.jobs):
+            results.append(result)
+            if writer:
+                writer.writerow(result)
+            print(f"[{len(results)}/{total}] workload {result.workload_scale:g}x "
+                  f"period {result.period_scale:g}x: miss rate {result.miss_rate:.1%}",
+                  file=sys.stderr)
+    finally:
+        if writer:
+            csv_file.close()
+
+    print(render_text_heatmap(results, workload_scales, period_scales))
+    print(f"{total} combinations in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
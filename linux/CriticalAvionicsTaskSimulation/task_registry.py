@@ -0,0 +1,142 @@
+"""Task registry shared by every view.
+
+The task set is taken from the status dump itself (TaskN_Name,
+TaskN_Priority, ...), so the grid, the Gantt chart and the statistics
+report work for any number of tasks instead of the module's default
+five.  Lookups by task id and by name are dict lookups; colours come
+from fixed palettes for the first tasks and are generated beyond them.
+"""
+import colorsys
+from collections import namedtuple
+
+from telemetry import DEFAULT_TASK_SET
+
+# Gantt bar colours, by task id (the first five match the original chart)
+TASK_PALETTE = ("#E74C3C", "#F39C12", "#3498DB", "#2ECC71", "#9B59B6")
+
+# Priority badge colours, by priority (0 = most critical)
+PRIORITY_PALETTE = ("#FF0000", "#FF8C00", "#FFD700", "#32CD32", "#87CEEB")
+
+UNKNOWN_COLOR = "#95A5A6"
+
+TaskInfo = namedtuple('TaskInfo', ['task_id', 'name', 'priority', 'color', 'priority_color'])
+
+
+def palette_color(palette, index):
+    """palette[index], or an evenly spread generated colour past its end"""
+    if index is None or index < 0:
+        return UNKNOWN_COLOR
+    if index < len(palette):
+        return palette[index]
+    # Golden-ratio hue steps keep neighbouring tasks distinguishable
+    hue = (index * 0.618033988749895) % 1.0
+    red, green, blue = colorsys.hsv_to_rgb(hue, 0.65, 0.85)
+    return "#%02X%02X%02X" % (int(red * 255), int(green * 255), int(blue * 255))
+
+
+def _int(value, default=None):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def task_info(task_id, name=None, priority=None):
+    """TaskInfo with the palette colours filled in"""
+    if priority is None:
+        priority = task_id
+    return TaskInfo(task_id, name or f"Task {task_id}", priority,
+                    palette_color(TASK_PALETTE, task_id), palette_color(PRIORITY_PALETTE, priority))
+
+
+class TaskRegistry:
+    """Known tasks, ordered by priority, with O(1) lookup by id and name
+
+    `version` changes whenever the task set does (tasks added, removed,
+    renamed or re-prioritised), so views can rebuild their layout only
+    when they have to.
+    """
+
+    def __init__(self, tasks=()):
+        self.version = 0
+        self._signature = None
+        self._extended = None
+        self._set(list(tasks))
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        registry = cls()
+        registry.update(snapshot)
+        return registry
+
+    @classmethod
+    def from_task_set(cls, task_set=DEFAULT_TASK_SET):
+        """Registry for a (name, priority, period, deadline, workload) list; ids are positions"""
+        return cls(task_info(i, task[0], task[1]) for i, task in enumerate(task_set))
+
+    def _set(self, tasks):
+        self.tasks = sorted(tasks, key=lambda task: (task.priority, task.task_id))
+        self.by_id = {task.task_id: task for task in self.tasks}
+        self.by_name = {task.name: task for task in self.tasks}
+        self.version += 1
+
+    def update(self, snapshot):
+        """Follow the task set of a snapshot; returns True if it changed"""
+        signature = tuple((task.get('TaskNumber'), task.get('Name'), task.get('Priority'))
+                          for task in snapshot.tasks)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        tasks = []
+        for number, name, priority in signature:
+            task_id = _int(number)
+            if task_id is not None:
+                tasks.append(task_info(task_id, name, _int(priority, task_id)))
+        self._set(tasks)
+        return True
+
+    def with_ids(self, task_ids):
+        """Copy of the registry that also covers task_ids (unknown ones get placeholders)
+
+        The copy is reused until this registry or the missing ids change, so
+        views can compare identity and version to spot a new layout.
+        """
+        missing = tuple(task_id for task_id in task_ids if task_id not in self.by_id)
+        if not missing:
+            return self
+        key = (self.version, missing)
+        if self._extended is None or self._extended[0] != key:
+            self._extended = (key, TaskRegistry(self.tasks + [task_info(task_id) for task_id in missing]))
+        return self._extended[1]
+
+    def get(self, task_id):
+        """TaskInfo for task_id, or None"""
+        return self.by_id.get(task_id)
+
+    def find(self, name):
+        """TaskInfo for a task name, or None"""
+        return self.by_name.get(name)
+
+    def higher_priority(self, task_id):
+        """Ids of the tasks that take precedence over task_id"""
+        task = self.by_id.get(task_id)
+        if task is None:
+            return []
+        return [other.task_id for other in self.tasks if other.priority < task.priority]
+
+    def name(self, task_id):
+        task = self.by_id.get(task_id)
+        return task.name if task else f"Task {task_id}"
+
+    def color(self, task_id):
+        task = self.by_id.get(task_id)
+        return task.color if task else UNKNOWN_COLOR
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __contains__(self, task_id):
+        return task_id in self.by_id
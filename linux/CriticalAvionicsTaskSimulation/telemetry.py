@@ -0,0 +1,394 @@
+"""Telemetry sources for the avionics GUI.
+
+Every source produces text in the /proc/avionics_status format, so the
+rest of the tooling does not care whether it is talking to the kernel
+module, a saved file, a recorded capture or the in-process simulator.
+"""
+import contextlib
+import os
+import threading
+import time
+
+from scheduler_model import SCHEDULER_TICK_MS, SchedulerModel
+from snapshot import parse_status
+
+PROC_FILE_PATH = "/proc/avionics_status"
+SYS_PARAM_BASE_PATH = "/sys/module/avionics_sim/parameters"
+
+# Task parameter mappings
+TASK_PARAMS = {
+    "Flight Attitude Monitor": {
+        "period": f"{SYS_PARAM_BASE_PATH}/attitude_period_ms",
+        "deadline": f"{SYS_PARAM_BASE_PATH}/attitude_deadline_ms",
+        "workload": f"{SYS_PARAM_BASE_PATH}/attitude_workload_ms"
+    },
+    "Engine Control": {
+        "period": f"{SYS_PARAM_BASE_PATH}/engine_period_ms",
+        "deadline": f"{SYS_PARAM_BASE_PATH}/engine_deadline_ms",
+        "workload": f"{SYS_PARAM_BASE_PATH}/engine_workload_ms"
+    },
+    "Navigation System": {
+        "period": f"{SYS_PARAM_BASE_PATH}/nav_period_ms",
+        "deadline": f"{SYS_PARAM_BASE_PATH}/nav_deadline_ms",
+        "workload": f"{SYS_PARAM_BASE_PATH}/nav_workload_ms"
+    },
+    "Communication System": {
+        "period": f"{SYS_PARAM_BASE_PATH}/comm_period_ms",
+        "deadline": f"{SYS_PARAM_BASE_PATH}/comm_deadline_ms",
+        "workload": f"{SYS_PARAM_BASE_PATH}/comm_workload_ms"
+    },
+    "Cabin Systems": {
+        "period": f"{SYS_PARAM_BASE_PATH}/cabin_period_ms",
+        "deadline": f"{SYS_PARAM_BASE_PATH}/cabin_deadline_ms",
+        "workload": f"{SYS_PARAM_BASE_PATH}/cabin_workload_ms"
+    }
+}
+
+# Default task set, mirrors init_avionics_tasks() in avionics_sim.c
+# (name, priority, period_ms, deadline_ms, workload_ms)
+DEFAULT_TASK_SET = [
+    ("Flight Attitude Monitor", 0, 100, 50, 30),
+    ("Engine Control", 1, 200, 100, 60),
+    ("Navigation System", 2, 500, 200, 120),
+    ("Communication System", 3, 1000, 400, 150),
+    ("Cabin Systems", 4, 2000, 800, 200),
+]
+
+# Capture files hold several status dumps, each introduced by this marker
+CAPTURE_FRAME_MARKER = "=== FRAME "
+
+
+class TelemetryError(Exception):
+    """Raised when a telemetry source cannot produce a status dump"""
+
+
+class TelemetrySource:
+    """Base class for anything that produces /proc/avionics_status text"""
+
+    kind = "base"
+    writable = False
+
+    def describe(self):
+        """Short human readable description for status bars"""
+        return self.kind
+
+    def read_text(self):
+        """Return one status dump as a string"""
+        raise NotImplementedError
+
+    def snapshot(self):
+        """Read and parse one status dump; one read per call"""
+        return parse_status(self.read_text())
+
+    def read_param(self, task_name, param):
+        """Current value of a task parameter, or None if it cannot be read"""
+        return None
+
+    def set_param(self, task_name, param, value):
+        """Change a task parameter; raises TelemetryError on failure"""
+        raise TelemetryError(f"{self.describe()} is read-only")
+
+    def write_param(self, task_name, param, value):
+        """Change a task parameter; returns True on success"""
+        try:
+            self.set_param(task_name, param, value)
+            return True
+        except TelemetryError:
+            return False
+
+    def transaction(self):
+        """Context manager held around a batch of parameter changes"""
+        return contextlib.nullcontext()
+
+    def reader(self):
+        """Source for another poller (recorder, exporter) reading alongside this one"""
+        return self
+
+    def close(self):
+        pass
+
+
+class ProcTelemetrySource(TelemetrySource):
+    """Live backend reading the kernel module's procfs/sysfs files"""
+
+    kind = "proc"
+    writable = True
+
+    def __init__(self, path=PROC_FILE_PATH):
+        self.path = path
+
+    def describe(self):
+        return f"procfs ({self.path})"
+
+    def read_text(self):
+        try:
+            with open(self.path, 'r') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise TelemetryError("Module not loaded or proc file not found")
+        except OSError as e:
+            raise TelemetryError(f"Error reading proc file: {e}")
+
+    def read_param(self, task_name, param):
+        path = TASK_PARAMS.get(task_name, {}).get(param)
+        if path is None:
+            return None
+        try:
+            with open(path, 'r') as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def set_param(self, task_name, param, value):
+        path = TASK_PARAMS.get(task_name, {}).get(param)
+        if path is None:
+            raise TelemetryError(f"No sysfs parameter for {task_name} {param}")
+        try:
+            with open(path, 'w') as f:
+                f.write(str(value))
+        except OSError as e:
+            raise TelemetryError(f"Cannot write {os.path.basename(path)}: {e.strerror or e}")
+
+
+class FileTelemetrySource(TelemetrySource):
+    """Re-reads a saved status dump (e.g. `cat /proc/avionics_status > dump.txt`)"""
+
+    kind = "file"
+
+    def __init__(self, path):
+        self.path = path
+
+    def describe(self):
+        return f"file ({os.path.basename(self.path)})"
+
+    def read_text(self):
+        try:
+            with open(self.path, 'r') as f:
+                return f.read()
+        except OSError as e:
+            raise TelemetryError(f"Error reading {self.path}: {e}")
+
+
+class ReplayTelemetrySource(TelemetrySource):
+    """Steps through a recorded capture, one frame per read
+
+    A capture is a text file of consecutive status dumps, each starting
+    with a line of the form `=== FRAME <timestamp> ===`.  A file without
+    frame markers is treated as a single frame.  Frames are read from
+    disk as they are replayed, so a capture of any size opens at once
+    and only the current frame is held in memory.
+    """
+
+    kind = "replay"
+
+    def __init__(self, path, loop=True):
+        self.path = path
+        self.loop = loop
+        # Each read advances the file; guard it against concurrent pollers
+        self.lock = threading.RLock()
+        try:
+            self.file = open(path, 'r')
+            self.current = self._read_frame()
+        except OSError as e:
+            raise TelemetryError(f"Error reading capture {path}: {e}")
+        if self.current is None:
+            self.file.close()
+            raise TelemetryError(f"Capture {path} contains no frames")
+        self.position = 0
+        # Known once the whole capture has been read through
+        self.frame_count = None
+
+    def _read_frame(self):
+        """Next non-empty frame of the capture, or None at its end"""
+        lines = []
+        for line in self.file:
+            if line.startswith(CAPTURE_FRAME_MARKER):
+                if any(part.strip() for part in lines):
+                    return "".join(lines)
+                lines = []
+            else:
+                lines.append(line)
+        frame = "".join(lines)
+        return frame if frame.strip() else None
+
+    def describe(self):
+        total = self.frame_count if self.frame_count is not None else "?"
+        return f"replay ({os.path.basename(self.path)} {self.position + 1}/{total})"
+
+    def read_text(self):
+        with self.lock:
+            frame = self.current
+            try:
+                upcoming = self._read_frame()
+                if upcoming is None:
+                    self.frame_count = self.position + 1
+                    if self.loop:
+                        self.file.seek(0)
+                        self.position = 0
+                        upcoming = self._read_frame()
+                    else:
+                        upcoming = frame
+                else:
+                    self.position += 1
+            except OSError as e:
+                raise TelemetryError(f"Error reading capture {self.path}: {e}")
+            self.current = upcoming
+            return frame
+
+    def reader(self):
+        """Reads consume frames, so another poller gets its own pass over the capture"""
+        return ReplayTelemetrySource(self.path, self.loop)
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+class SimulatorTelemetrySource(TelemetrySource):
+    """Pure-Python stand-in for avionics_sim.ko
+
+    Runs the scheduler model (scheduler_model.py) against a virtual clock
+    driven by wall time (optionally sped up), and renders the same proc
+    text the module would.  Parameter writes go straight to the model.
+    """
+
+    kind = "sim"
+    writable = True
+
+    SCHEDULER_INTERVAL_MS = SCHEDULER_TICK_MS
+    MAX_EXEC_LOG_ENTRIES = 1000
+    PROC_EXEC_LOG_LINES = 50
+    PROC_BUFFER_LIMIT = 3800
+
+    def __init__(self, task_set=None, runtime_sec=0, speed=1.0, clock=time.monotonic):
+        self.task_set = task_set or DEFAULT_TASK_SET
+        self.runtime_sec = runtime_sec
+        self.speed = speed
+        self.clock = clock
+        # The GUI and a background recorder may share one simulator
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        """Equivalent of reloading the module"""
+        with self.lock:
+            self._reset()
+
+    def _reset(self):
+        self.model = SchedulerModel(self.task_set, self.SCHEDULER_INTERVAL_MS)
+        self.tasks = self.model.tasks
+        self.exec_log = []
+        self.exec_log_count = 0
+        self.now_ms = 0
+        self.scheduler_running = True
+        self.system_finished = False
+        self.started_at = self.clock()
+
+    def describe(self):
+        return f"simulator (x{self.speed:g})"
+
+    def advance_to(self, target_ms):
+        """Run the scheduler model up to target_ms of virtual time"""
+        for execution in self.model.run(target_ms, self.runtime_sec * 1000):
+            # Like the module, stop logging (and counting) once the log is full
+            if self.exec_log_count < self.MAX_EXEC_LOG_ENTRIES:
+                self.exec_log.append(execution)
+                self.exec_log_count += 1
+        if self.model.finished:
+            self.system_finished = True
+            self.scheduler_running = False
+        self.now_ms = max(self.now_ms, min(target_ms, self.model.next_tick_ms))
+
+    def render(self):
+        """Format the model state exactly like proc_read_avionics_status()"""
+        lines = [
+            "AvionicsSystem: Multi-Task Simulator",
+            f"SchedulerStatus: {'RUNNING' if self.scheduler_running else 'STOPPED'}",
+            f"SystemFinished: {'YES' if self.system_finished else 'NO'}",
+            f"ExecutionLogCount: {self.exec_log_count}",
+            f"SystemRuntimeSec: {self.runtime_sec}",
+            f"ActiveTasks: {len(self.tasks)}",
+            "---",
+        ]
+        for i, task in enumerate(self.tasks):
+            if task.last_exec_time < 0:
+                result = "N/A"
+            else:
+                result = "MET" if task.last_exec_time <= task.deadline else "MISSED"
+            status = "EXECUTING" if task.currently_running else ("READY" if task.enabled else "DISABLED")
+            lines += [
+                f"Task{i}_Name: {task.name}",
+                f"Task{i}_Priority: {task.priority}",
+                f"Task{i}_Period: {task.period}",
+                f"Task{i}_Deadline: {task.deadline}",
+                f"Task{i}_Workload: {task.workload}",
+                f"Task{i}_Status: {status}",
+                f"Task{i}_LastExecTime: {max(task.last_exec_time, 0)}",
+                f"Task{i}_LastDeadlineResult: {result}",
+                f"Task{i}_MetCount: {task.met_count}",
+                f"Task{i}_MissedCount: {task.missed_count}",
+                f"Task{i}_TotalExecs: {task.total_execs}",
+                f"Task{i}_Enabled: {'YES' if task.enabled else 'NO'}",
+            ]
+            if i < len(self.tasks) - 1:
+                lines.append("---")
+
+        text = "\n".join(lines) + "\n"
+        if self.exec_log:
+            text += "---\nEXECUTION_LOG:\n"
+            for task_type, start, duration, met in self.exec_log[-self.PROC_EXEC_LOG_LINES:]:
+                if len(text) >= self.PROC_BUFFER_LIMIT:
+                    break
+                text += f"EXEC:{task_type},{start},{duration},{'MET' if met else 'MISSED'}\n"
+        return text
+
+    def read_text(self):
+        with self.lock:
+            elapsed_ms = int((self.clock() - self.started_at) * 1000 * self.speed)
+            self.advance_to(elapsed_ms)
+            return self.render()
+
+    def _find_task(self, task_name, param):
+        if param not in ("period", "deadline", "workload"):
+            raise TelemetryError(f"Unknown parameter {param}")
+        for task in self.tasks:
+            if task.name == task_name:
+                return task
+        raise TelemetryError(f"Unknown task {task_name}")
+
+    def read_param(self, task_name, param):
+        with self.lock:
+            try:
+                return getattr(self._find_task(task_name, param), param)
+            except TelemetryError:
+                return None
+
+    def set_param(self, task_name, param, value):
+        with self.lock:
+            setattr(self._find_task(task_name, param), param, int(value))
+
+    def transaction(self):
+        # A batch lands between two scheduler ticks, never halfway through
+        return self.lock
+
+
+# Backend registry used by create_source() and the command line
+TELEMETRY_SOURCES = {
+    "proc": ProcTelemetrySource,
+    "file": FileTelemetrySource,
+    "replay": ReplayTelemetrySource,
+    "sim": SimulatorTelemetrySource,
+}
+
+
+def create_source(kind="proc", path=None, **options):
+    """Build a telemetry source by name ('proc', 'file', 'replay' or 'sim')"""
+    if kind not in TELEMETRY_SOURCES:
+        raise TelemetryError(f"Unknown telemetry source: {kind}")
+    if kind in ("file", "replay"):
+        if not path:
+            raise TelemetryError(f"The {kind} source needs a path")
+        return TELEMETRY_SOURCES[kind](path, **options)
+    if kind == "proc":
+        return ProcTelemetrySource(path or PROC_FILE_PATH)
+    return SimulatorTelemetrySource(**options)
@@ -0,0 +1,198 @@
+"""Background telemetry I/O.
+
+Every procfs read, sysfs write and module reload runs on one worker
+thread so the Tk main loop never waits on the kernel (the module holds
+its spinlock across mdelay(), so a single read can stall for 30 ms or
+more).  Results travel back through a SimpleQueue that the UI drains
+from an `after` callback; neither side ever blocks on the other.
+"""
+import queue
+import subprocess
+import threading
+import time
+
+from perf import PerfRecorder
+from snapshot import parse_status
+from telemetry import TelemetryError
+
+MODULE_NAME = "avionics_sim"
+MODULE_FILE = "avionics_sim.ko"
+
+
+def reload_kernel_module(runtime_sec=0, settle_sec=1.0):
+    """rmmod and insmod the avionics module with a new system_runtime_sec"""
+    subprocess.run(['sudo', 'rmmod', MODULE_NAME], capture_output=True)
+    time.sleep(settle_sec)
+    result = subprocess.run(['sudo', 'insmod', MODULE_FILE, f'system_runtime_sec={runtime_sec}'],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise TelemetryError(f"Failed to load module: {result.stderr}")
+    return result
+
+
+class AdaptivePoller:
+    """Chooses the delay before the next read from what the last reads showed
+
+    * While ExecutionLogCount grows, poll often enough that the 50-line
+      EXEC window cannot scroll past unseen (at most min_sec apart).
+    * While the scheduler runs but the log is quiet, relax towards base_sec.
+    * Once the scheduler is STOPPED / SystemFinished, or while the window
+      is hidden, drop to idle_sec.
+    """
+
+    # Poll again before this share of the EXEC window has been replaced
+    WINDOW_LINES = 50
+    WINDOW_FRACTION = 0.5
+    BACKOFF = 1.5
+
+    def __init__(self, base_sec=1.0, min_sec=0.1, idle_sec=5.0):
+        self.base_sec = base_sec
+        self.min_sec = min_sec
+        self.idle_sec = idle_sec
+        self.visible = True
+        self.interval = base_sec
+        self.log_rate = 0.0
+        self._last_count = None
+        self._last_time = None
+
+    @property
+    def idle(self):
+        return self.interval >= self.idle_sec
+
+    def observe(self, snapshot, now):
+        """Record a snapshot read at `now` (monotonic seconds); returns the next delay"""
+        try:
+            count = int(snapshot.get('ExecutionLogCount', 0))
+        except ValueError:
+            count = 0
+        if self._last_count is not None and now > self._last_time and count >= self._last_count:
+            self.log_rate = (count - self._last_count) / (now - self._last_time)
+        else:
+            self.log_rate = 0.0
+        self._last_count = count
+        self._last_time = now
+
+        stopped = (snapshot.get('SchedulerStatus') == 'STOPPED'
+                   or snapshot.get('SystemFinished') == 'YES')
+        if stopped or not self.visible:
+            self.interval = self.idle_sec
+        elif self.log_rate > 0:
+            budget = self.WINDOW_LINES * self.WINDOW_FRACTION / self.log_rate
+            self.interval = max(self.min_sec, min(self.base_sec, budget))
+        else:
+            self.interval = min(self.base_sec, max(self.interval, self.min_sec) * self.BACKOFF)
+        return self.interval
+
+    def failed(self):
+        """A read failed (e.g. module not loaded); retry at the base rate"""
+        self.interval = self.idle_sec if not self.visible else self.base_sec
+        return self.interval
+
+
+class TelemetryWorker:
+    """Runs all blocking telemetry I/O on a daemon thread
+
+    The worker reads a snapshot whenever its poller says so (or as soon
+    as refresh() is called) and runs submitted jobs in submission order.
+    Everything it produces is posted to `results` as (kind, payload):
+
+    * ("snapshot", Snapshot) -- a successful read
+    * ("error", exception) -- a failed read
+    * ("done", (callback, result, error)) -- a finished job; the UI
+      thread calls callback(result, error) when it drains the message
+    """
+
+    def __init__(self, source, poller=None, perf=None):
+        self.source = source
+        self.poller = poller or AdaptivePoller()
+        # Times the read and parse stages separately when enabled
+        self.perf = perf or PerfRecorder()
+        self.results = queue.SimpleQueue()
+        self.reads = 0
+        self.last_read_ms = 0.0
+        self._jobs = queue.SimpleQueue()
+        self._refresh_pending = False
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="TelemetryWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def refresh(self):
+        """Read a snapshot as soon as the current job (if any) finishes"""
+        self._refresh_pending = True
+        self._wake.set()
+
+    def submit(self, func, *args, callback=None):
+        """Run func(*args) on the worker thread; callback(result, error) follows via results"""
+        self._jobs.put((func, args, callback))
+        self._wake.set()
+
+    def drain(self, limit=None):
+        """Take up to `limit` pending messages without blocking"""
+        messages = []
+        while limit is None or len(messages) < limit:
+            try:
+                messages.append(self.results.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def _run_jobs(self):
+        while not self._stop.is_set():
+            try:
+                func, args, callback = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self.results.put(("done", (callback, func(*args), None)))
+            except Exception as e:
+                self.results.put(("done", (callback, None, e)))
+
+    def _read(self):
+        """Read one snapshot; returns the delay before the next read"""
+        started = time.perf_counter()
+        try:
+            if self.perf.enabled:
+                with self.perf.stage("read"):
+                    text = self.source.read_text()
+                with self.perf.stage("parse"):
+                    snapshot = parse_status(text)
+            else:
+                snapshot = self.source.snapshot()
+        except Exception as e:
+            self.results.put(("error", e))
+            return self.poller.failed()
+        finally:
+            self.last_read_ms = (time.perf_counter() - started) * 1000
+        self.reads += 1
+        self.results.put(("snapshot", snapshot))
+        return self.poller.observe(snapshot, time.monotonic())
+
+    def _run(self):
+        next_read = time.monotonic()
+        while not self._stop.is_set():
+            self._run_jobs()
+            if self._stop.is_set():
+                break
+            if self._refresh_pending or time.monotonic() >= next_read:
+                self._refresh_pending = False
+                next_read = time.monotonic() + self._read()
+            self._wake.wait(max(0.0, next_read - time.monotonic()))
+            self._wake.clear()
@@ -0,0 +1,136 @@
+"""Checks for execution log recording (python3 -m unittest test_execlog)"""
+import os
+import tempfile
+import unittest
+
+from exec_index import IntervalIndex
+from execlog import (BinaryExecLog, ExecLogRecorder, ExecWindowMerger, create_exec_log_writer,
+                     exec_log_count, read_exec_log)
+from history import MetricHistory
+from metrics_exporter import MetricsCollector
+from telemetry import SimulatorTelemetrySource
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def poll(source, clock, merger, seconds, step=0.5):
+    """Advance the simulator and merge every window; returns the new entries"""
+    recorded = []
+    for _ in range(int(seconds / step)):
+        clock.now += step
+        snapshot = source.snapshot()
+        recorded += merger.merge(snapshot.exec_log, exec_log_count(snapshot))
+    return recorded
+
+
+class ExecWindowMergerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.source = SimulatorTelemetrySource(clock=self.clock)
+        self.merger = ExecWindowMerger()
+
+    def test_overlapping_windows_recorded_once(self):
+        recorded = poll(self.source, self.clock, self.merger, 10)
+        keys = [(entry.start_time, entry.task_type) for entry in recorded]
+        self.assertTrue(recorded)
+        self.assertEqual(len(keys), len(set(keys)))
+
+    def test_recording_continues_across_reset(self):
+        before = poll(self.source, self.clock, self.merger, 10)
+        self.source.reset()
+        after = poll(self.source, self.clock, self.merger, 10)
+        self.assertTrue(before)
+        self.assertTrue(after)
+        self.assertEqual(self.merger.restarts, 1)
+        self.assertLess(after[0].start_time, before[-1].start_time)
+
+    def test_restart_detected_from_window_without_count(self):
+        poll(self.source, self.clock, self.merger, 10)
+        self.source.reset()
+        self.clock.now += 2
+        self.assertTrue(self.merger.merge(self.source.snapshot().exec_log))
+        self.assertEqual(self.merger.restarts, 1)
+
+    def test_history_and_metrics_follow_reset(self):
+        history = MetricHistory()
+        collector = MetricsCollector(self.source)
+        observed = []
+        for _ in range(2):
+            for _ in range(20):
+                self.clock.now += 0.5
+                history.update(self.source.snapshot())
+                collector.refresh()
+            observed.append(sum(histogram.count for histogram in collector.histograms.values()))
+            self.assertGreater(history.task(0).utilization.values()[-1], 0)
+            self.source.reset()
+        self.assertGreater(observed[1], observed[0])
+        self.assertEqual(collector.merger.restarts, 1)
+
+
+class MetricsCollectorTest(unittest.TestCase):
+
+    def test_background_updates_are_not_scrapes(self):
+        clock = FakeClock()
+        collector = MetricsCollector(SimulatorTelemetrySource(clock=clock), cache_sec=0)
+        for _ in range(3):
+            clock.now += 0.5
+            collector.update()
+        self.assertEqual((collector.reads, collector.scrapes), (3, 0))
+        self.assertIn(b"avionics_up 1", collector.page())
+        self.assertEqual((collector.reads, collector.scrapes), (4, 1))
+
+
+class ExecLogRecorderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.source = SimulatorTelemetrySource(clock=self.clock)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def record_two_runs(self, name):
+        recorder = ExecLogRecorder(self.source, os.path.join(self.tmp.name, name))
+        recorder.writer = create_exec_log_writer(recorder.path)
+        runs = [[], []]
+        for run in runs:
+            for _ in range(20):
+                self.clock.now += 0.5
+                run += recorder.poll_once()
+            self.source.reset()
+        recorder.stop()
+        return recorder, runs
+
+    def check_runs(self, recorder, runs, read):
+        self.assertEqual(len(recorder.paths), 2)
+        self.assertEqual(recorder.recorded, sum(len(run) for run in runs))
+        for path, run in zip(recorder.paths, runs):
+            entries = read(path)
+            self.assertEqual(entries, run)
+            # Nothing in a run file collides with anything else in it
+            self.assertEqual(len(IntervalIndex(entries)), len(run))
+
+    def test_restart_starts_a_new_text_log(self):
+        recorder, runs = self.record_two_runs("soak.log")
+        self.check_runs(recorder, runs, lambda path: list(read_exec_log(path)))
+        self.assertTrue(recorder.paths[1].endswith("soak.run2.log"))
+
+    def test_restart_starts_a_new_binary_log(self):
+        recorder, runs = self.record_two_runs("soak.bin")
+
+        def read(path):
+            with BinaryExecLog(path) as exec_log:
+                return list(exec_log)
+        self.check_runs(recorder, runs, read)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Checks for batched parameter updates (python3 -m unittest test_params)"""
+import unittest
+
+from params import MAX_PARAM_MS, apply_params
+from telemetry import TelemetryError, TelemetrySource
+
+
+class FakeParamSource(TelemetrySource):
+    """Parameters in a dict; writes to the keys in `failing` raise TelemetryError"""
+
+    writable = True
+
+    def __init__(self, values, failing=(), failing_values=None):
+        self.values = dict(values)
+        self.failing = set(failing)
+        # Only writes of these exact values fail (e.g. a failing rollback)
+        self.failing_values = failing_values or {}
+        self.writes = []
+
+    def read_param(self, task_name, param):
+        return self.values.get((task_name, param))
+
+    def set_param(self, task_name, param, value):
+        key = (task_name, param)
+        if key in self.failing or self.failing_values.get(key) == value:
+            raise TelemetryError(f"cannot write {param}")
+        self.writes.append((task_name, param, value))
+        self.values[key] = value
+
+
+NAV = "Navigation System"
+CURRENT = {NAV: {'period': 500, 'deadline': 200, 'workload': 120}}
+
+
+def nav_source(**kwargs):
+    return FakeParamSource({(NAV, param): value for param, value in CURRENT[NAV].items()}, **kwargs)
+
+
+class ApplyParamsTest(unittest.TestCase):
+
+    def test_applies_valid_batch(self):
+        source = nav_source()
+        result = apply_params(source, [(NAV, 'workload', '150'), (NAV, 'period', '500')], CURRENT)
+        self.assertTrue(result.ok)
+        self.assertEqual([update.param for update in result.applied], ['workload'])
+        self.assertEqual([update.param for update in result.unchanged], ['period'])
+        self.assertEqual(source.values[(NAV, 'workload')], 150)
+
+    def test_invalid_batch_writes_nothing(self):
+        for updates in ([(NAV, 'workload', 'fast')],
+                        [(NAV, 'workload', str(MAX_PARAM_MS + 1))],
+                        [(NAV, 'deadline', '600')],
+                        [("No Such Task", 'period', '100')],
+                        [(NAV, 'workload', '150'), (NAV, 'workload', '160')]):
+            source = nav_source()
+            result = apply_params(source, updates, CURRENT)
+            self.assertFalse(result.ok, updates)
+            self.assertFalse(result.rolled_back)
+            self.assertEqual(source.writes, [], updates)
+
+    def test_failed_write_rolls_back_earlier_writes(self):
+        source = nav_source(failing={(NAV, 'deadline')})
+        result = apply_params(source, [(NAV, 'workload', '150'), (NAV, 'period', '800'),
+                                       (NAV, 'deadline', '300')], CURRENT)
+        self.assertFalse(result.ok)
+        self.assertTrue(result.rolled_back)
+        self.assertEqual(result.applied, ())
+        self.assertEqual([update.param for update, _ in result.failed], ['deadline'])
+        # Undone newest first, back to the values read before the batch
+        self.assertEqual(source.writes[2:], [(NAV, 'period', 500), (NAV, 'workload', 120)])
+        self.assertEqual(source.values, nav_source().values)
+
+    def test_failed_rollback_is_reported(self):
+        source = nav_source(failing={(NAV, 'deadline')}, failing_values={(NAV, 'workload'): 120})
+        result = apply_params(source, [(NAV, 'workload', '150'), (NAV, 'deadline', '300')], CURRENT)
+        self.assertTrue(result.rolled_back)
+        reasons = dict((update.param, reason) for update, reason in result.failed)
+        self.assertIn("rollback failed", reasons['workload'])
+        self.assertEqual(source.values[(NAV, 'workload')], 150)
+
+    def test_unknown_old_value_is_reported(self):
+        source = nav_source(failing={(NAV, 'deadline')})
+        del source.values[(NAV, 'workload')]
+        result = apply_params(source, [(NAV, 'workload', '150'), (NAV, 'deadline', '300')], CURRENT)
+        reasons = dict((update.param, reason) for update, reason in result.failed)
+        self.assertIn("old value is unknown", reasons['workload'])
+
+    def test_without_rollback_keeps_applied_writes(self):
+        source = nav_source(failing={(NAV, 'deadline')})
+        result = apply_params(source, [(NAV, 'workload', '150'), (NAV, 'deadline', '300')],
+                              CURRENT, rollback=False)
+        self.assertFalse(result.rolled_back)
+        self.assertEqual([update.param for update in result.applied], ['workload'])
+        self.assertEqual(source.values[(NAV, 'workload')], 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""Terminal monitor for the avionics status.
+
+Draws the status as a fixed layout of cells and, on every refresh,
+rewrites only the cells whose text changed, using ANSI cursor
+addressing.  A steady-state frame is a few dozen bytes, so 20 Hz is
+comfortable even on a serial console and costs almost no CPU.
+"""
+import sys
+import time
+
+CSI = "\x1b["
+RESET = CSI + "0m"
+RED = CSI + "31m"
+GREEN = CSI + "32m"
+BOLD = CSI + "1m"
+
+# (header, field, width, align); align '>' for numbers
+TASK_COLUMNS = [
+    ("#", 'TaskNumber', 3, '>'),
+    ("Task", 'Name', 24, '<'),
+    ("Pri", 'Priority', 4, '>'),
+    ("Period", 'Period', 7, '>'),
+    ("Deadline", 'Deadline', 9, '>'),
+    ("Workload", 'Workload', 9, '>'),
+    ("Status", 'Status', 10, '<'),
+    ("Last", 'LastExecTime', 6, '>'),
+    ("Result", 'LastDeadlineResult', 7, '<'),
+    ("Met", 'MetCount', 7, '>'),
+    ("Missed", 'MissedCount', 7, '>'),
+    ("Total", 'TotalExecs', 7, '>'),
+]
+
+RECENT_MISSES = 5
+
+
+class TextScreen:
+    """Cell buffer that only emits the cells changed since the last flush"""
+
+    def __init__(self, out):
+        self.out = out
+        self.cells = {}
+        self.shown = {}
+
+    def put(self, row, col, text, width, align='<', style=""):
+        self.cells[row, col] = (f"{text:{align}{width}}"[:width], style)
+
+    def clear(self):
+        """Forget everything on screen; the next flush redraws it all"""
+        self.cells = {}
+        self.shown = {}
+        self.out.write(CSI + "2J")
+
+    def flush(self):
+        parts = []
+        for (row, col), cell in self.cells.items():
+            if self.shown.get((row, col)) != cell:
+                text, style = cell
+                parts.append(f"{CSI}{row + 1};{col + 1}H{style}{text}{RESET if style else ''}")
+                self.shown[row, col] = cell
+        if parts:
+            self.out.write("".join(parts))
+            self.out.flush()
+        return sum(len(part) for part in parts)
+
+
+class TextMonitor:
+    """Refreshes a TextScreen from a telemetry source at a fixed rate"""
+
+    def __init__(self, source, out=None, rate_hz=20.0):
+        self.source = source
+        self.out = out or sys.stdout
+        self.interval = 1.0 / rate_hz
+        self.rate_hz = rate_hz
+        self.screen = TextScreen(self.out)
+        self.task_count = None
+        self.frames = 0
+        self.bytes_written = 0
+
+    def draw(self, snapshot, read_ms):
+        """Lay out one snapshot; unchanged cells cost nothing"""
+        screen = self.screen
+        if len(snapshot.tasks) != self.task_count:
+            # The layout depends on the number of tasks
+            screen.clear()
+            self.task_count = len(snapshot.tasks)
+            self._draw_static()
+
+        scheduler = snapshot.get('SchedulerStatus', 'UNKNOWN')
+        screen.put(0, 50, self.source.describe(), 40)
+        screen.put(0, 92, time.strftime("%H:%M:%S"), 8)
+        screen.put(1, 11, scheduler, 8, style=GREEN if scheduler == "RUNNING" else RED)
+        screen.put(1, 30, snapshot.get('SystemFinished', '-'), 4)
+        screen.put(1, 46, snapshot.get('ExecutionLogCount', '0'), 7)
+        screen.put(1, 64, f"{snapshot.get('SystemRuntimeSec', '0')} s", 8)
+        screen.put(1, 83, f"{read_ms:5.1f} ms", 9)
+
+        for i, task in enumerate(snapshot.tasks):
+            col = 0
+            for _, field, width, align in TASK_COLUMNS:
+                value = task.get(field, '-')
+                style = ""
+                if field == 'LastDeadlineResult':
+                    style = RED if value == "MISSED" else GREEN if value == "MET" else ""
+                screen.put(4 + i, col, value, width, align, style)
+                col += width + 1
+
+        misses = [entry for entry in snapshot.exec_log if not entry.deadline_met][-RECENT_MISSES:]
+        base = 5 + self.task_count + 1
+        for i in range(RECENT_MISSES):
+            if i < len(misses):
+                entry = misses[-1 - i]
+                task = snapshot.task(entry.task_type)
+                name = task.get('Name', f"Task {entry.task_type}") if task else f"Task {entry.task_type}"
+                text = f"  t={entry.start_time} ms  {name}: ran {entry.duration} ms"
+            else:
+                text = ""
+            screen.put(base + i, 0, text, 80, style=RED if text else "")
+        self.bytes_written += screen.flush()
+        self.frames += 1
+
+    def _draw_static(self):
+        screen = self.screen
+        screen.put(0, 0, "Avionics Multi-Task Monitor", 30, style=BOLD)
+        screen.put(1, 0, "Scheduler:", 10)
+        screen.put(1, 20, "Finished:", 9)
+        screen.put(1, 35, "Exec log:", 10)
+        screen.put(1, 55, "Runtime:", 8)
+        screen.put(1, 74, "Read:", 8)
+        col = 0
+        for header, _, width, align in TASK_COLUMNS:
+            screen.put(3, col, header, width, align, BOLD)
+            col += width + 1
+        screen.put(5 + self.task_count, 0, "Recent deadline misses (Ctrl+C to quit):", 40, style=BOLD)
+
+    def show_error(self, message):
+        self.screen.put(2, 0, message, 80, style=RED)
+        self.bytes_written += self.screen.flush()
+
+    def run(self, frames=None):
+        """Refresh until Ctrl+C (or for `frames` refreshes)"""
+        self.out.write(CSI + "?25l")  # hide the cursor
+        next_frame = time.monotonic()
+        try:
+            while frames is None or self.frames < frames:
+                started = time.perf_counter()
+                try:
+                    snapshot = self.source.snapshot()
+                except Exception as e:
+                    self.show_error(f"Error: {e}")
+                    self.frames += 1
+                else:
+                    self.screen.put(2, 0, "", 80)
+                    self.draw(snapshot, (time.perf_counter() - started) * 1000)
+                next_frame += self.interval
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Fell behind (slow read): don't try to catch up with a burst
+                    next_frame = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            rows = 5 + (self.task_count or 0) + 1 + RECENT_MISSES
+            self.out.write(f"{CSI}{rows + 1};1H{CSI}?25h\n")
+            self.out.flush()